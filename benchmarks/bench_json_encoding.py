@@ -0,0 +1,95 @@
+"""
+Benchmark the JSON encoding of tool results posted to /sse.
+
+Usage:
+    python benchmarks/bench_json_encoding.py [--repeat N] [--parts N]
+
+Renders the latest version of every prompt template and compares encoding the
+results with serialize_content() and JSONResponse to encode_content() with the
+standard json module and, if installed, orjson.
+"""
+
+import argparse
+import time
+
+import mcp.types as types
+from starlette.responses import JSONResponse
+
+from mcp_hitchcode import json_encoding
+from mcp_hitchcode.json_encoding import configure_json_encoder, encode_content
+from mcp_hitchcode.server import serialize_content
+from mcp_hitchcode.templates.template_loader import (
+    _build_version_registry,
+    _version_registry,
+    render_prompt_template,
+)
+
+# Arguments passed to every template, mimicking a typical request
+ARGUMENTS = {
+    "objective": "Add a caching layer to the HTTP client " * 20,
+    "specific_instructions": "Keep the public API stable. " * 20,
+    "issue": "Requests time out under load " * 20,
+}
+
+
+def _rendered_prompts(parts: int) -> list[list[types.TextContent]]:
+    """Render every prompt template, split into the given number of parts."""
+    _build_version_registry()
+    results = []
+    for name in sorted(_version_registry):
+        text = render_prompt_template(name, **ARGUMENTS)
+        size = max(1, len(text) // parts)
+        results.append(
+            [
+                types.TextContent(type="text", text=text[i : i + size])
+                for i in range(0, len(text), size)
+            ]
+        )
+    return results
+
+
+def _time(encode, results, repeat: int) -> float:
+    """Return the best time of encoding all results in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for result in results:
+            encode(result)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--parts", type=int, default=1)
+    args = parser.parse_args()
+
+    results = _rendered_prompts(args.parts)
+    total = sum(len(part.text) for result in results for part in result)
+    print(f"{len(results)} rendered prompts, {total} characters")
+
+    def baseline(result):
+        return JSONResponse({"result": serialize_content(result)}).body
+
+    def direct(result):
+        return b'{"result":' + encode_content(result) + b"}"
+
+    timings = {
+        "serialize_content + JSONResponse": _time(baseline, results, args.repeat)
+    }
+    encoders = ["json"] + (["orjson"] if json_encoding.orjson is not None else [])
+    for encoder in encoders:
+        configure_json_encoder(encoder)
+        timings[f"encode_content ({encoder})"] = _time(direct, results, args.repeat)
+    configure_json_encoder()
+
+    reference = timings["serialize_content + JSONResponse"]
+    for label, timing in timings.items():
+        print(f"{label:<36} {timing:>8.3f}ms  {reference / timing:>5.2f}x")
+    if json_encoding.orjson is None:
+        print("orjson is not installed; pip install orjson to compare it")
+
+
+if __name__ == "__main__":
+    main()
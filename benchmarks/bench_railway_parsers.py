@@ -0,0 +1,68 @@
+"""
+Benchmark the HTML parser backends of the Railway CLI docs extraction.
+
+Usage:
+    python benchmarks/bench_railway_parsers.py [PAGE.html ...] [--repeat N]
+
+Without pages, the saved page in tests/fixtures/railway_cli.html is used.
+Save real pages with e.g. `curl -o cli.html https://docs.railway.app/guides/cli`.
+"""
+
+import argparse
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+from mcp_hitchcode.railway_docs import PARSER_BACKENDS, extract_railway_commands
+
+DEFAULT_PAGE = Path(__file__).parent.parent / "tests" / "fixtures" / "railway_cli.html"
+
+
+def _available_backends():
+    """List the backends whose parser is installed."""
+    return [
+        backend
+        for backend in PARSER_BACKENDS
+        if backend != "lxml" or importlib.util.find_spec("lxml") is not None
+    ]
+
+
+def _time(page: str, backend: str, repeat: int) -> float:
+    """Return the best time of one extraction in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract_railway_commands(page, backend=backend)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pages", nargs="*", type=Path, default=[DEFAULT_PAGE])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    backends = _available_backends()
+    print(f"{'page':<32} {'bytes':>9} " + " ".join(f"{b:>12}" for b in backends))
+
+    mismatches = 0
+    for path in args.pages:
+        page = path.read_text(encoding="utf-8", errors="replace")
+        outputs = {b: extract_railway_commands(page, backend=b) for b in backends}
+        if len(set(outputs.values())) > 1:
+            mismatches += 1
+            print(f"{path.name}: backends produce different output", file=sys.stderr)
+
+        timings = [_time(page, b, args.repeat) for b in backends]
+        print(
+            f"{path.name:<32} {len(page):>9} "
+            + " ".join(f"{t:>10.2f}ms" for t in timings)
+        )
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,442 @@
+"""
+Benchmark suite for MCP Simple Tool.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--output FILE] [--quick] [--only TEXT]
+        [--skip-e2e] [--compare BASELINE] [--threshold RATIO]
+
+Measures the template layer and the tool dispatch paths:
+- render_cold / render_warm: render_prompt_template for every template under
+  templates/prompts/, with the compiled template dropped before each cold run
+- resolve_fallback / resolve_memo: resolving versions that need a fallback,
+  without and with the memoized lookups
+- list_tools / call_tool: the MCP request handlers of the server
+- startup: importing the server in a new interpreter, as a stdio session does,
+  timed from outside and with python -X importtime
+- e2e_stdio / e2e_sse: calls from an MCP client to a server subprocess, and
+  single-call POSTs to /sse
+
+Results are written as JSON (timings in microseconds) together with the git
+commit. With --compare, the medians are compared to a previous result file and
+the script exits with status 1 if any benchmark got slower than --threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import anyio
+import httpx
+import mcp.types as types
+from packaging import version
+
+from mcp_hitchcode.server import create_server
+from mcp_hitchcode.templates import template_loader
+from mcp_hitchcode.templates.template_loader import (
+    clear_compiled_template_cache,
+    render_prompt_template,
+    resolve_template_version,
+)
+
+Stats = Dict[str, float]
+
+# Variables passed to every template, mimicking a typical tool call
+ARGUMENTS = {
+    "objective": "Add a caching layer to the HTTP client",
+    "specific_instructions": "Keep the public API stable.",
+    "issue": "Requests time out under load",
+}
+
+# Tool calls measured through the request handlers and end to end
+TOOL_CALLS = {
+    "mood": {"question": "How are you?"},
+    "apply_prompt_fix": {"issue": "Requests time out under load"},
+    "apply_prompt_docker": {"containerization_objective": "Ship the API"},
+}
+
+
+def _stats(samples: List[float]) -> Stats:
+    """
+    Summarize timing samples.
+
+    Args:
+        samples: The durations in seconds.
+
+    Returns:
+        Stats: Iterations and min/median/mean/p95/max in microseconds.
+    """
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        "iterations": len(ordered),
+        "min_us": ordered[0] * 1e6,
+        "median_us": statistics.median(ordered) * 1e6,
+        "mean_us": statistics.fmean(ordered) * 1e6,
+        "p95_us": p95 * 1e6,
+        "max_us": ordered[-1] * 1e6,
+    }
+
+
+def measure(
+    fn: Callable[[], Any],
+    iterations: int,
+    setup: Optional[Callable[[], Any]] = None,
+    warmup: int = 3,
+) -> Stats:
+    """
+    Time a function.
+
+    Args:
+        fn: The function to time.
+        iterations: The number of timed calls.
+        setup: Optional function called untimed before each call.
+        warmup: The number of untimed calls before timing.
+
+    Returns:
+        Stats: The timing statistics.
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fn()
+
+    samples = []
+    for _ in range(iterations):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return _stats(samples)
+
+
+async def measure_async(
+    fn: Callable[[], Awaitable[Any]], iterations: int, warmup: int = 3
+) -> Stats:
+    """
+    Time a coroutine function.
+
+    Args:
+        fn: The coroutine function to time.
+        iterations: The number of timed calls.
+        warmup: The number of untimed calls before timing.
+
+    Returns:
+        Stats: The timing statistics.
+    """
+    for _ in range(warmup):
+        await fn()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    return _stats(samples)
+
+
+def _template_names() -> List[str]:
+    """Get the names of all prompt templates."""
+    template_loader._build_version_registry()
+    return sorted(template_loader._version_registry)
+
+
+def bench_rendering(iterations: int) -> Dict[str, Stats]:
+    """Benchmark cold and warm renders of every template."""
+    results = {}
+    for name in _template_names():
+
+        def render(name: str = name) -> str:
+            return render_prompt_template(name, **ARGUMENTS)
+
+        def drop(name: str = name) -> None:
+            clear_compiled_template_cache(name)
+
+        results[f"render_cold[{name}]"] = measure(render, iterations, setup=drop)
+        results[f"render_warm[{name}]"] = measure(render, iterations * 10)
+    return results
+
+
+def _fallback_versions(name: str) -> List[str]:
+    """Get requested versions of a template that are not available exactly."""
+    available = template_loader._sorted_version_strs.get(name, [])
+    requested = ["0.0.1", "99.0.0"]
+    for available_version in available:
+        major, minor, patch = (version.parse(available_version).release + (0, 0))[:3]
+        requested.append(f"{major}.{minor}.{patch + 1}")
+    return [v for v in requested if v not in available]
+
+
+def bench_resolution(iterations: int) -> Dict[str, Stats]:
+    """Benchmark version fallback resolution without and with memoization."""
+    requests = [
+        (name, requested)
+        for name in _template_names()
+        for requested in _fallback_versions(name)
+    ]
+
+    def resolve_all() -> None:
+        for name, requested in requests:
+            resolve_template_version(name, requested)
+
+    results = {
+        "resolve_fallback": measure(
+            resolve_all, iterations, setup=template_loader._resolved_versions.clear
+        ),
+        "resolve_memo": measure(resolve_all, iterations),
+    }
+    for stats in results.values():
+        stats["lookups"] = len(requests)
+    return results
+
+
+def bench_dispatch(iterations: int) -> Dict[str, Stats]:
+    """Benchmark the list_tools and call_tool request handlers."""
+    server = create_server()
+    list_handler = server.request_handlers[types.ListToolsRequest]
+    call_handler = server.request_handlers[types.CallToolRequest]
+
+    async def run() -> Dict[str, Stats]:
+        list_request = types.ListToolsRequest(method="tools/list")
+        results = {
+            "list_tools": await measure_async(
+                lambda: list_handler(list_request), iterations * 10
+            )
+        }
+        for tool, arguments in TOOL_CALLS.items():
+            request = types.CallToolRequest(
+                method="tools/call",
+                params=types.CallToolRequestParams(name=tool, arguments=arguments),
+            )
+            results[f"call_tool[{tool}]"] = await measure_async(
+                lambda request=request: call_handler(request), iterations
+            )
+        return results
+
+    return anyio.run(run)
+
+
+async def _bench_session(prefix: str, session, iterations: int) -> Dict[str, Stats]:
+    """Benchmark tool calls over an initialized MCP client session."""
+    results = {
+        f"{prefix}[list_tools]": await measure_async(session.list_tools, iterations)
+    }
+    for tool, arguments in TOOL_CALLS.items():
+        results[f"{prefix}[{tool}]"] = await measure_async(
+            lambda tool=tool, arguments=arguments: session.call_tool(tool, arguments),
+            iterations,
+        )
+    return results
+
+
+def _import_time_us(module: str) -> float:
+    """Import a module in a new interpreter and get its cumulative import time."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return float(fields[1])
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def bench_startup(iterations: int) -> Dict[str, Stats]:
+    """Benchmark importing the server in a new interpreter."""
+    runs = max(5, iterations // 10)
+
+    def start() -> None:
+        subprocess.run(
+            [sys.executable, "-c", "import mcp_hitchcode.server"], check=True
+        )
+
+    import_times = [_import_time_us("mcp_hitchcode.server") / 1e6 for _ in range(runs)]
+    return {
+        "startup[process]": measure(start, runs, warmup=1),
+        "startup[import_server]": _stats(import_times),
+    }
+
+
+def bench_stdio(iterations: int) -> Dict[str, Stats]:
+    """Benchmark calls to a server subprocess over stdio."""
+    from mcp.client.session import ClientSession
+    from mcp.client.stdio import StdioServerParameters, stdio_client
+
+    async def run() -> Dict[str, Stats]:
+        parameters = StdioServerParameters(
+            command=sys.executable, args=["-m", "mcp_hitchcode"]
+        )
+        async with stdio_client(parameters) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                return await _bench_session("e2e_stdio", session, iterations)
+
+    return anyio.run(run)
+
+
+def _free_port() -> int:
+    """Find a free TCP port on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def bench_sse(iterations: int) -> Dict[str, Stats]:
+    """Benchmark calls to a server subprocess over SSE and POST /sse."""
+    from mcp.client.session import ClientSession
+    from mcp.client.sse import sse_client
+
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    process = subprocess.Popen(
+        [sys.executable, "-m", "mcp_hitchcode", "--transport", "sse"]
+        + ["--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    async def run() -> Dict[str, Stats]:
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            for _ in range(100):
+                try:
+                    await client.get("/metrics")
+                    break
+                except httpx.TransportError:
+                    await anyio.sleep(0.1)
+
+            results = {}
+            for tool, arguments in TOOL_CALLS.items():
+                body = {"tool": tool, "arguments": arguments}
+                results[f"e2e_post[{tool}]"] = await measure_async(
+                    lambda body=body: client.post("/sse", json=body), iterations
+                )
+
+        async with sse_client(f"{base_url}/sse") as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                results.update(await _bench_session("e2e_sse", session, iterations))
+        return results
+
+    try:
+        return anyio.run(run)
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def _metadata() -> Dict[str, Any]:
+    """Describe the environment of the run."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit or None,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def compare(
+    results: Dict[str, Stats], baseline: Dict[str, Stats], threshold: float
+) -> List[str]:
+    """
+    Compare the medians of two runs.
+
+    Args:
+        results: The current results.
+        baseline: The results to compare to.
+        threshold: The ratio of medians above which a benchmark regressed.
+
+    Returns:
+        List[str]: The names of the benchmarks that regressed.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<48} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["median_us"]
+        after = stats["median_us"]
+        ratio = after / before if before else float("inf")
+        marker = "  REGRESSION" if ratio > threshold else ""
+        print(f"{name:<48} {before:>10.1f}us {after:>10.1f}us {ratio:>6.2f}x{marker}")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="File to write the JSON results to")
+    parser.add_argument("--quick", action="store_true", help="Fewer iterations")
+    parser.add_argument("--only", help="Run only benchmarks whose name contains this")
+    parser.add_argument(
+        "--skip-e2e", action="store_true", help="Skip the stdio and SSE benchmarks"
+    )
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Median ratio above which a benchmark counts as a regression",
+    )
+    args = parser.parse_args()
+
+    iterations = 20 if args.quick else 100
+    suites: Dict[str, Callable[[int], Dict[str, Stats]]] = {
+        "render": bench_rendering,
+        "resolve": bench_resolution,
+        "dispatch": bench_dispatch,
+        "startup": bench_startup,
+    }
+    if not args.skip_e2e:
+        suites["e2e_stdio"] = bench_stdio
+        suites["e2e_sse"] = bench_sse
+
+    results: Dict[str, Stats] = {}
+    for suite, bench in suites.items():
+        print(f"Running {suite}...", file=sys.stderr)
+        for name, stats in bench(iterations).items():
+            if args.only is None or args.only in name:
+                results[name] = stats
+
+    print(f"{'benchmark':<48} {'median':>12} {'p95':>12}")
+    for name, stats in results.items():
+        print(f"{name:<48} {stats['median_us']:>10.1f}us {stats['p95_us']:>10.1f}us")
+
+    report = {"metadata": _metadata(), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+"""
+Bounded caches for MCP Simple Tool.
+
+This module provides the in-memory cache used by the template loaders and the
+rendered prompt cache: an LRU cache bounded by its number of entries and/or
+the memory used by its values, with optional expiry and hit/miss statistics.
+
+Caches register under a name, so that all of them can be inspected and
+cleared in one place.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Caches by name, see register_cache
+_caches: Dict[str, "BoundedCache"] = {}
+
+# Guards _caches
+_caches_lock = threading.Lock()
+
+
+class BoundedCache(Generic[K, V]):
+    """
+    Thread-safe LRU cache bounded by entry count and/or value size.
+
+    None is not a valid value, as get() returns None for missing keys.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+    ) -> None:
+        """
+        Create a cache.
+
+        Args:
+            max_entries: Optional maximum number of entries.
+            max_bytes: Optional maximum total size of the values in bytes.
+            ttl: Optional number of seconds after which an entry expires.
+            sizeof: Measures the size of a value in bytes.
+
+        Raises:
+            ValueError: If a bound is smaller than 1 or ttl is not positive.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"Cache size must be at least 1, got {max_entries}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"Cache size must be at least 1 byte, got {max_bytes}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"Cache TTL must be positive, got {ttl}")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        # Entries in LRU order: key -> (value, size, expiry time or 0)
+        self._entries: "OrderedDict[K, Tuple[V, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get a cached value.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Optional[V]: The value, or None if it is not cached or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            value, size, expires_at = entry
+            if expires_at and expires_at <= time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def put(self, key: K, value: V) -> bool:
+        """
+        Cache a value, evicting the least recently used entries over the bounds.
+
+        Values larger than max_bytes are not cached.
+
+        Args:
+            key: The cache key.
+            value: The value.
+
+        Returns:
+            bool: Whether the value was cached.
+        """
+        size = self._sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+            self._evict()
+        return True
+
+    def pop(self, key: K) -> Optional[V]:
+        """
+        Remove a value.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Optional[V]: The removed value, or None if it was not cached.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self._bytes -= entry[1]
+            return entry[0]
+
+    def invalidate(self, match: Optional[Callable[[K], bool]] = None) -> int:
+        """
+        Remove the entries whose key matches, or all entries.
+
+        Args:
+            match: Optional predicate on the keys to remove. Without it the
+                whole cache is cleared.
+
+        Returns:
+            int: The number of entries that were removed.
+        """
+        with self._lock:
+            if match is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return removed
+
+            keys = [key for key in self._entries if match(key)]
+            for key in keys:
+                self._bytes -= self._entries.pop(key)[1]
+            return len(keys)
+
+    def clear(self) -> int:
+        """
+        Remove all entries.
+
+        Returns:
+            int: The number of entries that were removed.
+        """
+        return self.invalidate()
+
+    def reset_stats(self) -> None:
+        """
+        Reset the hit, miss, eviction and expiration counts.
+        """
+        with self._lock:
+            for counter in self._stats:
+                self._stats[counter] = 0
+
+    def resize(
+        self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        """
+        Change the bounds, evicting entries over the new bounds.
+
+        Args:
+            max_entries: The new maximum number of entries, or None for no limit.
+            max_bytes: The new maximum total size in bytes, or None for no limit.
+
+        Raises:
+            ValueError: If a bound is smaller than 1.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"Cache size must be at least 1, got {max_entries}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"Cache size must be at least 1 byte, got {max_bytes}")
+
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently used entries until the cache is within bounds.
+
+        Must be called with the lock held.
+        """
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._stats["evictions"] += 1
+
+    def keys(self) -> List[K]:
+        """
+        Get the cached keys.
+
+        Returns:
+            List[K]: The keys, least recently used first.
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def info(self) -> Dict[str, Optional[int]]:
+        """
+        Get statistics for the cache.
+
+        Returns:
+            Dict[str, Optional[int]]: The hit, miss, eviction and expiration
+            counts, the number of entries, the bytes used and the bounds.
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore[call-overload]
+            return entry is not None and not (entry[2] and entry[2] <= time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def register_cache(name: str, cache: BoundedCache) -> BoundedCache:
+    """
+    Register a cache under a name, replacing a cache registered before.
+
+    Args:
+        name: The name of the cache, e.g. "docker_file".
+        cache: The cache.
+
+    Returns:
+        BoundedCache: The cache.
+    """
+    with _caches_lock:
+        _caches[name] = cache
+    return cache
+
+
+def unregister_cache(name: str) -> None:
+    """
+    Remove a cache from the registry.
+
+    Args:
+        name: The name of the cache.
+    """
+    with _caches_lock:
+        _caches.pop(name, None)
+
+
+def get_cache_info() -> Dict[str, Dict[str, Optional[int]]]:
+    """
+    Get the statistics of all registered caches.
+
+    Returns:
+        Dict[str, Dict[str, Optional[int]]]: The info() of each cache by name.
+    """
+    with _caches_lock:
+        caches = list(_caches.items())
+    return {name: cache.info() for name, cache in caches}
+
+
+def clear_caches(name: Optional[str] = None) -> int:
+    """
+    Clear registered caches.
+
+    Args:
+        name: Optional name of the cache to clear. Without it all registered
+            caches are cleared.
+
+    Returns:
+        int: The number of entries that were removed.
+    """
+    with _caches_lock:
+        caches = [c for n, c in _caches.items() if name is None or n == name]
+    return sum(cache.clear() for cache in caches)
@@ -0,0 +1,52 @@
+"""
+Cache files for MCP Simple Tool.
+
+This module provides the file helpers shared by the disk tiers of the caches:
+the path of the files kept for a URL and atomic file writes. Several server
+processes may share a cache directory, so files are written to a temporary
+file first and then moved into place; readers never see a partial file.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Union
+
+
+def cache_path(directory: str, url: str) -> str:
+    """
+    Get the base path of the cache files for a URL.
+
+    Args:
+        directory: The cache directory.
+        url: The URL.
+
+    Returns:
+        str: The path without extension.
+    """
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return os.path.join(directory, digest)
+
+
+def write_file(path: str, data: Union[str, bytes]) -> None:
+    """
+    Write a file atomically.
+
+    Args:
+        path: The path of the file.
+        data: The content, written in binary mode if it is bytes.
+
+    Raises:
+        OSError: If the file could not be written.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb" if isinstance(data, bytes) else "w") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,318 @@
+"""
+Content extraction for MCP Simple Tool.
+
+This module turns fetched HTML pages into compact text or markdown: headings,
+paragraphs, lists and code blocks are kept, while markup, scripts, styles and
+other invisible elements are dropped. The extraction is a single streaming pass
+over the markup, so it can be fed chunks while the page is still downloading.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+# Output formats of the extractor
+EXTRACT_FORMATS = ("text", "markdown")
+
+# Elements whose content is not shown or not part of the page content
+_SKIPPED_ELEMENTS = {
+    "head",
+    "nav",
+    "script",
+    "style",
+    "template",
+    "noscript",
+    "svg",
+    "iframe",
+    "canvas",
+    "object",
+}
+
+# Elements that start and end a block of text
+_BLOCK_ELEMENTS = {
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "body",
+    "dd",
+    "details",
+    "div",
+    "dl",
+    "dt",
+    "fieldset",
+    "figcaption",
+    "figure",
+    "footer",
+    "form",
+    "header",
+    "hr",
+    "html",
+    "main",
+    "p",
+    "section",
+    "summary",
+    "table",
+    "tbody",
+    "thead",
+    "tfoot",
+    "tr",
+}
+
+_HEADINGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+_LISTS = ("ul", "ol")
+
+# Elements that never have content or an end tag
+_VOID_ELEMENTS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "param",
+    "source",
+    "track",
+    "wbr",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class ContentExtractor(HTMLParser):
+    """
+    Single-pass extractor of the readable content of an HTML page.
+
+    Feed it the markup in one piece or in chunks. drain() returns the blocks
+    completed so far, result() finishes parsing and returns the whole output.
+    """
+
+    def __init__(self, output_format: str = "markdown") -> None:
+        """
+        Create an extractor.
+
+        Args:
+            output_format: "markdown" for markdown headings, lists and fenced
+                code blocks, or "text" for plain text.
+
+        Raises:
+            ValueError: If the output format is unknown.
+        """
+        if output_format not in EXTRACT_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
+
+        super().__init__(convert_charrefs=True)
+        self._markdown = output_format == "markdown"
+        # Output pieces, and how many of them were returned by drain()
+        self._output: List[str] = []
+        self._drained = 0
+        # Kind of the last emitted block ("block", "item" or "list" after the
+        # last item of a list), None before the first
+        self._last_kind: Optional[str] = None
+        # Inline text of the current block and the prefix it is emitted with
+        self._inline: List[str] = []
+        self._prefix = ""
+        self._kind = "block"
+        # Stack of open skipped elements
+        self._skipped: List[str] = []
+        # Open lists: [tag, number of the next item]
+        self._lists: List[List] = []
+        # Text of the open pre element and its language, None outside of pre
+        self._pre: Optional[List[str]] = None
+        self._pre_depth = 0
+        self._pre_language = ""
+
+    def drain(self) -> str:
+        """
+        Get the output completed since the last call.
+
+        Returns:
+            str: The newly completed output.
+        """
+        text = "".join(self._output[self._drained :])
+        self._drained = len(self._output)
+        return text
+
+    def result(self) -> str:
+        """
+        Finish parsing and get the whole output.
+
+        Returns:
+            str: The extracted text or markdown.
+        """
+        self.close()
+        return "".join(self._output)
+
+    def close(self) -> None:
+        super().close()
+        if self._pre is not None:
+            self._pre_depth = 1
+            self._end_pre()
+        self._flush()
+
+    def _emit(self, text: str, kind: str = "block") -> None:
+        """
+        Append a completed block to the output.
+
+        Consecutive list items are separated by a line break, all other
+        blocks by an empty line.
+
+        Args:
+            text: The block.
+            kind: "item" for list items, "block" otherwise.
+        """
+        if self._last_kind is not None:
+            both_items = kind == "item" and self._last_kind == "item"
+            self._output.append("\n" if both_items else "\n\n")
+        self._output.append(text)
+        self._last_kind = kind
+
+    def _flush(self) -> None:
+        """
+        Emit the inline text collected for the current block.
+
+        Without text the prefix is kept, so that in <li><p>item</p></li> the
+        paragraph is emitted as the list item.
+        """
+        text = _WHITESPACE.sub(" ", "".join(self._inline)).strip()
+        self._inline = []
+        if text:
+            self._emit(self._prefix + text, self._kind)
+            self._prefix = ""
+            self._kind = "block"
+
+    def _end_block(self) -> None:
+        """
+        Emit the current heading or list item and drop its prefix.
+        """
+        self._flush()
+        self._prefix = ""
+        self._kind = "block"
+
+    def _end_pre(self) -> None:
+        """
+        Close a pre element and emit its text as a code block.
+        """
+        self._pre_depth -= 1
+        if self._pre_depth or self._pre is None:
+            return
+        code = "".join(self._pre).strip("\n")
+        self._pre = None
+        if code.strip():
+            if self._markdown:
+                code = f"```{self._pre_language}\n{code}\n```"
+            self._emit(code)
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if self._skipped:
+            if tag not in _VOID_ELEMENTS:
+                self._skipped.append(tag)
+            return
+        if tag in _SKIPPED_ELEMENTS:
+            self._skipped.append(tag)
+            return
+
+        if self._pre is not None:
+            if tag == "pre":
+                self._pre_depth += 1
+            elif tag == "br":
+                self._pre.append("\n")
+            elif tag == "code" and not self._pre:
+                # <pre><code class="language-python"> names the language
+                for name in (dict(attrs).get("class") or "").split():
+                    if name.startswith("language-"):
+                        self._pre_language = name[len("language-") :]
+            return
+
+        if tag == "pre":
+            self._flush()
+            self._pre = []
+            self._pre_depth = 1
+            self._pre_language = ""
+        elif tag in _HEADINGS:
+            self._end_block()
+            if self._markdown:
+                self._prefix = "#" * _HEADINGS[tag] + " "
+        elif tag in _LISTS:
+            self._end_block()
+            self._lists.append([tag, 1])
+        elif tag == "li":
+            self._end_block()
+            self._kind = "item"
+            indent = "  " * max(len(self._lists) - 1, 0)
+            if self._lists and self._lists[-1][0] == "ol":
+                self._prefix = f"{indent}{self._lists[-1][1]}. "
+                self._lists[-1][1] += 1
+            else:
+                self._prefix = f"{indent}- "
+        elif tag in _BLOCK_ELEMENTS or tag == "br":
+            self._flush()
+        elif tag in ("td", "th"):
+            self._inline.append(" ")
+        elif tag == "code" and self._markdown:
+            self._inline.append("`")
+
+    def handle_startendtag(
+        self, tag: str, attrs: List[Tuple[str, Optional[str]]]
+    ) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._skipped:
+            # Close everything up to the most recent skipped element with this name
+            if tag in self._skipped:
+                while self._skipped.pop() != tag:
+                    pass
+            return
+
+        if self._pre is not None:
+            if tag == "pre":
+                self._end_pre()
+            return
+
+        if tag in _HEADINGS or tag == "li":
+            self._end_block()
+        elif tag in _BLOCK_ELEMENTS:
+            self._flush()
+        elif tag in _LISTS:
+            self._end_block()
+            if self._lists:
+                self._lists.pop()
+            if not self._lists and self._last_kind == "item":
+                # Separate the list from a list that follows it
+                self._last_kind = "list"
+        elif tag == "code" and self._markdown:
+            self._inline.append("`")
+
+    def handle_data(self, data: str) -> None:
+        if self._skipped:
+            return
+        if self._pre is not None:
+            self._pre.append(data)
+        else:
+            self._inline.append(data)
+
+
+def extract_content(page: str, output_format: str = "markdown") -> str:
+    """
+    Extract the readable content of an HTML page.
+
+    Args:
+        page: The HTML page.
+        output_format: "markdown" or "text".
+
+    Returns:
+        str: The extracted text or markdown.
+
+    Raises:
+        ValueError: If the output format is unknown.
+    """
+    extractor = ContentExtractor(output_format)
+    extractor.feed(page)
+    return extractor.result()
@@ -0,0 +1,545 @@
+"""
+Railway docs cache for MCP Simple Tool.
+
+The Railway docs tools fetch pages that rarely change. This module keeps the
+last good copy of each page and the text extracted from it, in memory and
+optionally on disk, so that:
+
+- copies younger than the TTL are served without a request,
+- stale copies are served immediately while a background task refetches them
+  (inside docs_refresh_lifespan, otherwise they are refetched before returning),
+- a failed refetch keeps the last good copy, and in offline mode the network
+  is only used for pages that were never fetched.
+
+Pages are stored by URL and content hash. Extracted text is kept with the
+content hash it was extracted from, so a refetched page whose content did not
+change is not parsed again. With a disk tier, the module-level functions read
+and write the cache on worker threads.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import anyio
+from anyio import to_thread
+from anyio.abc import TaskGroup
+
+from mcp_hitchcode.bounded_cache import BoundedCache
+from mcp_hitchcode.cache_files import cache_path, write_file
+from mcp_hitchcode.single_flight import SingleFlight
+
+# Fetches a page, returning its text and whether it was truncated
+DocsFetcher = Callable[[str], Awaitable[Tuple[str, bool]]]
+
+T = TypeVar("T")
+
+
+class DocsEntry:
+    """
+    A fetched docs page together with the text extracted from it.
+    """
+
+    __slots__ = ("url", "text", "content_hash", "fetched_at", "truncated", "extracted")
+
+    def __init__(
+        self,
+        url: str,
+        text: str,
+        fetched_at: Optional[float] = None,
+        truncated: bool = False,
+        extracted: Optional[Dict[str, Optional[str]]] = None,
+    ) -> None:
+        """
+        Create an entry.
+
+        Args:
+            url: The URL of the page.
+            text: The page text.
+            fetched_at: Optional time the page was fetched. Defaults to now.
+            truncated: Whether the page was cut off at the download budget.
+            extracted: Optional extracted text by extractor name.
+        """
+        self.url = url
+        self.text = text
+        self.content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+        self.truncated = truncated
+        # Extracted text by extractor name (None if nothing was found)
+        self.extracted: Dict[str, Optional[str]] = dict(extracted or {})
+
+    def is_fresh(self, ttl: float) -> bool:
+        """
+        Check whether the page can be served without refetching it.
+
+        Args:
+            ttl: The number of seconds a page stays fresh.
+
+        Returns:
+            bool: True if the page was fetched less than ttl seconds ago.
+        """
+        return time.time() - self.fetched_at < ttl
+
+
+class DocsCache:
+    """
+    Cache of docs pages with an optional on-disk tier.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 24 * 60 * 60,
+        directory: Optional[str] = None,
+        max_entries: int = 64,
+    ) -> None:
+        """
+        Create a docs cache.
+
+        Args:
+            ttl: The number of seconds a page stays fresh.
+            directory: Optional directory for keeping pages across restarts.
+            max_entries: The maximum number of pages kept in memory.
+
+        Raises:
+            ValueError: If ttl is not positive.
+        """
+        if ttl <= 0:
+            raise ValueError(f"Docs cache TTL must be positive, got {ttl}")
+
+        self.ttl = ttl
+        self.directory = directory
+        self._entries: BoundedCache[str, DocsEntry] = BoundedCache(
+            max_entries=max_entries
+        )
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+            "extractions": 0,
+        }
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _disk_path(self, url: str) -> str:
+        """
+        Get the base path of the disk files for a URL.
+
+        Args:
+            url: The URL.
+
+        Returns:
+            str: The path without extension.
+        """
+        assert self.directory is not None
+        return cache_path(self.directory, url)
+
+    def get(self, url: str, load: bool = True) -> Optional[DocsEntry]:
+        """
+        Look up a page, loading it from disk if it is not in memory.
+
+        Args:
+            url: The URL.
+            load: Whether to look on disk for pages that are not in memory.
+
+        Returns:
+            Optional[DocsEntry]: The last good copy of the page, fresh or stale.
+        """
+        entry = self._entries.get(url)
+        if entry is not None or not self.directory or not load:
+            return entry
+        return self._load(url)
+
+    def _load(self, url: str) -> Optional[DocsEntry]:
+        """
+        Read a page from the disk tier into memory.
+
+        Args:
+            url: The URL.
+
+        Returns:
+            Optional[DocsEntry]: The page, or None if there is no usable copy.
+        """
+        path = self._disk_path(url)
+        try:
+            with open(path + ".json", "r") as f:
+                metadata = json.load(f)
+            with open(f"{path}.{metadata['content_hash']}.page", "r") as f:
+                text = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+
+        if metadata.get("url") != url:
+            return None
+
+        entry = DocsEntry(
+            url,
+            text,
+            fetched_at=metadata["fetched_at"],
+            truncated=metadata["truncated"],
+            extracted=metadata["extracted"],
+        )
+        if entry.content_hash != metadata["content_hash"]:
+            # The page file does not match its metadata
+            return None
+
+        self._entries.put(url, entry)
+        return entry
+
+    def put(self, url: str, text: str, truncated: bool = False) -> DocsEntry:
+        """
+        Store a fetched page in memory and, if configured, on disk.
+
+        Text extracted from an earlier copy with the same content is kept.
+
+        Args:
+            url: The URL.
+            text: The page text.
+            truncated: Whether the page was cut off at the download budget.
+
+        Returns:
+            DocsEntry: The stored entry.
+        """
+        entry = DocsEntry(url, text, truncated=truncated)
+        previous = self.get(url)
+        if previous is not None and previous.content_hash == entry.content_hash:
+            entry.extracted = dict(previous.extracted)
+
+        self._entries.put(url, entry)
+        self._save(entry, previous)
+        return entry
+
+    def extract(
+        self, entry: DocsEntry, name: str, extractor: Callable[[str], Optional[str]]
+    ) -> Optional[str]:
+        """
+        Get text extracted from a page, running the extractor only once per
+        content hash.
+
+        Args:
+            entry: The page.
+            name: The name of the extractor, e.g. "commands".
+            extractor: Extracts the text from the page, or returns None.
+
+        Returns:
+            Optional[str]: The extracted text.
+        """
+        if name in entry.extracted:
+            return entry.extracted[name]
+
+        value = extractor(entry.text)
+        entry.extracted[name] = value
+        self.record("extractions")
+        self._save(entry)
+        return value
+
+    def _save(self, entry: DocsEntry, previous: Optional[DocsEntry] = None) -> None:
+        """
+        Write a page to the disk tier, if configured.
+
+        Args:
+            entry: The page to write.
+            previous: Optional copy of the page it replaces.
+        """
+        if not self.directory:
+            return
+
+        path = self._disk_path(entry.url)
+        page_path = f"{path}.{entry.content_hash}.page"
+        metadata = {
+            "url": entry.url,
+            "content_hash": entry.content_hash,
+            "fetched_at": entry.fetched_at,
+            "truncated": entry.truncated,
+            "extracted": entry.extracted,
+        }
+        try:
+            if not os.path.exists(page_path):
+                write_file(page_path, entry.text)
+            write_file(path + ".json", json.dumps(metadata))
+        except OSError:
+            return
+
+        if previous is not None and previous.content_hash != entry.content_hash:
+            try:
+                os.remove(f"{path}.{previous.content_hash}.page")
+            except OSError:
+                pass
+
+    def record(self, event: str) -> None:
+        """
+        Count a cache event.
+
+        Args:
+            event: The name of the counter.
+        """
+        with self._lock:
+            self._stats[event] += 1
+
+    def info(self) -> Dict[str, int]:
+        """
+        Get statistics for the cache.
+
+        Returns:
+            Dict[str, int]: The hit, miss, stale, refresh, refresh error and
+            extraction counts and the number of pages in memory.
+        """
+        with self._lock:
+            return {**self._stats, "size": len(self._entries)}
+
+
+# The docs cache of the Railway docs tools (None disables caching)
+_docs_cache: Optional[DocsCache] = DocsCache()
+
+# Whether pages that were fetched before are never refetched
+_offline: bool = False
+
+# Task group running the background refetches, set by docs_refresh_lifespan
+_task_group: Optional[TaskGroup] = None
+
+# Background refetches in flight, by URL, set when they have finished
+_refreshes: Dict[str, anyio.Event] = {}
+
+# Fetches in flight, by URL
+_fetches: SingleFlight[str, DocsEntry] = SingleFlight()
+
+# Extractions running on worker threads, by URL, content hash and extractor
+_extractions: SingleFlight[Tuple[str, str, str], Optional[str]] = SingleFlight()
+
+
+def configure_docs_cache(
+    ttl: float = 24 * 60 * 60, directory: Optional[str] = None, offline: bool = False
+) -> None:
+    """
+    Configure the Railway docs cache.
+
+    Args:
+        ttl: The number of seconds a page stays fresh. 0 disables the cache.
+        directory: Optional directory for keeping pages across restarts.
+        offline: Whether to serve the last good copy of a page without ever
+            refetching it.
+    """
+    global _docs_cache, _offline
+
+    _docs_cache = DocsCache(ttl, directory) if ttl > 0 else None
+    _offline = offline
+
+
+def get_docs_cache() -> Optional[DocsCache]:
+    """
+    Get the Railway docs cache.
+
+    Returns:
+        Optional[DocsCache]: The cache, or None if caching is disabled.
+    """
+    return _docs_cache
+
+
+async def get_docs_page(url: str, fetch: DocsFetcher) -> DocsEntry:
+    """
+    Get a docs page, fetching it only if there is no usable copy.
+
+    A stale copy is returned immediately and refetched in the background
+    inside docs_refresh_lifespan. Outside of it the page is refetched before
+    returning, falling back to the stale copy if that fails. Concurrent calls
+    that fetch the same page share one fetch.
+
+    Args:
+        url: The URL of the page.
+        fetch: Fetches the page.
+
+    Returns:
+        DocsEntry: The page.
+
+    Raises:
+        Exception: Whatever fetch raised, if there is no copy of the page.
+    """
+    cache = _docs_cache
+    if cache is None:
+        return await _fetches.do(url, _fetch_entry, None, url, fetch)
+
+    entry = cache.get(url, load=False)
+    if entry is None and cache.directory:
+        entry = await to_thread.run_sync(cache.get, url)
+    if entry is None:
+        cache.record("misses")
+        return await _fetches.do(url, _fetch_entry, cache, url, fetch)
+
+    cache.record("hits")
+    if _offline or entry.is_fresh(cache.ttl):
+        return entry
+
+    cache.record("stale")
+    if _task_group is not None:
+        _schedule_refresh(_task_group, cache, url, fetch)
+        return entry
+    return await _refresh(cache, url, fetch) or entry
+
+
+async def _fetch_entry(
+    cache: Optional[DocsCache], url: str, fetch: DocsFetcher
+) -> DocsEntry:
+    """
+    Fetch a page without a copy and store it.
+
+    Args:
+        cache: The cache to store the page in, or None.
+        url: The URL of the page.
+        fetch: Fetches the page.
+
+    Returns:
+        DocsEntry: The page.
+    """
+    text, truncated = await fetch(url)
+    if cache is None:
+        return DocsEntry(url, text, truncated=truncated)
+    return await _run_cache(cache, cache.put, url, text, truncated)
+
+
+async def _run_cache(cache: DocsCache, func: Callable[..., T], *args: Any) -> T:
+    """
+    Call a method of the cache, on a worker thread if it has a disk tier.
+
+    Args:
+        cache: The cache.
+        func: The method to call.
+        *args: The arguments of the method.
+
+    Returns:
+        T: The result of the method.
+    """
+    if cache.directory:
+        return await to_thread.run_sync(func, *args)
+    return func(*args)
+
+
+async def extract_docs_page(
+    entry: DocsEntry, name: str, extractor: Callable[[str], Optional[str]]
+) -> Optional[str]:
+    """
+    Extract text from a docs page, reusing an earlier extraction.
+
+    Callers that shared the fetch of a page share its extraction too, also
+    when the cache is disabled. With a disk tier, the extraction and the write
+    of its result run on a worker thread.
+
+    Args:
+        entry: The page.
+        name: The name of the extractor, e.g. "commands".
+        extractor: Extracts the text from the page, or returns None.
+
+    Returns:
+        Optional[str]: The extracted text.
+    """
+    cache = _docs_cache
+    if name in entry.extracted:
+        return entry.extracted[name]
+    if cache is None:
+        entry.extracted[name] = extractor(entry.text)
+        return entry.extracted[name]
+    return await _extractions.do(
+        (entry.url, entry.content_hash, name),
+        _run_cache,
+        cache,
+        cache.extract,
+        entry,
+        name,
+        extractor,
+    )
+
+
+@asynccontextmanager
+async def docs_refresh_lifespan() -> AsyncIterator[None]:
+    """
+    Refetch stale pages in the background until exit.
+
+    The server enters this context once per process, inside
+    http_client_lifespan, so that refetches never outlive the shared client.
+    Refetches still in flight on exit are cancelled.
+
+    Yields:
+        None: While stale pages are refetched in the background.
+    """
+    global _task_group
+
+    async with anyio.create_task_group() as tg:
+        _task_group = tg
+        try:
+            yield
+        finally:
+            _task_group = None
+            tg.cancel_scope.cancel()
+
+
+def _schedule_refresh(
+    tg: TaskGroup, cache: DocsCache, url: str, fetch: DocsFetcher
+) -> None:
+    """
+    Start refetching a page in the background, unless that is already running.
+
+    Args:
+        tg: The task group to run the refetch in.
+        cache: The cache to store the page in.
+        url: The URL of the page.
+        fetch: Fetches the page.
+    """
+    if url in _refreshes:
+        return
+
+    done = _refreshes[url] = anyio.Event()
+
+    async def run() -> None:
+        try:
+            await _refresh(cache, url, fetch)
+        finally:
+            del _refreshes[url]
+            done.set()
+
+    tg.start_soon(run)
+
+
+async def _refresh(
+    cache: DocsCache, url: str, fetch: DocsFetcher
+) -> Optional[DocsEntry]:
+    """
+    Refetch a page, keeping the last good copy if that fails.
+
+    Args:
+        cache: The cache to store the page in.
+        url: The URL of the page.
+        fetch: Fetches the page.
+
+    Returns:
+        Optional[DocsEntry]: The refetched page, or None if the fetch failed.
+    """
+    try:
+        entry = await _fetches.do(url, _fetch_entry, cache, url, fetch)
+    except Exception:
+        cache.record("refresh_errors")
+        return None
+    cache.record("refreshes")
+    return entry
+
+
+async def wait_for_refreshes() -> None:
+    """
+    Wait until the background refetches in flight have finished.
+    """
+    while _refreshes:
+        await next(iter(_refreshes.values())).wait()
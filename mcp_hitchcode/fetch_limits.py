@@ -0,0 +1,218 @@
+"""
+Fetch limits for MCP Simple Tool.
+
+This module limits the fetches of mcp_fetch_many: how many requests run at the
+same time in total and per host, and how fast new requests are started per
+host (a token bucket). Hosts are tracked while they have requests in flight
+or rate limit tokens to refill.
+"""
+
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+import anyio
+import httpx
+
+# Maximum number of fetches running at the same time
+_concurrency: int = 16
+
+# Maximum number of fetches per host running at the same time
+_per_host: int = 4
+
+# Requests started per second and host (0 disables the rate limit)
+_rate: float = 0.0
+
+# Number of requests a host may start at once before the rate limit applies
+_burst: int = 4
+
+# Limiter for _concurrency, created on first use in the event loop
+_limiter: Optional[anyio.CapacityLimiter] = None
+
+# Limits of the hosts being fetched, by host name
+_hosts: Dict[str, "_HostLimits"] = {}
+
+# Number of tracked hosts above which idle hosts are dropped
+_MAX_IDLE_HOSTS = 256
+
+
+class TokenBucket:
+    """
+    Token bucket rate limit: up to burst requests at once, then rate per second.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """
+        Create a full bucket.
+
+        Args:
+            rate: The number of tokens added per second.
+            burst: The capacity of the bucket.
+
+        Raises:
+            ValueError: If rate is not positive or burst is smaller than 1.
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"Burst must be at least 1, got {burst}")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = anyio.Lock()
+
+    def _refill(self) -> None:
+        """
+        Add the tokens accumulated since the last update.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def is_full(self) -> bool:
+        """
+        Check whether the bucket refilled completely.
+
+        Returns:
+            bool: Whether a burst of requests could start now.
+        """
+        self._refill()
+        return self._tokens >= self.burst
+
+    async def acquire(self) -> None:
+        """
+        Take a token, waiting until one is available.
+
+        Waiting callers are served in order.
+        """
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await anyio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class _HostLimits:
+    """
+    Concurrency and rate limit of one host.
+    """
+
+    __slots__ = ("limiter", "bucket", "active")
+
+    def __init__(self) -> None:
+        self.limiter = anyio.CapacityLimiter(_per_host)
+        self.bucket = TokenBucket(_rate, _burst) if _rate > 0 else None
+        self.active = 0
+
+
+def configure_fetch_limits(
+    concurrency: int = 16, per_host: int = 4, rate: float = 0.0, burst: int = 4
+) -> None:
+    """
+    Configure the limits of mcp_fetch_many.
+
+    Args:
+        concurrency: The maximum number of fetches running at the same time.
+        per_host: The maximum number of fetches per host running at the same time.
+        rate: The number of requests started per second and host. 0 disables
+            the rate limit.
+        burst: The number of requests a host may start at once before the
+            rate limit applies.
+
+    Raises:
+        ValueError: If a limit is smaller than 1 or rate is negative.
+    """
+    global _concurrency, _per_host, _rate, _burst, _limiter
+
+    if concurrency < 1:
+        raise ValueError(f"Fetch concurrency must be at least 1, got {concurrency}")
+    if per_host < 1:
+        raise ValueError(f"Per-host concurrency must be at least 1, got {per_host}")
+    if rate < 0:
+        raise ValueError(f"Fetch rate must not be negative, got {rate}")
+    if burst < 1:
+        raise ValueError(f"Fetch burst must be at least 1, got {burst}")
+
+    _concurrency = concurrency
+    _per_host = per_host
+    _rate = rate
+    _burst = burst
+    _limiter = None
+    _hosts.clear()
+
+
+def _get_limiter() -> anyio.CapacityLimiter:
+    """
+    Get the limiter for the total number of fetches, creating it on first use.
+
+    Returns:
+        anyio.CapacityLimiter: The limiter.
+    """
+    global _limiter
+
+    if _limiter is None:
+        _limiter = anyio.CapacityLimiter(_concurrency)
+    return _limiter
+
+
+def _is_idle(limits: _HostLimits) -> bool:
+    """
+    Check whether the limits of a host can be dropped without loosening them.
+
+    Args:
+        limits: The limits of the host.
+
+    Returns:
+        bool: Whether the host has no fetch in flight and a full bucket.
+    """
+    return not limits.active and (limits.bucket is None or limits.bucket.is_full())
+
+
+def _prune_hosts() -> None:
+    """
+    Drop the limits of idle hosts.
+    """
+    for host, limits in list(_hosts.items()):
+        if _is_idle(limits):
+            del _hosts[host]
+
+
+@asynccontextmanager
+async def fetch_slot(url: str) -> AsyncIterator[None]:
+    """
+    Wait until a URL may be fetched under the configured limits.
+
+    A slot of the host and its rate limit token are taken before a global
+    slot, so that a busy or rate limited host does not hold global slots while
+    it waits.
+
+    Args:
+        url: The URL to fetch.
+
+    Yields:
+        None: While the fetch holds its slots.
+
+    Raises:
+        httpx.InvalidURL: If the URL cannot be parsed.
+    """
+    host = httpx.URL(url).host
+    limits = _hosts.get(host)
+    if limits is None:
+        if len(_hosts) >= _MAX_IDLE_HOSTS:
+            _prune_hosts()
+        limits = _hosts[host] = _HostLimits()
+
+    limits.active += 1
+    try:
+        async with limits.limiter:
+            if limits.bucket is not None:
+                await limits.bucket.acquire()
+            async with _get_limiter():
+                yield
+    finally:
+        limits.active -= 1
+        if _is_idle(limits) and _hosts.get(host) is limits:
+            del _hosts[host]
@@ -0,0 +1,628 @@
+"""
+HTTP response cache for MCP Simple Tool.
+
+This module provides a local cache for fetched pages. It honors Cache-Control,
+stores ETag/Last-Modified validators and revalidates stale pages with
+conditional requests, so unchanged pages come back as 304 responses. The disk
+tier is read and written on worker threads.
+"""
+
+import codecs
+import email.utils
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import httpx
+from anyio import to_thread
+
+from mcp_hitchcode.cache_files import cache_path, write_file
+
+T = TypeVar("T")
+
+# Response headers that describe the transfer rather than the stored body
+_DROPPED_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "transfer-encoding",
+}
+
+
+def _parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """
+    Parse a Cache-Control header.
+
+    Args:
+        value: The header value, e.g. "public, max-age=600".
+
+    Returns:
+        Dict[str, Optional[str]]: The lower-cased directives and their values.
+    """
+    directives: Dict[str, Optional[str]] = {}
+    for part in value.split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def _freshness_lifetime(headers: httpx.Headers) -> Optional[float]:
+    """
+    Compute how long a response may be served without revalidation.
+
+    Args:
+        headers: The response headers.
+
+    Returns:
+        Optional[float]: The lifetime in seconds, or None if the response must
+        not be stored.
+    """
+    directives = _parse_cache_control(headers.get("cache-control", ""))
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            return max(float(max_age), 0.0)
+        except ValueError:
+            return 0.0
+
+    expires = headers.get("expires")
+    if expires:
+        try:
+            expires_at = email.utils.parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            return 0.0
+        return max(expires_at - time.time(), 0.0)
+
+    return 0.0
+
+
+class CachedResponse:
+    """
+    A stored response together with its freshness information.
+    """
+
+    __slots__ = ("url", "status_code", "headers", "content", "expires_at")
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        expires_at: float,
+    ) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_response(
+        cls, url: str, response: httpx.Response, lifetime: float
+    ) -> "CachedResponse":
+        """
+        Create a cache entry from a fetched response.
+
+        Args:
+            url: The requested URL.
+            response: The response, with its body already read.
+            lifetime: The freshness lifetime in seconds.
+
+        Returns:
+            CachedResponse: The cache entry.
+        """
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _DROPPED_HEADERS
+        }
+        return cls(
+            url, response.status_code, headers, response.content, time.time() + lifetime
+        )
+
+    def is_fresh(self) -> bool:
+        """
+        Check whether the entry can be served without revalidation.
+
+        Returns:
+            bool: True if the entry is still fresh.
+        """
+        return time.time() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """
+        Get the conditional request headers for revalidating this entry.
+
+        Returns:
+            Dict[str, str]: If-None-Match and/or If-Modified-Since headers.
+        """
+        headers = {}
+        lowered = {name.lower(): value for name, value in self.headers.items()}
+        if "etag" in lowered:
+            headers["If-None-Match"] = lowered["etag"]
+        if "last-modified" in lowered:
+            headers["If-Modified-Since"] = lowered["last-modified"]
+        return headers
+
+    def to_response(self, max_bytes: Optional[int] = None) -> httpx.Response:
+        """
+        Build an httpx response from the entry.
+
+        Args:
+            max_bytes: Optional maximum number of body bytes.
+
+        Returns:
+            httpx.Response: The cached response, truncated to max_bytes.
+        """
+        response = httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            request=httpx.Request("GET", self.url),
+        )
+        return _limited_response(response, self.content, max_bytes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the entry metadata (everything but the body) for the disk tier.
+
+        Returns:
+            Dict[str, Any]: The JSON-serializable metadata.
+        """
+        return {
+            "url": self.url,
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "expires_at": self.expires_at,
+        }
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of fetched pages with an optional on-disk tier.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_body_bytes: int = 5 * 1024 * 1024,
+        directory: Optional[str] = None,
+    ) -> None:
+        """
+        Create a response cache.
+
+        Args:
+            max_entries: The maximum number of pages kept in memory.
+            max_body_bytes: Pages with larger bodies are not cached.
+            directory: Optional directory for persisting pages across restarts.
+        """
+        self.max_entries = max_entries
+        self.max_body_bytes = max_body_bytes
+        self.directory = directory
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0}
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _disk_path(self, url: str) -> str:
+        """
+        Get the base path of the disk files for a URL.
+
+        Args:
+            url: The URL.
+
+        Returns:
+            str: The path without extension.
+        """
+        assert self.directory is not None
+        return cache_path(self.directory, url)
+
+    def get(self, url: str, load: bool = True) -> Optional[CachedResponse]:
+        """
+        Look up a page, loading it from disk if it is not in memory.
+
+        Args:
+            url: The URL.
+            load: Whether to look on disk for pages that are not in memory.
+
+        Returns:
+            Optional[CachedResponse]: The cached page, fresh or stale.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+                return entry
+
+        if not self.directory or not load:
+            return None
+        return self._load(url)
+
+    def _load(self, url: str) -> Optional[CachedResponse]:
+        """
+        Read a page from the disk tier into memory.
+
+        Args:
+            url: The URL.
+
+        Returns:
+            Optional[CachedResponse]: The page, or None if there is no usable copy.
+        """
+        path = self._disk_path(url)
+        try:
+            with open(path + ".json", "r") as f:
+                metadata = json.load(f)
+            with open(path + ".body", "rb") as f:
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+
+        if metadata.get("url") != url:
+            return None
+
+        entry = CachedResponse(
+            url,
+            metadata["status_code"],
+            metadata["headers"],
+            content,
+            metadata["expires_at"],
+        )
+        self._remember(entry)
+        return entry
+
+    def put(self, entry: CachedResponse) -> None:
+        """
+        Store a page in memory and, if configured, on disk.
+
+        Args:
+            entry: The page to store.
+        """
+        if len(entry.content) > self.max_body_bytes:
+            return
+
+        self._remember(entry)
+        with self._lock:
+            self._stats["stored"] += 1
+
+        if self.directory:
+            self._write(entry, body=True)
+
+    def refresh(self, entry: CachedResponse) -> None:
+        """
+        Store a revalidated page, rewriting only its metadata on disk.
+
+        Args:
+            entry: The page, with its new expiry time.
+        """
+        if len(entry.content) > self.max_body_bytes:
+            return
+
+        self._remember(entry)
+        if self.directory:
+            self._write(entry, body=False)
+
+    def _write(self, entry: CachedResponse, body: bool) -> None:
+        """
+        Write a page to the disk tier.
+
+        Args:
+            entry: The page to write.
+            body: Whether to write the body as well as the metadata.
+        """
+        path = self._disk_path(entry.url)
+        try:
+            if body:
+                write_file(path + ".body", entry.content)
+            write_file(path + ".json", json.dumps(entry.to_dict()))
+        except OSError:
+            pass
+
+    def _remember(self, entry: CachedResponse) -> None:
+        """
+        Keep a page in the in-memory tier.
+
+        Args:
+            entry: The page to keep.
+        """
+        with self._lock:
+            self._entries[entry.url] = entry
+            self._entries.move_to_end(entry.url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, url: str) -> None:
+        """
+        Remove a page from both tiers.
+
+        Args:
+            url: The URL.
+        """
+        with self._lock:
+            self._entries.pop(url, None)
+
+        if self.directory:
+            path = self._disk_path(url)
+            for extension in (".json", ".body"):
+                try:
+                    os.remove(path + extension)
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        """
+        Remove all pages from memory. Pages on disk are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def record(self, event: str) -> None:
+        """
+        Count a cache event.
+
+        Args:
+            event: "hits", "misses" or "revalidated".
+        """
+        with self._lock:
+            self._stats[event] += 1
+
+    def info(self) -> Dict[str, int]:
+        """
+        Get statistics for the cache.
+
+        Returns:
+            Dict[str, int]: The hit, miss, revalidation and store counts and the
+            number of pages in memory.
+        """
+        with self._lock:
+            return {**self._stats, "size": len(self._entries)}
+
+
+# The response cache shared by the fetch tools (None disables caching)
+_response_cache: Optional[ResponseCache] = ResponseCache()
+
+
+def configure_response_cache(
+    enabled: bool = True, directory: Optional[str] = None, max_entries: int = 256
+) -> None:
+    """
+    Configure the response cache shared by the fetch tools.
+
+    Args:
+        enabled: Whether fetched pages are cached.
+        directory: Optional directory for persisting pages across restarts.
+        max_entries: The maximum number of pages kept in memory.
+    """
+    global _response_cache
+
+    _response_cache = (
+        ResponseCache(max_entries=max_entries, directory=directory) if enabled else None
+    )
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the response cache shared by the fetch tools.
+
+    Returns:
+        Optional[ResponseCache]: The cache, or None if caching is disabled.
+    """
+    return _response_cache
+
+
+async def _run_cache(cache: ResponseCache, func: Callable[..., T], *args: Any) -> T:
+    """
+    Call a method of the cache, on a worker thread if it has a disk tier.
+
+    Args:
+        cache: The cache.
+        func: The method to call.
+        *args: The arguments of the method.
+
+    Returns:
+        T: The result of the method.
+    """
+    if cache.directory:
+        return await to_thread.run_sync(func, *args)
+    return func(*args)
+
+
+def is_truncated(response: httpx.Response) -> bool:
+    """
+    Check whether a response body was cut off at the byte budget.
+
+    Args:
+        response: A response returned by cached_get.
+
+    Returns:
+        bool: True if the body was truncated.
+    """
+    return bool(response.extensions.get("truncated"))
+
+
+def _limited_response(
+    response: httpx.Response, content: bytes, max_bytes: Optional[int]
+) -> httpx.Response:
+    """
+    Build a response whose body is cut off at the byte budget.
+
+    Args:
+        response: The response to copy the status, headers and request from.
+        content: The decoded body.
+        max_bytes: Optional maximum number of body bytes.
+
+    Returns:
+        httpx.Response: The new response, marked as truncated if it was cut off.
+    """
+    truncated = max_bytes is not None and len(content) > max_bytes
+    headers = {
+        name: value
+        for name, value in response.headers.items()
+        if name.lower() not in _DROPPED_HEADERS
+    }
+    return httpx.Response(
+        response.status_code,
+        headers=headers,
+        content=content[:max_bytes] if truncated else content,
+        request=response.request,
+        extensions={"truncated": truncated},
+    )
+
+
+async def _get(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Dict[str, str],
+    max_bytes: Optional[int],
+    on_text: Optional[Callable[[str], None]] = None,
+) -> httpx.Response:
+    """
+    GET a URL, streaming the body and aborting once the byte budget is exceeded.
+
+    Args:
+        client: The HTTP client to fetch with.
+        url: The URL to fetch.
+        headers: The request headers.
+        max_bytes: Optional maximum number of decoded body bytes to read.
+        on_text: Optional callback receiving the body text as it is downloaded.
+
+    Returns:
+        httpx.Response: The response with its (possibly truncated) body read.
+    """
+    if max_bytes is None:
+        response = await client.get(url, headers=headers)
+        if on_text is not None:
+            on_text(response.text)
+        return response
+
+    chunks = []
+    size = 0
+    decoder = None
+    async with client.stream("GET", url, headers=headers) as response:
+        if on_text is not None:
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+                errors="replace"
+            )
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if on_text is not None and decoder is not None:
+                # Pass on the text up to the budget, like the truncated body
+                within_budget = chunk[: len(chunk) - max(size - max_bytes, 0)]
+                on_text(decoder.decode(within_budget))
+            if size > max_bytes:
+                # Stop downloading; leaving the block closes the connection
+                break
+        if on_text is not None and decoder is not None:
+            on_text(decoder.decode(b"", final=True))
+
+    return _limited_response(response, b"".join(chunks), max_bytes)
+
+
+def _cached_response(
+    entry: CachedResponse,
+    max_bytes: Optional[int],
+    on_text: Optional[Callable[[str], None]],
+) -> httpx.Response:
+    """
+    Build the response for a cached page, passing its text to on_text.
+
+    Args:
+        entry: The cached page.
+        max_bytes: Optional maximum number of body bytes.
+        on_text: Optional callback receiving the body text.
+
+    Returns:
+        httpx.Response: The cached response, truncated to max_bytes.
+    """
+    response = entry.to_response(max_bytes)
+    if on_text is not None:
+        on_text(response.text)
+    return response
+
+
+async def cached_get(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    max_bytes: Optional[int] = None,
+    on_text: Optional[Callable[[str], None]] = None,
+    use_cache: bool = True,
+) -> httpx.Response:
+    """
+    GET a URL through the response cache.
+
+    Fresh pages are served from the cache. Stale pages with an ETag or
+    Last-Modified validator are revalidated with a conditional request, and a
+    304 response is answered with the cached body.
+
+    With max_bytes the body is streamed and the download is aborted as soon as
+    the budget is exceeded; use is_truncated to check for a cut-off body.
+    Truncated pages are not cached.
+
+    With on_text the body text is passed on while it is downloaded, so that it
+    can be processed before the download finishes. Bodies served from the
+    cache are passed on in one piece.
+
+    Args:
+        client: The HTTP client to fetch with.
+        url: The URL to fetch.
+        headers: Optional request headers.
+        max_bytes: Optional maximum number of decoded body bytes to read.
+        on_text: Optional callback receiving the body text as it arrives.
+        use_cache: Whether to use the response cache. Callers that keep the
+            page in a cache of their own pass False.
+
+    Returns:
+        httpx.Response: The fetched or cached response.
+    """
+    cache = _response_cache if use_cache else None
+    if cache is None:
+        return await _get(client, url, dict(headers or {}), max_bytes, on_text)
+
+    entry = cache.get(url, load=False)
+    if entry is None and cache.directory:
+        entry = await to_thread.run_sync(cache.get, url)
+    if entry is not None and entry.is_fresh():
+        cache.record("hits")
+        return _cached_response(entry, max_bytes, on_text)
+
+    request_headers = dict(headers or {})
+    if entry is not None:
+        request_headers.update(entry.validators())
+
+    response = await _get(client, url, request_headers, max_bytes, on_text)
+
+    if response.status_code == 304 and entry is not None:
+        cache.record("revalidated")
+        lifetime = _freshness_lifetime(response.headers)
+        if lifetime is not None:
+            entry.expires_at = time.time() + lifetime
+            await _run_cache(cache, cache.refresh, entry)
+        return _cached_response(entry, max_bytes, on_text)
+
+    cache.record("misses")
+    if response.status_code == 200 and not is_truncated(response):
+        lifetime = _freshness_lifetime(response.headers)
+        if lifetime is None:
+            await _run_cache(cache, cache.discard, url)
+        elif (
+            lifetime > 0
+            or "etag" in response.headers
+            or ("last-modified" in response.headers)
+        ):
+            entry = CachedResponse.from_response(url, response, lifetime)
+            await _run_cache(cache, cache.put, entry)
+
+    return response
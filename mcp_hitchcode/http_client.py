@@ -0,0 +1,120 @@
+"""
+HTTP client for MCP Simple Tool.
+
+This module manages the httpx client that is shared by all fetch tools, so
+that repeated fetches reuse pooled connections instead of opening new ones.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+
+# Timeout used for all fetches
+DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+# Connection pool limits for the shared client
+_limits = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
+# Whether the shared client negotiates HTTP/2
+_http2 = False
+
+# Optional custom transport, mainly for tests
+_transport: Optional[httpx.AsyncBaseTransport] = None
+
+# The shared client, created by http_client_lifespan
+_client: Optional[httpx.AsyncClient] = None
+
+
+def configure_http_client(
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+    http2: bool = False,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> None:
+    """
+    Configure the shared HTTP client. Takes effect when the client is next created.
+
+    Args:
+        max_connections: The maximum number of concurrent connections.
+        max_keepalive_connections: The maximum number of idle connections kept open.
+        keepalive_expiry: Seconds after which an idle connection is closed.
+        http2: Whether to negotiate HTTP/2. Requires the h2 package
+            (pip install "httpx[http2]").
+        transport: Optional custom httpx transport, mainly for tests.
+
+    Raises:
+        ImportError: If HTTP/2 is requested but the h2 package is not installed.
+    """
+    global _limits, _http2, _transport
+
+    if http2:
+        import h2  # noqa: F401
+
+    _limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    _http2 = http2
+    _transport = transport
+
+
+def _create_client() -> httpx.AsyncClient:
+    """
+    Create an HTTP client with the configured pool limits.
+
+    Returns:
+        httpx.AsyncClient: The new client.
+    """
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=DEFAULT_TIMEOUT,
+        limits=_limits,
+        http2=_http2,
+        transport=_transport,
+    )
+
+
+@asynccontextmanager
+async def http_client_lifespan() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Create the shared HTTP client and close it on exit.
+
+    The server enters this context once per process, around the transport.
+
+    Yields:
+        httpx.AsyncClient: The shared client.
+    """
+    global _client
+
+    client = _create_client()
+    _client = client
+    try:
+        async with client:
+            yield client
+    finally:
+        if _client is client:
+            _client = None
+
+
+@asynccontextmanager
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Get the shared HTTP client.
+
+    Outside of http_client_lifespan (e.g. when a fetch tool is called directly)
+    a short-lived client is created and closed again.
+
+    Yields:
+        httpx.AsyncClient: The client to fetch with.
+    """
+    if _client is not None:
+        yield _client
+        return
+
+    async with _create_client() as client:
+        yield client
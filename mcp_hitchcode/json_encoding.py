@@ -0,0 +1,91 @@
+"""
+JSON encoding of tool results for MCP Simple Tool.
+
+Tool results posted back over HTTP are encoded straight from the TextContent
+objects, without building a dict per content part first. orjson is used when
+it is installed (pip install orjson), the standard json module otherwise.
+"""
+
+import json
+from typing import Any, Iterable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+# Encoders selectable with configure_json_encoder
+JSON_ENCODERS = ("auto", "orjson", "json")
+
+# Whether orjson is used to encode responses
+_use_orjson: bool = orjson is not None
+
+
+def configure_json_encoder(encoder: str = "auto") -> None:
+    """
+    Choose the JSON encoder for tool results.
+
+    Args:
+        encoder: "orjson", "json" for the standard library, or "auto" to use
+            orjson when it is installed.
+
+    Raises:
+        ValueError: If the encoder is unknown.
+        ImportError: If orjson is requested but not installed.
+    """
+    global _use_orjson
+
+    if encoder not in JSON_ENCODERS:
+        raise ValueError(f"Unknown JSON encoder: {encoder}")
+    if encoder == "orjson" and orjson is None:
+        raise ImportError("The orjson encoder requires the orjson package")
+
+    _use_orjson = encoder != "json" and orjson is not None
+
+
+def get_json_encoder() -> str:
+    """
+    Get the JSON encoder in use.
+
+    Returns:
+        str: "orjson" or "json".
+    """
+    return "orjson" if _use_orjson else "json"
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode a value as compact UTF-8 JSON.
+
+    Args:
+        obj: The value to encode.
+
+    Returns:
+        bytes: The encoded value.
+    """
+    if _use_orjson and orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_content(content_list: Iterable[Any]) -> bytes:
+    """
+    Encode the content of a tool result as a JSON array.
+
+    Produces the same JSON as serialize_content() followed by json.dumps(), but
+    writes each part directly from its type and text.
+
+    Args:
+        content_list: The TextContent parts of the result.
+
+    Returns:
+        bytes: The array of {"type", "text"} objects.
+    """
+    return (
+        b"["
+        + b",".join(
+            b'{"type":' + dumps(content.type) + b',"text":' + dumps(content.text) + b"}"
+            for content in content_list
+        )
+        + b"]"
+    )
@@ -0,0 +1,492 @@
+"""
+Metrics for MCP Simple Tool.
+
+This module provides a small in-process registry of Prometheus-style counters
+and histograms, rendered in the Prometheus text exposition format. Recording a
+value updates a preallocated slot under a lock. Values that already exist elsewhere,
+such as cache statistics, are read by collectors only when the metrics are
+rendered.
+
+Metrics are kept per process. With several SSE workers, each scrape of
+/metrics is answered by one of the workers.
+"""
+
+import bisect
+import threading
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# A rendered sample: (metric name, label pairs, value)
+Sample = Tuple[str, Tuple[Tuple[str, str], ...], float]
+
+# A collected metric family: (name, type, help, samples)
+Family = Tuple[str, str, str, List[Sample]]
+
+# Latency buckets in seconds, from sub-millisecond renders to slow fetches
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _format_value(value: float) -> str:
+    """
+    Format a sample value.
+
+    Args:
+        value: The value.
+
+    Returns:
+        str: The value in the exposition format.
+    """
+    if value == float("inf"):
+        return "+Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Format the labels of a sample.
+
+    Args:
+        labels: The (name, value) pairs.
+
+    Returns:
+        str: The labels in braces, or an empty string without labels.
+    """
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for name, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+class _CounterChild:
+    """
+    The value of a counter for one combination of label values.
+    """
+
+    __slots__ = ("value", "_lock")
+
+    def __init__(self, lock: threading.Lock) -> None:
+        self.value = 0.0
+        self._lock = lock
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the value.
+
+        Args:
+            amount: The amount to add.
+        """
+        with self._lock:
+            self.value += amount
+
+
+class Counter:
+    """
+    A monotonically increasing value per combination of label values.
+    """
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        """
+        Create a counter.
+
+        Args:
+            name: The metric name.
+            help: The description of the metric.
+            labels: The label names.
+        """
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._children: Dict[Tuple[str, ...], _CounterChild] = {}
+        self._lock = threading.Lock()
+
+    def child(self, *label_values: str) -> _CounterChild:
+        """
+        Get the value for a combination of label values.
+
+        Hot paths keep the child to skip the label lookup on every update.
+
+        Args:
+            *label_values: The values of the labels, in order.
+
+        Returns:
+            _CounterChild: The value.
+        """
+        child = self._children.get(label_values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(
+                    label_values, _CounterChild(self._lock)
+                )
+        return child
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            *label_values: The values of the labels, in order.
+            amount: The amount to add.
+        """
+        self.child(*label_values).inc(amount)
+
+    def value(self, *label_values: str) -> float:
+        """
+        Get the current value.
+
+        Args:
+            *label_values: The values of the labels, in order.
+
+        Returns:
+            float: The value, 0 if it was never increased.
+        """
+        child = self._children.get(label_values)
+        return child.value if child is not None else 0.0
+
+    def collect(self) -> Family:
+        """
+        Get the samples of the counter.
+
+        Returns:
+            Family: The metric family.
+        """
+        with self._lock:
+            items = [(values, child.value) for values, child in self._children.items()]
+        samples = [
+            (self.name, tuple(zip(self.labels, values)), value)
+            for values, value in items
+        ]
+        return self.name, "counter", self.help, samples
+
+
+class _HistogramChild:
+    """
+    The distribution of a histogram for one combination of label values.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...], lock: threading.Lock) -> None:
+        self.buckets = buckets
+        # Count per bucket, the last one counting values above all bounds
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self._lock = lock
+
+    def observe(self, value: float) -> None:
+        """
+        Record a value.
+
+        Args:
+            value: The observed value.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class Histogram:
+    """
+    The distribution of observed values per combination of label values.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """
+        Create a histogram.
+
+        Args:
+            name: The metric name.
+            help: The description of the metric.
+            labels: The label names.
+            buckets: The upper bounds of the buckets.
+        """
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._children: Dict[Tuple[str, ...], _HistogramChild] = {}
+        self._lock = threading.Lock()
+
+    def child(self, *label_values: str) -> _HistogramChild:
+        """
+        Get the distribution for a combination of label values.
+
+        Hot paths keep the child to skip the label lookup on every update.
+
+        Args:
+            *label_values: The values of the labels, in order.
+
+        Returns:
+            _HistogramChild: The distribution.
+        """
+        child = self._children.get(label_values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(
+                    label_values, _HistogramChild(self.buckets, self._lock)
+                )
+        return child
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """
+        Record a value.
+
+        Args:
+            value: The observed value.
+            *label_values: The values of the labels, in order.
+        """
+        self.child(*label_values).observe(value)
+
+    def count(self, *label_values: str) -> int:
+        """
+        Get the number of observed values.
+
+        Args:
+            *label_values: The values of the labels, in order.
+
+        Returns:
+            int: The number of values.
+        """
+        child = self._children.get(label_values)
+        if child is None:
+            return 0
+        with self._lock:
+            return sum(child.counts)
+
+    def collect(self) -> Family:
+        """
+        Get the cumulative bucket, sum and count samples of the histogram.
+
+        Returns:
+            Family: The metric family.
+        """
+        with self._lock:
+            items = [
+                (values, list(child.counts), child.sum)
+                for values, child in self._children.items()
+            ]
+
+        samples: List[Sample] = []
+        bounds = [*self.buckets, float("inf")]
+        for values, counts, total in items:
+            labels = tuple(zip(self.labels, values))
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                le = (("le", _format_value(bound)),)
+                samples.append((f"{self.name}_bucket", labels + le, cumulative))
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return self.name, "histogram", self.help, samples
+
+
+class MetricsRegistry:
+    """
+    The metrics of the process.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create an empty registry.
+        """
+        self._metrics: Dict[str, Counter | Histogram] = {}
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        """
+        Create and register a counter.
+
+        Args:
+            name: The metric name.
+            help: The description of the metric.
+            labels: The label names.
+
+        Returns:
+            Counter: The counter.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        return self._register(Counter(name, help, labels))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        Create and register a histogram.
+
+        Args:
+            name: The metric name.
+            help: The description of the metric.
+            labels: The label names.
+            buckets: The upper bounds of the buckets in increasing order.
+
+        Returns:
+            Histogram: The histogram.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        histogram = Histogram(name, help, labels, buckets)
+        return self._register(histogram)  # type: ignore[return-value]
+
+    def _register(self, metric: Counter | Histogram) -> Counter | Histogram:
+        """
+        Register a metric.
+
+        Args:
+            metric: The metric.
+
+        Returns:
+            Counter | Histogram: The metric.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        """
+        Register a callback that provides metric families when rendering.
+
+        Args:
+            collector: Returns (name, type, help, samples) tuples.
+        """
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def collect(self) -> List[Family]:
+        """
+        Get all metric families.
+
+        Returns:
+            List[Family]: The families of the registered metrics and collectors.
+        """
+        families = [metric.collect() for metric in self._metrics.values()]
+        for collector in self._collectors:
+            families.extend(collector())
+        return families
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics.
+        """
+        lines = []
+        for name, kind, help, samples in self.collect():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_name, labels, value in samples:
+                lines.append(
+                    f"{sample_name}{_format_labels(labels)} {_format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+# Content type of the exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# The registry of the process
+REGISTRY = MetricsRegistry()
+
+TOOL_CALLS = REGISTRY.counter(
+    "mcp_tool_calls_total", "Number of tool calls", labels=("tool",)
+)
+TOOL_ERRORS = REGISTRY.counter(
+    "mcp_tool_errors_total",
+    "Number of tool calls that raised or returned an error",
+    labels=("tool",),
+)
+TOOL_LATENCY = REGISTRY.histogram(
+    "mcp_tool_latency_seconds", "Duration of tool calls in seconds", labels=("tool",)
+)
+TOOL_RESPONSE_BYTES = REGISTRY.counter(
+    "mcp_tool_response_bytes_total",
+    "Size of the text returned by tool calls in UTF-8 bytes",
+    labels=("tool",),
+)
+UNKNOWN_TOOL_CALLS = REGISTRY.counter(
+    "mcp_unknown_tool_calls_total", "Number of calls of tools that do not exist"
+)
+
+
+def cache_families(
+    caches: Mapping[str, Optional[Mapping[str, Optional[int]]]],
+) -> List[Family]:
+    """
+    Build the cache metric families from cache statistics.
+
+    Args:
+        caches: The info() dict of each cache by cache name. Caches that are
+            disabled are None and skipped.
+
+    Returns:
+        List[Family]: Hit, miss, size and (for caches that measure it) byte
+        families labelled by cache.
+    """
+    hits: List[Sample] = []
+    misses: List[Sample] = []
+    sizes: List[Sample] = []
+    used_bytes: List[Sample] = []
+    for cache, info in caches.items():
+        if info is None:
+            continue
+        labels = (("cache", cache),)
+        hits.append(("mcp_cache_hits_total", labels, info.get("hits") or 0))
+        misses.append(("mcp_cache_misses_total", labels, info.get("misses") or 0))
+        sizes.append(("mcp_cache_entries", labels, info.get("size") or 0))
+        used = info.get("bytes")
+        if used is not None:
+            used_bytes.append(("mcp_cache_bytes", labels, used))
+    return [
+        ("mcp_cache_hits_total", "counter", "Number of cache hits", hits),
+        ("mcp_cache_misses_total", "counter", "Number of cache misses", misses),
+        ("mcp_cache_entries", "gauge", "Number of entries in the cache", sizes),
+        ("mcp_cache_bytes", "gauge", "Memory used by the cached values", used_bytes),
+    ]
@@ -0,0 +1,440 @@
+"""
+Railway CLI docs extraction for MCP Simple Tool.
+
+This module extracts the CLI command lists from the Railway documentation
+pages. The extraction can run on a BeautifulSoup tree (built with html.parser
+or lxml) or in a single streaming pass over the markup, and every backend
+produces the same output.
+"""
+
+import html.entities
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Parser backends selectable with configure_parser_backend
+PARSER_BACKENDS = ("html.parser", "lxml", "stream")
+
+# Headings containing one of these keywords introduce a command list
+_COMMAND_KEYWORDS = ("command", "cli", "usage")
+
+# Code blocks containing one of these keywords are returned as a fallback
+_CODE_KEYWORDS = ("railway", "cli")
+
+_HEADINGS = ("h1", "h2", "h3", "h4")
+_LISTS = ("ul", "ol")
+
+# Elements whose text is not part of get_text() in BeautifulSoup
+_HIDDEN_TEXT_ELEMENTS = {"script", "style", "template", "rt", "rp"}
+
+# Elements that never have content or an end tag
+_VOID_ELEMENTS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "keygen",
+    "link",
+    "menuitem",
+    "meta",
+    "param",
+    "source",
+    "spacer",
+    "track",
+    "wbr",
+    "basefont",
+    "bgsound",
+    "command",
+    "frame",
+    "image",
+    "isindex",
+    "nextid",
+}
+
+# The parser backend used by the Railway docs tool
+_parser_backend = "html.parser"
+
+
+def configure_parser_backend(backend: str) -> None:
+    """
+    Choose the HTML parser backend for extracting Railway CLI commands.
+
+    Args:
+        backend: "html.parser" or "lxml" to build a BeautifulSoup tree, or
+            "stream" for a single pass over the markup without a tree.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the lxml backend is requested but lxml is not installed.
+    """
+    global _parser_backend
+
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {backend}")
+    if backend == "lxml":
+        import lxml  # noqa: F401
+
+    _parser_backend = backend
+
+
+def get_parser_backend() -> str:
+    """
+    Get the configured HTML parser backend.
+
+    Returns:
+        str: The backend name.
+    """
+    return _parser_backend
+
+
+def _format_commands(
+    sections: List[Tuple[str, List[str]]],
+    has_code_blocks: bool,
+    code_blocks: List[str],
+) -> Optional[str]:
+    """
+    Format the extracted command sections, falling back to code blocks.
+
+    Args:
+        sections: (heading text, commands) pairs in document order.
+        has_code_blocks: Whether the page contains any pre or code element.
+        code_blocks: The texts of the code blocks mentioning Railway or the CLI.
+
+    Returns:
+        Optional[str]: The extracted commands, or None if nothing was found.
+    """
+    content = []
+    for heading_text, commands in sections:
+        if commands:  # Only add sections that have commands
+            content.append(f"\n{heading_text}:")
+            content.extend(f"- {cmd}" for cmd in commands)
+
+    if content:
+        return "\n".join(content)
+
+    # If we couldn't find any command sections, use the code blocks
+    if has_code_blocks:
+        return "\n".join(["Railway CLI Commands:", *code_blocks])
+
+    return None
+
+
+def _extract_with_soup(page: str, features: str) -> Optional[str]:
+    """
+    Extract the CLI commands from a BeautifulSoup tree.
+
+    Args:
+        page: The HTML page.
+        features: The BeautifulSoup tree builder, "html.parser" or "lxml".
+
+    Returns:
+        Optional[str]: The extracted commands, or None if nothing was found.
+    """
+    from bs4 import BeautifulSoup, Tag
+
+    soup = BeautifulSoup(page, features)
+    sections = []
+
+    # Try to find any command sections
+    for heading in soup.find_all(list(_HEADINGS)):
+        heading_text = heading.get_text(strip=True).lower()
+        if any(keyword in heading_text for keyword in _COMMAND_KEYWORDS):
+            # Look for the next element that might contain commands
+            next_elem = heading.find_next_sibling()
+            while (
+                isinstance(next_elem, Tag) and next_elem.name not in _LISTS + _HEADINGS
+            ):
+                next_elem = next_elem.find_next_sibling()
+
+            if isinstance(next_elem, Tag) and next_elem.name in _LISTS:
+                commands = []
+                for li in next_elem.find_all("li"):
+                    cmd_text = li.get_text(strip=True)
+                    if cmd_text:  # Only add non-empty commands
+                        commands.append(cmd_text)
+                sections.append((heading.get_text(strip=True), commands))
+
+    # Collect the code blocks for the fallback
+    blocks = soup.find_all(["pre", "code"])
+    code_blocks = []
+    for block in blocks:
+        code_text = block.get_text(strip=True)
+        if code_text and any(
+            keyword in code_text.lower() for keyword in _CODE_KEYWORDS
+        ):
+            code_blocks.append(code_text)
+
+    return _format_commands(sections, bool(blocks), code_blocks)
+
+
+class _Element:
+    """
+    An open element of the streaming extractor.
+    """
+
+    __slots__ = ("name", "text", "on_close")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        # Text pieces, collected only for elements whose text is needed
+        self.text: Optional[List[str]] = None
+        # Called with the element's text when it is closed
+        self.on_close: Optional[Callable[[str], object]] = None
+
+
+class RailwayCommandExtractor(HTMLParser):
+    """
+    Single-pass extractor for Railway CLI commands.
+
+    Feeds on the markup (in one piece or in chunks) and collects headings,
+    the lists that follow them and code blocks without building a tree. The
+    element nesting follows BeautifulSoup's html.parser tree builder, so the
+    result matches the tree-based backends.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+        self._stack: List[_Element] = []
+        self._pending_text: List[str] = []
+        # Open elements whose text is being collected
+        self._collecting: List[_Element] = []
+        # Number of open elements whose text BeautifulSoup hides
+        self._hidden_depth = 0
+        # Heading sections in document order: [heading text, commands or None]
+        self._sections: List[list] = []
+        # Headings waiting for a sibling list: (stack depth, section)
+        self._waiting: List[Tuple[int, list]] = []
+        # Lists whose items are being collected: (stack depth, section)
+        self._capturing: List[Tuple[int, list]] = []
+        self._has_code_blocks = False
+        self._code_blocks: Dict[int, str] = {}
+        self._code_block_count = 0
+
+    def result(self) -> Optional[str]:
+        """
+        Finish parsing and format the extracted commands.
+
+        Returns:
+            Optional[str]: The extracted commands, or None if nothing was found.
+        """
+        self.close()
+        sections = [
+            (heading_text, [command for command in commands if command])
+            for heading_text, commands in self._sections
+            if commands is not None
+        ]
+        code_blocks = [
+            self._code_blocks[i]
+            for i in sorted(self._code_blocks)
+            if any(
+                keyword in self._code_blocks[i].lower() for keyword in _CODE_KEYWORDS
+            )
+        ]
+        return _format_commands(sections, self._has_code_blocks, code_blocks)
+
+    def close(self) -> None:
+        super().close()
+        self._flush_text()
+        while self._stack:
+            self._pop()
+
+    def _flush_text(self) -> None:
+        """
+        Hand the text since the last tag to the elements collecting text.
+        """
+        if not self._pending_text:
+            return
+        text = "".join(self._pending_text).strip()
+        self._pending_text = []
+        if text and not self._hidden_depth:
+            for element in self._collecting:
+                element.text.append(text)  # type: ignore[union-attr]
+
+    def _collect(self, element: _Element, on_close) -> None:
+        """
+        Start collecting the text of an element.
+
+        Args:
+            element: The element.
+            on_close: Called with the element's text when it is closed.
+        """
+        if element.text is None:
+            element.text = []
+            self._collecting.append(element)
+        previous = element.on_close
+        if previous is None:
+            element.on_close = on_close
+        else:
+            element.on_close = lambda text: (previous(text), on_close(text))
+
+    def _pop(self) -> None:
+        """
+        Close the innermost open element.
+        """
+        element = self._stack.pop()
+        depth = len(self._stack)
+
+        if element.name in _HIDDEN_TEXT_ELEMENTS:
+            self._hidden_depth -= 1
+        if element.text is not None:
+            self._collecting.remove(element)
+            if element.on_close is not None:
+                element.on_close("".join(element.text))
+
+        # A list is complete once its element is closed
+        self._capturing = [c for c in self._capturing if c[0] != depth]
+        # Headings stop waiting once their parent is closed
+        self._waiting = [w for w in self._waiting if w[0] <= depth]
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        self._flush_text()
+        depth = len(self._stack)
+
+        # Check whether this is the sibling a heading is waiting for
+        if tag in _LISTS + _HEADINGS:
+            still_waiting = []
+            for waiting_depth, waiting_section in self._waiting:
+                if waiting_depth != depth:
+                    still_waiting.append((waiting_depth, waiting_section))
+                elif tag in _LISTS:
+                    waiting_section[1] = []
+                    self._capturing.append((depth, waiting_section))
+            self._waiting = still_waiting
+
+        if tag in _VOID_ELEMENTS:
+            return
+
+        element = _Element(tag)
+        self._stack.append(element)
+        if tag in _HIDDEN_TEXT_ELEMENTS:
+            self._hidden_depth += 1
+
+        if tag in _HEADINGS:
+            section: list = [None, None]
+            self._sections.append(section)
+            self._collect(
+                element,
+                lambda text, depth=depth, section=section: self._heading_closed(
+                    depth, section, text
+                ),
+            )
+
+        elif tag == "li":
+            for capture_depth, captured_section in self._capturing:
+                if capture_depth < depth:
+                    commands = captured_section[1]
+                    commands.append("")
+                    self._collect(
+                        element,
+                        lambda text, commands=commands, index=len(commands) - 1: (
+                            commands.__setitem__(index, text)
+                        ),
+                    )
+
+        elif tag in ("pre", "code"):
+            self._has_code_blocks = True
+            self._code_block_count += 1
+            self._collect(
+                element,
+                lambda text, index=self._code_block_count: (
+                    self._code_blocks.__setitem__(index, text)
+                ),
+            )
+
+    def _heading_closed(self, depth: int, section: list, text: str) -> None:
+        """
+        Record a heading and wait for its list if it introduces commands.
+
+        Args:
+            depth: The stack depth of the heading.
+            section: The heading's section.
+            text: The heading text.
+        """
+        section[0] = text
+        lowered = text.lower()
+        if any(keyword in lowered for keyword in _COMMAND_KEYWORDS):
+            self._waiting.append((depth, section))
+
+    def handle_startendtag(self, tag: str, attrs) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_text()
+        # Close everything up to the most recent open element with this name
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i].name == tag:
+                while len(self._stack) > i:
+                    self._pop()
+                return
+
+    def handle_data(self, data: str) -> None:
+        self._pending_text.append(data)
+
+    def handle_entityref(self, name: str) -> None:
+        character = html.entities.html5.get(name + ";") or html.entities.html5.get(name)
+        self._pending_text.append(character if character else f"&{name}")
+
+    def handle_charref(self, name: str) -> None:
+        if name[:1] in ("x", "X"):
+            codepoint = int(name[1:], 16)
+        else:
+            codepoint = int(name)
+
+        data = None
+        if codepoint < 256:
+            try:
+                data = bytes([codepoint]).decode("windows-1252")
+            except UnicodeDecodeError:
+                pass
+        if not data:
+            try:
+                data = chr(codepoint)
+            except (ValueError, OverflowError):
+                pass
+        self._pending_text.append(data or "\N{REPLACEMENT CHARACTER}")
+
+    def handle_comment(self, data: str) -> None:
+        self._flush_text()
+
+    def handle_decl(self, decl: str) -> None:
+        self._flush_text()
+
+    def handle_pi(self, data: str) -> None:
+        self._flush_text()
+
+    def unknown_decl(self, data: str) -> None:
+        self._flush_text()
+        if data.startswith("CDATA["):
+            # BeautifulSoup keeps CDATA text even inside hidden elements
+            text = data[len("CDATA[") :].strip()
+            if text:
+                for element in self._collecting:
+                    element.text.append(text)  # type: ignore[union-attr]
+
+
+def extract_railway_commands(page: str, backend: Optional[str] = None) -> Optional[str]:
+    """
+    Extract the CLI commands from a Railway documentation page.
+
+    Commands are the items of the first list following a heading that mentions
+    commands, the CLI or usage. If there are none, the code blocks mentioning
+    Railway or the CLI are returned instead.
+
+    Args:
+        page: The HTML page.
+        backend: Optional parser backend. Defaults to the configured backend.
+
+    Returns:
+        Optional[str]: The extracted commands, or None if nothing was found.
+    """
+    backend = backend or _parser_backend
+    if backend == "stream":
+        extractor = RailwayCommandExtractor()
+        extractor.feed(page)
+        return extractor.result()
+    return _extract_with_soup(page, backend)
@@ -0,0 +1,63 @@
+"""
+Rendered prompt cache for MCP Simple Tool.
+
+This module provides the byte-bounded cache with optional expiry for the output
+of rendered prompt templates.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from mcp_hitchcode.bounded_cache import BoundedCache
+
+# Cache key: (template_name, resolved version, hash of the template variables)
+RenderKey = Tuple[str, str, str]
+
+
+def hash_template_arguments(arguments: Dict[str, Any]) -> str:
+    """
+    Hash the variables passed to a template.
+
+    Args:
+        arguments: The template variables.
+
+    Returns:
+        str: A stable hex digest of the variables.
+    """
+    encoded = json.dumps(arguments, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class RenderCache(BoundedCache[RenderKey, str]):
+    """
+    LRU cache of rendered prompts bounded by the memory used by the prompts.
+    """
+
+    def __init__(self, max_bytes: int, ttl: Optional[float] = None) -> None:
+        """
+        Create a rendered prompt cache.
+
+        Args:
+            max_bytes: The maximum total size of the cached prompts in bytes.
+            ttl: Optional number of seconds after which a cached prompt expires.
+
+        Raises:
+            ValueError: If max_bytes is smaller than 1 or ttl is not positive.
+        """
+        super().__init__(max_bytes=max_bytes, ttl=ttl)
+
+    def invalidate_template(self, template_name: Optional[str] = None) -> int:
+        """
+        Drop cached prompts.
+
+        Args:
+            template_name: Optional name of the template whose prompts are
+                dropped. Without it the whole cache is cleared.
+
+        Returns:
+            int: The number of prompts that were removed.
+        """
+        if template_name is None:
+            return self.clear()
+        return self.invalidate(lambda key: key[0] == template_name)
@@ -1,59 +1,574 @@
+import functools
+import json
+import os
+import shutil
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 import anyio
 import click
 import httpx
 import mcp.types as types
-from bs4 import BeautifulSoup
+from anyio import to_thread
 from mcp.server.lowlevel import Server
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Mount, Route
 
 # Use absolute import
-from mcp_hitchcode.templates.template_loader import render_prompt_template
+from mcp_hitchcode.bounded_cache import (
+    get_cache_info,
+    register_cache,
+    unregister_cache,
+)
+from mcp_hitchcode.content_extraction import EXTRACT_FORMATS, ContentExtractor
+from mcp_hitchcode.docs_cache import (
+    configure_docs_cache,
+    docs_refresh_lifespan,
+    extract_docs_page,
+    get_docs_cache,
+    get_docs_page,
+)
+from mcp_hitchcode.fetch_limits import configure_fetch_limits, fetch_slot
+from mcp_hitchcode.http_cache import (
+    cached_get,
+    configure_response_cache,
+    get_response_cache,
+    is_truncated,
+)
+from mcp_hitchcode.http_client import (
+    configure_http_client,
+    http_client,
+    http_client_lifespan,
+)
+from mcp_hitchcode.json_encoding import (
+    JSON_ENCODERS,
+    configure_json_encoder,
+    dumps,
+    encode_content,
+)
+from mcp_hitchcode.metrics import CONTENT_TYPE, REGISTRY, cache_families
+from mcp_hitchcode.railway_docs import (
+    PARSER_BACKENDS,
+    configure_parser_backend,
+    extract_railway_commands,
+)
+from mcp_hitchcode.render_cache import RenderCache, hash_template_arguments
+from mcp_hitchcode.single_flight import SingleFlight
+from mcp_hitchcode.templates.template_loader import (
+    _build_version_registry,
+    add_invalidation_listener,
+    configure_template_bundle,
+    remove_invalidation_listener,
+    render_prompt_template,
+    render_prompt_template_async,
+    resolve_template_version_async,
+    warm_template_cache,
+)
+from mcp_hitchcode.tool_registry import ToolRegistry, ToolResult
 
+# Optional cache of rendered prompts, enabled with --render-cache-size
+_render_cache: RenderCache | None = None
 
-def serialize_content(content_list):
-    return [{"type": content.type, "text": content.text} for content in content_list]
+# Where prompt templates are rendered: "inline", "thread" or "process"
+_render_executor: str = "thread"
 
+# Maximum number of prompt renders running at the same time off the event loop
+_render_concurrency: int = 8
 
-async def fetch_website(
-    url: str,
-) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    headers = {
-        "User-Agent": "MCP Test Server (github.com/modelcontextprotocol/python-sdk)"
-    }
-    try:
-        timeout = httpx.Timeout(10.0, connect=5.0)
-        async with httpx.AsyncClient(
-            follow_redirects=True, headers=headers, timeout=timeout
-        ) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return [types.TextContent(type="text", text=response.text)]
-    except httpx.TimeoutException:
-        return [
-            types.TextContent(
-                type="text",
-                text="Error: Request timed out while trying to fetch the website.",
-            )
-        ]
-    except httpx.HTTPStatusError as e:
+# Limiter for off-loop renders, created on first use inside the event loop
+_render_limiter: anyio.CapacityLimiter | None = None
+
+
+def configure_render_cache(max_bytes: int, ttl: float | None = None) -> None:
+    """
+    Enable, resize or disable the rendered prompt cache.
+
+    Args:
+        max_bytes: The memory budget of the cache in bytes. 0 disables the cache.
+        ttl: Optional number of seconds after which a cached prompt expires.
+    """
+    global _render_cache
+
+    if _render_cache is not None:
+        remove_invalidation_listener(_render_cache.invalidate_template)
+        unregister_cache("render")
+        _render_cache = None
+
+    if max_bytes > 0:
+        _render_cache = RenderCache(max_bytes, ttl=ttl)
+        add_invalidation_listener(_render_cache.invalidate_template)
+        register_cache("render", _render_cache)
+
+
+def configure_render_executor(executor: str, concurrency: int = 8) -> None:
+    """
+    Choose where prompt templates are rendered.
+
+    Args:
+        executor: "inline" to render on the event loop (reading uncached
+            template and Docker files on a worker thread), "thread" to render
+            in anyio worker threads or "process" to render in worker processes.
+        concurrency: The maximum number of renders running at the same time
+            in threads or processes.
+
+    Raises:
+        ValueError: If the executor is unknown or concurrency is smaller than 1.
+    """
+    global _render_executor, _render_concurrency, _render_limiter
+
+    if executor not in ("inline", "thread", "process"):
+        raise ValueError(f"Unknown render executor: {executor}")
+    if concurrency < 1:
+        raise ValueError(f"Render concurrency must be at least 1, got {concurrency}")
+
+    _render_executor = executor
+    _render_concurrency = concurrency
+    _render_limiter = None
+
+
+def _get_render_limiter() -> anyio.CapacityLimiter:
+    """
+    Get the limiter shared by all off-loop renders.
+
+    Returns:
+        anyio.CapacityLimiter: The render limiter.
+    """
+    global _render_limiter
+
+    if _render_limiter is None:
+        _render_limiter = anyio.CapacityLimiter(_render_concurrency)
+    return _render_limiter
+
+
+async def _run_render(template_name: str, version: str, kwargs: dict) -> str:
+    """
+    Render a prompt template on the configured executor.
+
+    Args:
+        template_name: The name of the prompt template.
+        version: The version of the template.
+        kwargs: The variables to pass to the template.
+
+    Returns:
+        str: The rendered prompt.
+    """
+    if _render_executor == "inline":
+        return await render_prompt_template_async(template_name, version, **kwargs)
+
+    render = functools.partial(render_prompt_template, template_name, version, **kwargs)
+    if _render_executor == "process":
+        from anyio import to_process
+
+        return await to_process.run_sync(render, limiter=_get_render_limiter())
+    return await to_thread.run_sync(render, limiter=_get_render_limiter())
+
+
+async def _render_prompt(template_name: str, version: str, **kwargs) -> str:
+    """
+    Render a prompt template, serving repeated renders from the render cache.
+
+    Args:
+        template_name: The name of the prompt template.
+        version: The requested version of the template.
+        **kwargs: The variables to pass to the template.
+
+    Returns:
+        str: The rendered prompt.
+    """
+    cache = _render_cache
+    if cache is None:
+        return await _run_render(template_name, version, kwargs)
+
+    resolved = await resolve_template_version_async(template_name, version)
+    key = (template_name, resolved, hash_template_arguments(kwargs))
+    text = cache.get(key)
+    if text is None:
+        text = await _run_render(template_name, resolved, kwargs)
+        cache.put(key, text)
+    return text
+
+
+# Maximum number of body bytes downloaded by the fetch tools (0 disables the cap)
+_fetch_max_bytes: int = 5 * 1024 * 1024
+
+
+def configure_fetch_max_bytes(max_bytes: int) -> None:
+    """
+    Set the default download budget of the fetch tools.
+
+    Args:
+        max_bytes: The maximum number of body bytes to download. 0 disables the cap.
+    """
+    global _fetch_max_bytes
+
+    _fetch_max_bytes = max_bytes
+
+
+# Output formats of the fetch tools: the page as served, or extracted content
+FETCH_FORMATS = ("raw", *EXTRACT_FORMATS)
+
+# Default output format of the fetch tools
+_fetch_format: str = "raw"
+
+
+def configure_fetch_format(output_format: str) -> None:
+    """
+    Set the default output format of the fetch tools.
+
+    Args:
+        output_format: "raw" for the page as served, or "text" or "markdown"
+            for the content extracted from HTML pages.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    global _fetch_format
+
+    if output_format not in FETCH_FORMATS:
+        raise ValueError(f"Unknown fetch format: {output_format}")
+
+    _fetch_format = output_format
+
+
+def _response_text(
+    response: httpx.Response, max_bytes: int | None, text: str | None = None
+) -> str:
+    """
+    Get the text of a fetched page, marking pages that were cut off.
+
+    Args:
+        response: The response returned by cached_get.
+        max_bytes: The byte budget the page was fetched with.
+        text: Optional text extracted from the page. Defaults to the body.
+
+    Returns:
+        str: The page text, followed by a truncation marker if it was cut off.
+    """
+    body = response.text if text is None else text
+    if is_truncated(response):
+        body += f"\n\n[Content truncated after {max_bytes} bytes]"
+    return body
+
+
+def _chunk_text(text: str, chunk_size: int | None) -> list[types.TextContent]:
+    """
+    Split text into TextContent parts of at most chunk_size characters.
+
+    Args:
+        text: The text to split.
+        chunk_size: The maximum part size. None returns a single part.
+
+    Returns:
+        list[types.TextContent]: The parts, or an error if chunk_size is
+        smaller than 1.
+    """
+    if chunk_size is not None and chunk_size < 1:
         return [
             types.TextContent(
                 type="text",
-                text=(
-                    f"Error: HTTP {e.response.status_code} "
-                    "error while fetching the website."
-                ),
+                text=f"Error: 'chunk_size' must be at least 1, got {chunk_size}",
             )
         ]
+    if chunk_size is None or len(text) <= chunk_size:
+        return [types.TextContent(type="text", text=text)]
+    return [
+        types.TextContent(type="text", text=text[i : i + chunk_size])
+        for i in range(0, len(text), chunk_size)
+    ]
+
+
+def serialize_content(content_list):
+    return [{"type": content.type, "text": content.text} for content in content_list]
+
+
+# Headers sent with every fetch
+_FETCH_HEADERS = {
+    "User-Agent": "MCP Test Server (github.com/modelcontextprotocol/python-sdk)"
+}
+
+
+def _is_html(response: httpx.Response) -> bool:
+    """
+    Check whether a fetched page is HTML.
+
+    Args:
+        response: The response.
+
+    Returns:
+        bool: Whether the content type is HTML, or missing and the body looks
+        like markup.
+    """
+    content_type = response.headers.get("content-type")
+    if content_type:
+        return "html" in content_type.lower()
+    return response.content.lstrip()[:1] == b"<"
+
+
+# Page fetches in flight, by URL, byte budget and output format
+_page_fetches: SingleFlight[tuple, tuple[httpx.Response, str]] = SingleFlight()
+
+
+async def _fetch_page(
+    client: httpx.AsyncClient,
+    url: str,
+    max_bytes: int | None,
+    output_format: str = "raw",
+) -> tuple[httpx.Response, str]:
+    """
+    Fetch a page, streaming at most max_bytes of its body.
+
+    For the text and markdown formats the content is extracted from HTML
+    pages while the body downloads. Other pages are returned as served.
+
+    Concurrent fetches of the same page with the same budget and format share
+    one download and extraction.
+
+    Args:
+        client: The HTTP client to fetch with.
+        url: The URL to fetch.
+        max_bytes: Optional download budget in bytes.
+        output_format: "raw", "text" or "markdown".
+
+    Returns:
+        tuple[httpx.Response, str]: The successful response and the page text,
+        followed by a truncation marker if it was cut off.
+
+    Raises:
+        httpx.HTTPStatusError: If the server answered with an error status.
+    """
+    return await _page_fetches.do(
+        (url, max_bytes, output_format),
+        _download_page,
+        client,
+        url,
+        max_bytes,
+        output_format,
+    )
+
+
+async def _download_page(
+    client: httpx.AsyncClient,
+    url: str,
+    max_bytes: int | None,
+    output_format: str,
+) -> tuple[httpx.Response, str]:
+    """
+    Download a page and extract its content, for _fetch_page.
+
+    Args:
+        client: The HTTP client to fetch with.
+        url: The URL to fetch.
+        max_bytes: Optional download budget in bytes.
+        output_format: "raw", "text" or "markdown".
+
+    Returns:
+        tuple[httpx.Response, str]: See _fetch_page.
+    """
+    extractor = ContentExtractor(output_format) if output_format != "raw" else None
+    response = await cached_get(
+        client,
+        url,
+        headers=_FETCH_HEADERS,
+        max_bytes=max_bytes,
+        on_text=extractor.feed if extractor is not None else None,
+    )
+    response.raise_for_status()
+
+    text = None
+    if extractor is not None and _is_html(response):
+        text = extractor.result()
+    return response, _response_text(response, max_bytes, text)
+
+
+def _format_error(output_format: str | None) -> str | None:
+    """
+    Check the output format argument of a fetch tool.
+
+    Args:
+        output_format: The requested format, or None for the default.
+
+    Returns:
+        str | None: The error message if the format is unknown, otherwise None.
+    """
+    if output_format is None or output_format in FETCH_FORMATS:
+        return None
+    return f"Error: Unknown format '{output_format}', use one of {FETCH_FORMATS}"
+
+
+def _fetch_error_text(error: Exception) -> str:
+    """
+    Describe a failed fetch.
+
+    Args:
+        error: The exception raised by the fetch.
+
+    Returns:
+        str: The error message returned by the fetch tools.
+    """
+    if isinstance(error, (httpx.TimeoutException, TimeoutError)):
+        return "Error: Request timed out while trying to fetch the website."
+    if isinstance(error, httpx.HTTPStatusError):
+        return (
+            f"Error: HTTP {error.response.status_code} "
+            "error while fetching the website."
+        )
+    return f"Error: Failed to fetch website: {str(error)}"
+
+
+async def fetch_website(
+    url: str,
+    max_bytes: int | None = None,
+    chunk_size: int | None = None,
+    format: str | None = None,
+) -> ToolResult:
+    """
+    Fetch a website, streaming at most max_bytes of its body.
+
+    Args:
+        url: The URL to fetch.
+        max_bytes: Optional download budget in bytes. Defaults to --fetch-max-bytes.
+        chunk_size: Optional maximum number of characters per returned part.
+        format: Optional output format, "raw", "text" or "markdown". Defaults
+            to --fetch-format.
+
+    Returns:
+        A list of TextContent parts with the page content.
+    """
+    error = _format_error(format)
+    if error is not None:
+        return [types.TextContent(type="text", text=error)]
+
+    max_bytes = max_bytes or _fetch_max_bytes or None
+    try:
+        async with http_client() as client:
+            _, text = await _fetch_page(client, url, max_bytes, format or _fetch_format)
+            return _chunk_text(text, chunk_size)
+    except Exception as e:
+        return [types.TextContent(type="text", text=_fetch_error_text(e))]
+
+
+# Maximum number of URLs accepted by one mcp_fetch_many call
+_fetch_many_max_urls: int = 50
+
+
+def configure_fetch_many(max_urls: int = 50) -> None:
+    """
+    Set the maximum number of URLs of one mcp_fetch_many call.
+
+    Args:
+        max_urls: The maximum number of URLs.
+
+    Raises:
+        ValueError: If max_urls is smaller than 1.
+    """
+    global _fetch_many_max_urls
+
+    if max_urls < 1:
+        raise ValueError(f"URL limit must be at least 1, got {max_urls}")
+
+    _fetch_many_max_urls = max_urls
+
+
+async def _fetch_status(
+    client: httpx.AsyncClient,
+    url: str,
+    max_bytes: int | None,
+    timeout: float | None,
+    output_format: str,
+) -> tuple[str, str]:
+    """
+    Fetch one URL of mcp_fetch_many under the fetch limits.
+
+    Args:
+        client: The HTTP client to fetch with.
+        url: The URL to fetch.
+        max_bytes: Optional download budget in bytes.
+        timeout: Optional number of seconds the request may take, not counting
+            the wait for a fetch slot.
+        output_format: "raw", "text" or "markdown".
+
+    Returns:
+        tuple[str, str]: The status ("200", "404", "timeout" or "error") and
+        the page text or error message.
+    """
+    try:
+        async with fetch_slot(url):
+            with anyio.fail_after(timeout):
+                response, text = await _fetch_page(
+                    client, url, max_bytes, output_format
+                )
+        return str(response.status_code), text
     except Exception as e:
+        if isinstance(e, (httpx.TimeoutException, TimeoutError)):
+            status = "timeout"
+        elif isinstance(e, httpx.HTTPStatusError):
+            status = str(e.response.status_code)
+        else:
+            status = "error"
+        return status, _fetch_error_text(e)
+
+
+async def fetch_many(
+    urls: list,
+    max_bytes: int | None = None,
+    timeout: float | None = None,
+    format: str | None = None,
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Fetch several websites concurrently over the shared HTTP client.
+
+    The fetches run under the global and per-host concurrency caps and the
+    per-host rate limit of fetch_limits. A failing URL does not affect the
+    others.
+
+    Args:
+        urls: The URLs to fetch.
+        max_bytes: Optional download budget in bytes per URL. Defaults to
+            --fetch-max-bytes.
+        timeout: Optional number of seconds each request may take.
+        format: Optional output format, "raw", "text" or "markdown". Defaults
+            to --fetch-format.
+
+    Returns:
+        One TextContent per URL, in the order of the URLs, starting with the
+        URL and the status of its fetch.
+    """
+    if not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+        return [types.TextContent(type="text", text="Error: 'urls' must be a list")]
+    if len(urls) > _fetch_many_max_urls:
         return [
             types.TextContent(
-                type="text", text=f"Error: Failed to fetch website: {str(e)}"
+                type="text",
+                text=f"Error: Too many URLs: {len(urls)} > {_fetch_many_max_urls}",
             )
         ]
 
+    error = _format_error(format)
+    if error is not None:
+        return [types.TextContent(type="text", text=error)]
+
+    max_bytes = max_bytes or _fetch_max_bytes or None
+    output_format = format or _fetch_format
+    results: list[tuple[str, str]] = [("", "") for _ in urls]
+
+    async def run(index: int, url: str) -> None:
+        results[index] = await _fetch_status(
+            client, url, max_bytes, timeout, output_format
+        )
+
+    async with http_client() as client:
+        async with anyio.create_task_group() as tg:
+            for index, url in enumerate(urls):
+                tg.start_soon(run, index, url)
+
+    return [
+        types.TextContent(type="text", text=f"URL: {url}\nStatus: {status}\n\n{text}")
+        for url, (status, text) in zip(urls, results)
+    ]
+
 
 async def check_mood(
     question: str,
@@ -63,26 +578,53 @@ async def check_mood(
     return [types.TextContent(type="text", text=msg)]
 
 
+# Headers sent with the Railway docs fetches
+_RAILWAY_HEADERS = {
+    "User-Agent": "MCP Railway Docs Fetcher (github.com/modelcontextprotocol/python-sdk)"
+}
+
+
+async def _fetch_railway_page(url: str) -> tuple[str, bool]:
+    """
+    Fetch a Railway docs page for the docs cache.
+
+    The page bypasses the response cache, as the docs cache keeps it.
+
+    Args:
+        url: The URL of the page.
+
+    Returns:
+        tuple[str, bool]: The page text and whether it was truncated.
+
+    Raises:
+        httpx.HTTPError: If the page could not be fetched.
+    """
+    async with http_client() as client:
+        response = await cached_get(
+            client,
+            url,
+            headers=_RAILWAY_HEADERS,
+            max_bytes=_fetch_max_bytes or None,
+            use_cache=False,
+        )
+        response.raise_for_status()
+        return response.text, is_truncated(response)
+
+
 async def fetch_railway_docs(
     url: str = "https://docs.railway.app/guides/cli",
 ) -> list[types.TextContent]:
     """
     Fetch the most recent Railway CLI documentation.
     """
-    headers = {
-        "User-Agent": "MCP Railway Docs Fetcher (github.com/modelcontextprotocol/python-sdk)"
-    }
-
     try:
-        timeout = httpx.Timeout(10.0, connect=5.0)
-        async with httpx.AsyncClient(
-            follow_redirects=True, headers=headers, timeout=timeout
-        ) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-
-            # Optionally, parse specific sections of the docs here
-            return [types.TextContent(type="text", text=response.text)]
+        page = await get_docs_page(url, _fetch_railway_page)
+
+        # Optionally, parse specific sections of the docs here
+        text = page.text
+        if page.truncated:
+            text += f"\n\n[Content truncated after {_fetch_max_bytes} bytes]"
+        return [types.TextContent(type="text", text=text)]
     except httpx.TimeoutException:
         return [
             types.TextContent(
@@ -108,73 +650,22 @@ async def fetch_railway_docs(
 async def fetch_railway_docs_optimized(
     url: str = "https://docs.railway.app/guides/cli",
 ) -> list[types.TextContent]:
-    headers = {
-        "User-Agent": "MCP Railway Docs Fetcher (github.com/modelcontextprotocol/python-sdk)"
-    }
-
     try:
-        timeout = httpx.Timeout(10.0, connect=5.0)
-        async with httpx.AsyncClient(
-            follow_redirects=True, headers=headers, timeout=timeout
-        ) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-
-            # Parse HTML content
-            soup = BeautifulSoup(response.text, "html.parser")
-            content = []
-
-            # Try to find any command sections
-            for heading in soup.find_all(["h1", "h2", "h3", "h4"]):
-                heading_text = heading.get_text(strip=True).lower()
-                if any(
-                    keyword in heading_text for keyword in ["command", "cli", "usage"]
-                ):
-                    # Look for the next element that might contain commands
-                    next_elem = heading.find_next_sibling()
-                    while next_elem and next_elem.name not in [
-                        "ul",
-                        "ol",
-                        "h1",
-                        "h2",
-                        "h3",
-                        "h4",
-                    ]:
-                        next_elem = next_elem.find_next_sibling()
-
-                    if next_elem and next_elem.name in ["ul", "ol"]:
-                        commands = []
-                        for li in next_elem.find_all("li"):
-                            cmd_text = li.get_text(strip=True)
-                            if cmd_text:  # Only add non-empty commands
-                                commands.append(cmd_text)
-
-                        if commands:  # Only add sections that have commands
-                            content.append(f"\n{heading.get_text(strip=True)}:")
-                            content.extend(f"- {cmd}" for cmd in commands)
-
-            if content:
-                return [types.TextContent(type="text", text="\n".join(content))]
-
-            # If we couldn't find any command sections, try to extract any code blocks
-            code_blocks = soup.find_all(["pre", "code"])
-            if code_blocks:
-                content = ["Railway CLI Commands:"]
-                for block in code_blocks:
-                    code_text = block.get_text(strip=True)
-                    if code_text and any(
-                        keyword in code_text.lower() for keyword in ["railway", "cli"]
-                    ):
-                        content.append(code_text)
-                return [types.TextContent(type="text", text="\n".join(content))]
-
-            # If still nothing found, return a more helpful message
-            return [
-                types.TextContent(
-                    type="text",
-                    text="Could not find any CLI commands in the documentation. The page structure might have changed.",
-                )
-            ]
+        page = await get_docs_page(url, _fetch_railway_page)
+
+        # Extract the command sections with the configured parser backend,
+        # once per version of the page
+        commands = await extract_docs_page(page, "commands", extract_railway_commands)
+        if commands is not None:
+            return [types.TextContent(type="text", text=commands)]
+
+        # If still nothing found, return a more helpful message
+        return [
+            types.TextContent(
+                type="text",
+                text="Could not find any CLI commands in the documentation. The page structure might have changed.",
+            )
+        ]
     except Exception as e:
         return [
             types.TextContent(
@@ -201,9 +692,9 @@ async def apply_prompt_initial(
         A list containing a TextContent object with the prompt.
     """
     # Render the prompt template with the objective and specific instructions
-    response_text = render_prompt_template(
+    response_text = await _render_prompt(
         "init",
-        version_str=version,
+        version=version,
         objective=objective,
         specific_instructions=specific_instructions,
     )
@@ -227,9 +718,9 @@ async def apply_prompt_proceed(
         A list containing a TextContent object with the prompt.
     """
     # Render the prompt template with the task description and specific instructions
-    response_text = render_prompt_template(
+    response_text = await _render_prompt(
         "proceed",
-        version_str=version,
+        version=version,
         task=task,
         specific_instructions=specific_instructions,
     )
@@ -253,9 +744,9 @@ async def apply_prompt_change(
         A list containing a TextContent object with the prompt.
     """
     # Render the prompt template with the change request and specific instructions
-    response_text = render_prompt_template(
+    response_text = await _render_prompt(
         "change",
-        version_str=version,
+        version=version,
         change_request=change_request,
         specific_instructions=specific_instructions,
     )
@@ -279,9 +770,9 @@ async def apply_prompt_fix(
         A list containing a TextContent object with the prompt.
     """
     # Render the prompt template with the issue and specific instructions
-    response_text = render_prompt_template(
+    response_text = await _render_prompt(
         "fix_general",
-        version_str=version,
+        version=version,
         issue=issue,
         specific_instructions=specific_instructions,
     )
@@ -305,9 +796,9 @@ async def apply_prompt_fix_linter(
         A list containing a TextContent object with the prompt.
     """
     # Render the prompt template with the issue and specific instructions
-    response_text = render_prompt_template(
+    response_text = await _render_prompt(
         "fix_linter",
-        version_str=version,
+        version=version,
         issue=issue,
         specific_instructions=specific_instructions,
     )
@@ -331,9 +822,9 @@ async def apply_prompt_unit_tests(
         A list containing a TextContent object with the prompt.
     """
     # Render the prompt template with the code to test and specific instructions
-    response_text = render_prompt_template(
+    response_text = await _render_prompt(
         "test",
-        version_str=version,
+        version=version,
         code_to_test=code_to_test,
         specific_instructions=specific_instructions,
     )
@@ -357,9 +848,9 @@ async def apply_prompt_infra(
         A list containing a TextContent object with the prompt.
     """
     # Render the prompt template with the infrastructure info and specific instructions
-    response_text = render_prompt_template(
+    response_text = await _render_prompt(
         "infra",
-        version_str=version,
+        version=version,
         objective=infrastructure_info,
         specific_instructions=specific_instructions,
     )
@@ -383,453 +874,934 @@ async def apply_prompt_docker(
         A list containing a TextContent object with the prompt.
     """
     # Render the prompt template with the containerization objective and specific instructions
-    response_text = render_prompt_template(
+    response_text = await _render_prompt(
         "docker",
-        version_str=version,
+        version=version,
         objective=containerization_objective,
         specific_instructions=specific_instructions,
     )
     return [types.TextContent(type="text", text=response_text)]
 
 
-@click.command()
-@click.option("--port", default=8000, help="Port to listen on for SSE")
-@click.option(
-    "--transport",
-    type=click.Choice(["stdio", "sse"]),
-    default="stdio",
-    help="Transport type",
+_MOOD_DESCRIPTION = (
+    "Ask this MCP server about its mood! You can phrase your question "
+    "in any way you like - 'How are you?', 'What's your mood?', or even "
+    "'Are you having a good day?'. The server will always respond with "
+    "a cheerful message and a heart ❤️"
 )
-def main(port: int, transport: str) -> int:
-    app = Server("mcp-website-fetcher")
 
-    mood_description: str = (
-        "Ask this MCP server about its mood! You can phrase your question "
-        "in any way you like - 'How are you?', 'What's your mood?', or even "
-        "'Are you having a good day?'. The server will always respond with "
-        "a cheerful message and a heart ❤️"
-    )
+_RAILWAY_DOCS_DESCRIPTION = (
+    "Fetches the most recent Railway CLI documentation. "
+    "Optionally, provide a custom URL."
+)
 
-    @app.call_tool()
-    async def fetch_tool(  # type: ignore[unused-function]
-        name: str, arguments: dict
-    ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-        if name == "mcp_fetch":
-            if "url" not in arguments:
-                return [
-                    types.TextContent(
-                        type="text", text="Error: Missing required argument 'url'"
-                    )
-                ]
-            return await fetch_website(arguments["url"])
-        elif name == "mood":
-            if "question" not in arguments:
-                return [
-                    types.TextContent(
-                        type="text", text="Error: Missing required argument 'question'"
-                    )
-                ]
-            return await check_mood(arguments["question"])
-        if name == "fetch_railway_docs":
-            url = arguments.get("url", "https://docs.railway.app/guides/cli")
-            return await fetch_railway_docs(url)
-        if name == "fetch_railway_docs_optimized":
-            url = arguments.get("url", "https://docs.railway.app/guides/cli")
-            return await fetch_railway_docs_optimized(url)
-        elif name == "apply_prompt_fix":
-            if "issue" not in arguments:
-                return [
-                    types.TextContent(
-                        type="text", text="Error: Missing required argument 'issue'"
-                    )
-                ]
-            version = arguments.get("version", "latest")
-            specific_instructions = arguments.get("specific_instructions", "")
-            return await apply_prompt_fix(
-                issue=arguments["issue"],
-                specific_instructions=specific_instructions,
-                version=version,
-            )
-        elif name == "apply_prompt_initial":
-            if "objective" not in arguments:
-                return [
-                    types.TextContent(
-                        type="text", text="Error: Missing required argument 'objective'"
-                    )
-                ]
-            version = arguments.get("version", "latest")
-            specific_instructions = arguments.get("specific_instructions", "")
-            return await apply_prompt_initial(
-                objective=arguments["objective"],
-                specific_instructions=specific_instructions,
-                version=version,
-            )
-        elif name == "apply_prompt_proceed":
-            if "task" not in arguments:
-                return [
-                    types.TextContent(
-                        type="text", text="Error: Missing required argument 'task'"
-                    )
-                ]
-            version = arguments.get("version", "latest")
-            specific_instructions = arguments.get("specific_instructions", "")
-            return await apply_prompt_proceed(
-                arguments["task"],
-                specific_instructions=specific_instructions,
-                version=version,
-            )
-        elif name == "apply_prompt_change":
-            if "change_request" not in arguments:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text="Error: Missing required argument 'change_request'",
-                    )
-                ]
-            version = arguments.get("version", "latest")
-            specific_instructions = arguments.get("specific_instructions", "")
-            return await apply_prompt_change(
-                change_request=arguments["change_request"],
-                specific_instructions=specific_instructions,
-                version=version,
-            )
-        elif name == "apply_prompt_fix_linter":
-            if "issue" not in arguments:
-                return [
-                    types.TextContent(
-                        type="text", text="Error: Missing required argument 'issue'"
-                    )
-                ]
-            version = arguments.get("version", "latest")
-            specific_instructions = arguments.get("specific_instructions", "")
-            return await apply_prompt_fix_linter(
-                issue=arguments["issue"],
-                specific_instructions=specific_instructions,
-                version=version,
-            )
-        elif name == "apply_prompt_unit_tests":
-            if "code_to_test" not in arguments:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text="Error: Missing required argument 'code_to_test'",
-                    )
-                ]
-            version = arguments.get("version", "latest")
-            specific_instructions = arguments.get("specific_instructions", "")
-            return await apply_prompt_unit_tests(
-                code_to_test=arguments["code_to_test"],
-                specific_instructions=specific_instructions,
-                version=version,
-            )
-        elif name == "apply_prompt_infra":
-            if "infrastructure_info" not in arguments:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text="Error: Missing required argument 'infrastructure_info'",
-                    )
-                ]
-            version = arguments.get("version", "latest")
-            specific_instructions = arguments.get("specific_instructions", "")
-            return await apply_prompt_infra(
-                infrastructure_info=arguments["infrastructure_info"],
-                specific_instructions=specific_instructions,
-                version=version,
-            )
-        elif name == "apply_prompt_docker":
-            if "containerization_objective" not in arguments:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text="Error: Missing required argument 'containerization_objective'",
-                    )
-                ]
-            version = arguments.get("version", "latest")
-            specific_instructions = arguments.get("specific_instructions", "")
-            return await apply_prompt_docker(
-                containerization_objective=arguments["containerization_objective"],
-                specific_instructions=specific_instructions,
-                version=version,
-            )
-        else:
-            return [types.TextContent(type="text", text=f"Error: Unknown tool: {name}")]
+_RAILWAY_DOCS_PROPERTIES = {
+    "url": {
+        "type": "string",
+        "description": "Optional custom URL for fetching Railway CLI docs.",
+    },
+}
+
+
+def _prompt_properties(
+    argument: str,
+    description: str,
+    instructions_description: str = (
+        "Optional specific instructions to include in the prompt"
+    ),
+) -> dict:
+    """
+    Build the schema properties of an apply_prompt_* tool.
 
-    @app.list_tools()
-    async def list_tools() -> list[types.Tool]:  # type: ignore[unused-function]
-        return [
-            types.Tool(
-                name="mcp_fetch",
-                description="Fetches a website and returns its content",
-                inputSchema={
-                    "type": "object",
-                    "required": ["url"],
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "URL to fetch",
-                        }
-                    },
-                },
-            ),
-            types.Tool(
-                name="mood",
-                description="Ask the server about its mood - it's always happy!",
-                inputSchema={
-                    "type": "object",
-                    "required": ["question"],
-                    "properties": {
-                        "question": {
-                            "type": "string",
-                            "description": mood_description,
-                        }
-                    },
-                },
-            ),
-            types.Tool(
-                name="fetch_railway_docs",
-                description="Fetches the most recent Railway CLI documentation. Optionally, provide a custom URL.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "Optional custom URL for fetching Railway CLI docs.",
-                        },
-                    },
-                },
-            ),
-            types.Tool(
-                name="fetch_railway_docs_optimized",
-                description="Fetches the most recent Railway CLI documentation. Optionally, provide a custom URL.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "Optional custom URL for fetching Railway CLI docs.",
-                        },
-                    },
-                },
-            ),
-            types.Tool(
-                name="apply_prompt_fix",
-                description="Provides a prompt for performing root cause analysis and fixing issues",
-                inputSchema={
-                    "type": "object",
-                    "required": ["issue"],
-                    "properties": {
-                        "issue": {
-                            "type": "string",
-                            "description": "A description of the issue to be analyzed and fixed",
-                        },
-                        "specific_instructions": {
-                            "type": "string",
-                            "description": "Optional specific instructions to include in the prompt",
-                        },
-                        "version": {
-                            "type": "string",
-                            "description": "The version of the prompt template to use (e.g., '1.0.0', '1.1.0', or 'latest')",
-                        },
-                    },
-                },
-            ),
-            types.Tool(
-                name="apply_prompt_initial",
-                description="Provides an initial prompt template for starting a new project",
-                inputSchema={
-                    "type": "object",
-                    "required": ["objective"],
-                    "properties": {
-                        "objective": {
-                            "type": "string",
-                            "description": "A description of the objective of the project",
-                        },
-                        "specific_instructions": {
-                            "type": "string",
-                            "description": "Optional specific instructions to include in the prompt",
-                        },
-                        "version": {
-                            "type": "string",
-                            "description": "The version of the prompt template to use (e.g., '1.0.0', '1.1.0', or 'latest')",
-                        },
-                    },
-                },
-            ),
-            types.Tool(
-                name="apply_prompt_proceed",
-                description="Provides a prompt template for proceeding with a task or project",
-                inputSchema={
-                    "type": "object",
-                    "required": ["task"],
-                    "properties": {
-                        "task": {
-                            "type": "string",
-                            "description": "A description of the task or project to proceed with",
-                        },
-                        "specific_instructions": {
-                            "type": "string",
-                            "description": "Optional specific instructions to include in the prompt",
-                        },
-                        "version": {
-                            "type": "string",
-                            "description": "The version of the prompt template to use (e.g., '1.0.0', '1.1.0', or 'latest')",
-                        },
-                    },
-                },
+    Args:
+        argument: The name of the required argument of the tool.
+        description: The description of the required argument.
+        instructions_description: The description of specific_instructions.
+
+    Returns:
+        dict: The schema of each argument, by argument name.
+    """
+    return {
+        argument: {"type": "string", "description": description},
+        "specific_instructions": {
+            "type": "string",
+            "description": instructions_description,
+        },
+        "version": {
+            "type": "string",
+            "description": (
+                "The version of the prompt template to use "
+                "(e.g., '1.0.0', '1.1.0', or 'latest')"
             ),
-            types.Tool(
-                name="apply_prompt_change",
-                description="Provides a prompt for systematically handling change requests",
-                inputSchema={
-                    "type": "object",
-                    "required": ["change_request"],
-                    "properties": {
-                        "change_request": {
-                            "type": "string",
-                            "description": "Description of the change request to implement",
-                        },
-                        "specific_instructions": {
-                            "type": "string",
-                            "description": "Optional specific instructions to include in the prompt",
-                        },
-                        "version": {
-                            "type": "string",
-                            "description": "The version of the prompt template to use (e.g., '1.0.0', '1.1.0', or 'latest')",
-                        },
-                    },
-                },
+        },
+    }
+
+
+# The tools served by the server. tools/list returns the prebuilt definitions
+# and tool calls are dispatched by name.
+TOOLS = ToolRegistry()
+
+TOOLS.register(
+    "mcp_fetch",
+    fetch_website,
+    "Fetches a website and returns its content",
+    {
+        "url": {"type": "string", "description": "URL to fetch"},
+        "max_bytes": {
+            "type": "integer",
+            "minimum": 0,
+            "description": (
+                "Optional maximum number of bytes to download; "
+                "longer pages are truncated"
             ),
-            types.Tool(
-                name="apply_prompt_fix_linter",
-                description="Provides a prompt for analyzing and fixing linter errors",
-                inputSchema={
-                    "type": "object",
-                    "required": ["issue"],
-                    "properties": {
-                        "issue": {
-                            "type": "string",
-                            "description": "A description of the linter errors to be analyzed and fixed",
-                        },
-                        "specific_instructions": {
-                            "type": "string",
-                            "description": "Optional specific instructions to include in the prompt",
-                        },
-                        "version": {
-                            "type": "string",
-                            "description": "The version of the prompt template to use (e.g., '1.0.0', '1.1.0', or 'latest')",
-                        },
-                    },
-                },
+        },
+        "chunk_size": {
+            "type": "integer",
+            "minimum": 1,
+            "description": (
+                "Optional maximum number of characters per returned content part"
             ),
-            types.Tool(
-                name="apply_prompt_unit_tests",
-                description="Provides a prompt for generating unit tests for code",
-                inputSchema={
-                    "type": "object",
-                    "required": ["code_to_test"],
-                    "properties": {
-                        "code_to_test": {
-                            "type": "string",
-                            "description": "The code that needs unit tests",
-                        },
-                        "specific_instructions": {
-                            "type": "string",
-                            "description": "Optional specific instructions to include in the prompt",
-                        },
-                        "version": {
-                            "type": "string",
-                            "description": "The version of the prompt template to use (e.g., '1.0.0', '1.1.0', or 'latest')",
-                        },
-                    },
-                },
+        },
+        "format": {
+            "type": "string",
+            "enum": list(FETCH_FORMATS),
+            "description": (
+                "Optional output format: 'raw' for the page as served, or "
+                "'text' or 'markdown' for the content extracted from HTML"
             ),
-            types.Tool(
-                name="apply_prompt_infra",
-                description="Provides a prompt template for laying out system infrastructure and tool stack information",
-                inputSchema={
-                    "type": "object",
-                    "required": ["infrastructure_info"],
-                    "properties": {
-                        "infrastructure_info": {
-                            "type": "string",
-                            "description": "Description of the infrastructure and tool stack",
-                        },
-                        "specific_instructions": {
-                            "type": "string",
-                            "description": "Optional specific instructions to include in the prompt",
-                        },
-                        "version": {
-                            "type": "string",
-                            "description": "The version of the prompt template to use (e.g., '1.0.0', '1.1.0', or 'latest')",
-                        },
-                    },
-                },
+        },
+    },
+    required=["url"],
+)
+TOOLS.register(
+    "mcp_fetch_many",
+    fetch_many,
+    "Fetches several websites concurrently and returns the content and status "
+    "of each, in order",
+    {
+        "urls": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "URLs to fetch",
+        },
+        "max_bytes": {
+            "type": "integer",
+            "minimum": 0,
+            "description": (
+                "Optional maximum number of bytes to download per URL; "
+                "longer pages are truncated"
             ),
-            types.Tool(
-                name="apply_prompt_docker",
-                description="Provides a prompt template for Docker container configurations and orchestration",
-                inputSchema={
-                    "type": "object",
-                    "required": ["containerization_objective"],
-                    "properties": {
-                        "containerization_objective": {
-                            "type": "string",
-                            "description": "Description of the containerization objective",
-                        },
-                        "specific_instructions": {
-                            "type": "string",
-                            "description": "Optional specific instructions about containerization requirements",
-                        },
-                        "version": {
-                            "type": "string",
-                            "description": "The version of the prompt template to use (e.g., '1.0.0', '1.1.0', or 'latest')",
-                        },
-                    },
-                },
+        },
+        "timeout": {
+            "type": "number",
+            "description": "Optional number of seconds each request may take",
+        },
+        "format": {
+            "type": "string",
+            "enum": list(FETCH_FORMATS),
+            "description": (
+                "Optional output format: 'raw' for the page as served, or "
+                "'text' or 'markdown' for the content extracted from HTML"
             ),
-        ]
+        },
+    },
+    required=["urls"],
+)
+TOOLS.register(
+    "mood",
+    check_mood,
+    "Ask the server about its mood - it's always happy!",
+    {"question": {"type": "string", "description": _MOOD_DESCRIPTION}},
+    required=["question"],
+)
+TOOLS.register(
+    "fetch_railway_docs",
+    fetch_railway_docs,
+    _RAILWAY_DOCS_DESCRIPTION,
+    _RAILWAY_DOCS_PROPERTIES,
+)
+TOOLS.register(
+    "fetch_railway_docs_optimized",
+    fetch_railway_docs_optimized,
+    _RAILWAY_DOCS_DESCRIPTION,
+    _RAILWAY_DOCS_PROPERTIES,
+)
+TOOLS.register(
+    "apply_prompt_fix",
+    apply_prompt_fix,
+    "Provides a prompt for performing root cause analysis and fixing issues",
+    _prompt_properties("issue", "A description of the issue to be analyzed and fixed"),
+    required=["issue"],
+)
+TOOLS.register(
+    "apply_prompt_initial",
+    apply_prompt_initial,
+    "Provides an initial prompt template for starting a new project",
+    _prompt_properties("objective", "A description of the objective of the project"),
+    required=["objective"],
+)
+TOOLS.register(
+    "apply_prompt_proceed",
+    apply_prompt_proceed,
+    "Provides a prompt template for proceeding with a task or project",
+    _prompt_properties("task", "A description of the task or project to proceed with"),
+    required=["task"],
+)
+TOOLS.register(
+    "apply_prompt_change",
+    apply_prompt_change,
+    "Provides a prompt for systematically handling change requests",
+    _prompt_properties(
+        "change_request", "Description of the change request to implement"
+    ),
+    required=["change_request"],
+)
+TOOLS.register(
+    "apply_prompt_fix_linter",
+    apply_prompt_fix_linter,
+    "Provides a prompt for analyzing and fixing linter errors",
+    _prompt_properties(
+        "issue", "A description of the linter errors to be analyzed and fixed"
+    ),
+    required=["issue"],
+)
+TOOLS.register(
+    "apply_prompt_unit_tests",
+    apply_prompt_unit_tests,
+    "Provides a prompt for generating unit tests for code",
+    _prompt_properties("code_to_test", "The code that needs unit tests"),
+    required=["code_to_test"],
+)
+TOOLS.register(
+    "apply_prompt_infra",
+    apply_prompt_infra,
+    "Provides a prompt template for laying out system infrastructure and "
+    "tool stack information",
+    _prompt_properties(
+        "infrastructure_info", "Description of the infrastructure and tool stack"
+    ),
+    required=["infrastructure_info"],
+)
+TOOLS.register(
+    "apply_prompt_docker",
+    apply_prompt_docker,
+    "Provides a prompt template for Docker container configurations and orchestration",
+    _prompt_properties(
+        "containerization_objective",
+        "Description of the containerization objective",
+        "Optional specific instructions about containerization requirements",
+    ),
+    required=["containerization_objective"],
+)
 
-    if transport == "sse":
-        from mcp.server.sse import SseServerTransport
-
-        sse = SseServerTransport("/messages/")
-
-        async def handle_sse(request):
-            if request.method == "POST":
-                data = await request.json()
-                tool_name = data.get("tool")
-                arguments = data.get("arguments", {})
-                result = await fetch_tool(tool_name, arguments)
-                return JSONResponse({"result": serialize_content(result)})
-            else:
-                async with sse.connect_sse(
-                    request.scope, request.receive, request._send
-                ) as streams:
-                    await app.run(
-                        streams[0], streams[1], app.create_initialization_options()
-                    )
-
-        starlette_app = Starlette(
-            debug=True,
-            routes=[
-                Route("/sse", endpoint=handle_sse, methods=["GET", "POST"]),
-                Mount("/messages/", app=sse.handle_post_message),
-            ],
+
+# Maximum number of tool calls of a batch request running at the same time
+_batch_concurrency: int = 16
+
+# Maximum number of tool calls accepted in one batch request
+_batch_max_calls: int = 100
+
+
+def configure_batch(concurrency: int = 16, max_calls: int = 100) -> None:
+    """
+    Configure batch tool-call requests on the SSE POST endpoint.
+
+    Args:
+        concurrency: The maximum number of calls of a batch running at the same time.
+        max_calls: The maximum number of calls accepted in one batch.
+
+    Raises:
+        ValueError: If concurrency or max_calls is smaller than 1.
+    """
+    global _batch_concurrency, _batch_max_calls
+
+    if concurrency < 1:
+        raise ValueError(f"Batch concurrency must be at least 1, got {concurrency}")
+    if max_calls < 1:
+        raise ValueError(f"Batch size must be at least 1, got {max_calls}")
+
+    _batch_concurrency = concurrency
+    _batch_max_calls = max_calls
+
+
+async def _call_tool_item(call: object) -> bytes:
+    """
+    Run one call of a batch request.
+
+    Args:
+        call: The {"tool", "arguments"} object of the call.
+
+    Returns:
+        bytes: The JSON of {"result": [...]} with the content, or of
+        {"error": "..."} if the call is malformed or the tool raised.
+    """
+    if not isinstance(call, dict) or not isinstance(call.get("tool"), str):
+        return _encode_error("Each call must be an object with a 'tool' name")
+
+    arguments = call.get("arguments", {})
+    if not isinstance(arguments, dict):
+        return _encode_error("'arguments' must be an object")
+
+    try:
+        result = await TOOLS.call(call["tool"], arguments)
+    except Exception as e:
+        return _encode_error(f"{type(e).__name__}: {e}")
+    return b'{"result":' + encode_content(result) + b"}"
+
+
+def _encode_error(message: str) -> bytes:
+    """
+    Encode the error of a batch item.
+
+    Args:
+        message: The error message.
+
+    Returns:
+        bytes: The JSON of {"error": message}.
+    """
+    return b'{"error":' + dumps(message) + b"}"
+
+
+async def call_tools_batch(calls: list) -> list[bytes]:
+    """
+    Run the calls of a batch request concurrently.
+
+    At most --batch-concurrency calls run at the same time. A failing call
+    does not affect the other calls.
+
+    Args:
+        calls: The {"tool", "arguments"} objects of the calls.
+
+    Returns:
+        list[bytes]: The JSON encoded outcome of each call, in the order of
+        the calls.
+    """
+    results: list[bytes] = [b"" for _ in calls]
+    limiter = anyio.CapacityLimiter(_batch_concurrency)
+
+    async def run(index: int, call: object) -> None:
+        async with limiter:
+            results[index] = await _call_tool_item(call)
+
+    async with anyio.create_task_group() as tg:
+        for index, call in enumerate(calls):
+            tg.start_soon(run, index, call)
+
+    return results
+
+
+async def _handle_tool_post(request) -> Response:
+    """
+    Handle a tool call posted to /sse.
+
+    The body is either a single call, {"tool": ..., "arguments": {...}}, or a
+    batch, {"calls": [{"tool": ..., "arguments": {...}}, ...]}. Batches are
+    answered with {"results": [...]}, holding {"result": [...]} or
+    {"error": "..."} for each call in order.
+
+    Args:
+        request: The Starlette request.
+
+    Returns:
+        Response: The result of the call or the results of the batch, or a
+        400 error if the body is not a valid call.
+    """
+    try:
+        data = await request.json()
+    except ValueError:
+        return JSONResponse({"error": "The body must be JSON"}, status_code=400)
+
+    if isinstance(data, dict) and "calls" in data:
+        calls = data["calls"]
+        if not isinstance(calls, list):
+            return JSONResponse({"error": "'calls' must be a list"}, status_code=400)
+        if len(calls) > _batch_max_calls:
+            return JSONResponse(
+                {"error": f"Too many calls: {len(calls)} > {_batch_max_calls}"},
+                status_code=413,
+            )
+        results = await call_tools_batch(calls)
+        return Response(
+            b'{"results":[' + b",".join(results) + b"]}",
+            media_type="application/json",
         )
 
-        import uvicorn
+    if not isinstance(data, dict) or not isinstance(data.get("tool"), str):
+        return JSONResponse(
+            {"error": "The body must be an object with a 'tool' name"},
+            status_code=400,
+        )
+    arguments = data.get("arguments", {})
+    if not isinstance(arguments, dict):
+        return JSONResponse({"error": "'arguments' must be an object"}, status_code=400)
 
-        uvicorn.run(starlette_app, host="0.0.0.0", port=port)
-    else:
-        from mcp.server.stdio import stdio_server
+    result = await TOOLS.call(data["tool"], arguments)
+    return Response(
+        b'{"result":' + encode_content(result) + b"}", media_type="application/json"
+    )
+
+
+def _collect_cache_metrics() -> list:
+    """
+    Read the statistics of the in-memory caches and the page cache.
+
+    Returns:
+        list: The cache metric families.
+    """
+    response_cache = get_response_cache()
+    docs_cache = get_docs_cache()
+    return cache_families(
+        {
+            **get_cache_info(),
+            "http": response_cache.info() if response_cache is not None else None,
+            "railway_docs": docs_cache.info() if docs_cache is not None else None,
+            "fetch_coalescing": _page_fetches.info(),
+        }
+    )
+
+
+REGISTRY.add_collector(_collect_cache_metrics)
+
+# Seconds the last template warmup took, None until a warmup finished
+_warmup_seconds: float | None = None
+
+# Number of templates compiled by the last warmup
+_warmup_templates: int = 0
+
+# Whether the SSE app finished starting up and serves requests
+_ready: bool = False
+
+
+def run_warmup() -> float:
+    """
+    Preload the template registry and read, parse and compile the latest
+    version of every template, recording how long it took.
+
+    Returns:
+        float: The number of seconds the warmup took.
+    """
+    global _warmup_seconds, _warmup_templates
+
+    start = time.perf_counter()
+    _warmup_templates = warm_template_cache()
+    _warmup_seconds = time.perf_counter() - start
+    return _warmup_seconds
+
+
+def _collect_warmup_metrics() -> list:
+    """
+    Report the duration of the template warmup.
+
+    Returns:
+        list: The warmup metric family, empty before the warmup finished.
+    """
+    if _warmup_seconds is None:
+        return []
+    return [
+        (
+            "mcp_warmup_seconds",
+            "gauge",
+            "Duration of the template warmup at startup in seconds",
+            [("mcp_warmup_seconds", (), _warmup_seconds)],
+        )
+    ]
+
+
+REGISTRY.add_collector(_collect_warmup_metrics)
+
+
+async def handle_ready(request) -> Response:
+    """
+    Report whether the process finished starting up, for readiness probes.
+
+    Args:
+        request: The Starlette request.
+
+    Returns:
+        Response: 200 once the app is ready, 503 while it starts or stops.
+    """
+    if not _ready:
+        return JSONResponse({"status": "starting"}, status_code=503)
+    return JSONResponse(
+        {
+            "status": "ready",
+            "warmup_seconds": _warmup_seconds,
+            "templates": _warmup_templates,
+        }
+    )
+
+
+async def handle_metrics(request) -> Response:
+    """
+    Serve the metrics of the process in the Prometheus text format.
+
+    Args:
+        request: The Starlette request.
+
+    Returns:
+        Response: The rendered metrics.
+    """
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
 
-        async def arun():
-            async with stdio_server() as streams:
+
+# Environment variables passing the server configuration to SSE worker processes
+_OPTIONS_ENV = "MCP_HITCHCODE_OPTIONS"
+_SOCKET_DIR_ENV = "MCP_HITCHCODE_SOCKET_DIR"
+
+
+def create_server() -> Server:
+    """
+    Create the MCP server serving the registered tools.
+
+    Returns:
+        Server: The MCP server.
+    """
+    app = Server("mcp-website-fetcher")
+
+    @app.call_tool()
+    async def fetch_tool(  # type: ignore[unused-function]
+        name: str, arguments: dict
+    ) -> ToolResult:
+        return await TOOLS.call(name, arguments)
+
+    @app.list_tools()
+    async def list_tools() -> list[types.Tool]:  # type: ignore[unused-function]
+        return TOOLS.list_tools()
+
+    return app
+
+
+def configure_server(options: dict) -> None:
+    """
+    Apply the command line options to the module-level configuration.
+
+    Args:
+        options: The parameters of main(), by name.
+    """
+    configure_http_client(
+        max_connections=options["http_max_connections"],
+        max_keepalive_connections=options["http_max_keepalive"],
+        http2=options["http2"],
+    )
+    configure_response_cache(
+        enabled=options["http_cache"], directory=options["http_cache_dir"]
+    )
+    configure_fetch_max_bytes(options["fetch_max_bytes"])
+    configure_fetch_format(options["fetch_format"])
+    configure_fetch_limits(
+        options["fetch_concurrency"],
+        options["fetch_per_host"],
+        options["fetch_rate"],
+        options["fetch_burst"],
+    )
+    configure_fetch_many(options["fetch_many_max_urls"])
+    configure_template_bundle(options["template_bundle"])
+    configure_parser_backend(options["html_parser"])
+    configure_docs_cache(
+        options["railway_docs_ttl"],
+        directory=options["railway_docs_cache_dir"],
+        offline=options["railway_docs_offline"],
+    )
+    configure_render_executor(options["render_executor"], options["render_concurrency"])
+    configure_render_cache(
+        options["render_cache_size"], ttl=options["render_cache_ttl"] or None
+    )
+    configure_batch(options["batch_concurrency"], options["batch_max_calls"])
+    configure_json_encoder(options["json_encoder"])
+
+
+def create_sse_app(
+    socket_dir: str | None = None,
+    watch_templates: bool = False,
+    watch_interval: float = 1.0,
+    debug: bool = False,
+    warmup_templates: bool = True,
+) -> Starlette:
+    """
+    Create the Starlette app serving the SSE transport.
+
+    On startup the app warms the template caches and opens the shared HTTP
+    client, so that the process is ready before it accepts its first client.
+    GET /ready answers 200 from then on until the app shuts down.
+
+    Args:
+        socket_dir: Optional directory shared by the worker processes of a
+            multi-worker server. Messages for sessions of other workers are
+            forwarded through it. Without it, all sessions live in this process.
+        watch_templates: Whether to reload prompt templates when they change.
+        watch_interval: Seconds between template checks when polling.
+        debug: Whether to return tracebacks in error responses.
+        warmup_templates: Whether to compile all templates before serving.
+
+    Returns:
+        Starlette: The ASGI app.
+    """
+    # Only needed for SSE, imported here to keep stdio startup lean
+    from mcp.server.sse import SseServerTransport
+
+    from mcp_hitchcode.session_router import MESSAGES_PATH, SessionRouter
+
+    app = create_server()
+    router = SessionRouter(socket_dir) if socket_dir else None
+    sse = router.transport if router else SseServerTransport(MESSAGES_PATH)
+
+    async def handle_sse(request):
+        if request.method == "POST":
+            return await _handle_tool_post(request)
+        else:
+            async with sse.connect_sse(
+                request.scope, request.receive, request._send
+            ) as streams:
                 await app.run(
                     streams[0], streams[1], app.create_initialization_options()
                 )
 
+    @asynccontextmanager
+    async def lifespan(_app: Starlette) -> AsyncIterator[None]:
+        global _ready
+
+        if warmup_templates:
+            seconds = await to_thread.run_sync(run_warmup)
+            click.echo(
+                f"Warmed {_warmup_templates} templates in {seconds * 1000:.1f} ms "
+                f"(pid {os.getpid()})",
+                err=True,
+            )
+        else:
+            await to_thread.run_sync(_build_version_registry)
+
+        watcher = None
+        if watch_templates:
+            from mcp_hitchcode.templates.template_watcher import TemplateWatcher
+
+            watcher = TemplateWatcher(interval=watch_interval)
+            watcher.start()
+
+        try:
+            async with (
+                http_client_lifespan(),
+                docs_refresh_lifespan(),
+                anyio.create_task_group() as tg,
+            ):
+                if router is not None:
+                    await tg.start(router.serve)
+                _ready = True
+                yield
+                _ready = False
+                tg.cancel_scope.cancel()
+        finally:
+            _ready = False
+            if watcher is not None:
+                watcher.stop()
+
+    if router is not None:
+        message_routes = router.routes()
+    else:
+        message_routes = [Mount(MESSAGES_PATH, app=sse.handle_post_message)]
+
+    return Starlette(
+        debug=debug,
+        lifespan=lifespan,
+        routes=[
+            Route("/sse", endpoint=handle_sse, methods=["GET", "POST"]),
+            Route("/metrics", endpoint=handle_metrics, methods=["GET"]),
+            Route("/ready", endpoint=handle_ready, methods=["GET"]),
+            *message_routes,
+        ],
+    )
+
+
+def _create_worker_app() -> Starlette:
+    """
+    Create the app of an SSE worker process.
+
+    uvicorn calls this in every worker it spawns. The command line options are
+    passed from main() through the environment.
+
+    Returns:
+        Starlette: The ASGI app of the worker.
+    """
+    options = json.loads(os.environ[_OPTIONS_ENV])
+    configure_server(options)
+    return create_sse_app(
+        socket_dir=os.environ[_SOCKET_DIR_ENV],
+        watch_templates=options["watch_templates"],
+        watch_interval=options["watch_interval"],
+        debug=options["debug"],
+        warmup_templates=options["warmup"],
+    )
+
+
+@click.command()
+@click.option("--port", default=8000, help="Port to listen on for SSE")
+@click.option(
+    "--transport",
+    type=click.Choice(["stdio", "sse"]),
+    default="stdio",
+    help="Transport type",
+)
+@click.option(
+    "--watch-templates",
+    is_flag=True,
+    default=False,
+    help="Reload prompt templates when files under templates/prompts/ change",
+)
+@click.option(
+    "--watch-interval",
+    default=1.0,
+    help="Seconds between template checks when polling for changes",
+)
+@click.option(
+    "--warmup/--no-warmup",
+    default=None,
+    help="Compile all prompt templates before serving "
+    "(default: on for SSE, off for stdio)",
+)
+@click.option(
+    "--template-bundle/--no-template-bundle",
+    default=True,
+    help="Load prompt templates from the precompiled bundle if one was built",
+)
+@click.option(
+    "--render-executor",
+    type=click.Choice(["inline", "thread", "process"]),
+    default="thread",
+    help="Where prompt templates are rendered (worker threads by default)",
+)
+@click.option(
+    "--render-concurrency",
+    default=8,
+    help="Maximum number of prompt renders running at the same time",
+)
+@click.option(
+    "--render-cache-size",
+    default=0,
+    help="Memory budget in bytes for caching rendered prompts (0 disables)",
+)
+@click.option(
+    "--render-cache-ttl",
+    default=0.0,
+    help="Seconds after which a cached rendered prompt expires (0 never expires)",
+)
+@click.option(
+    "--http-max-connections",
+    default=100,
+    help="Maximum number of concurrent connections of the shared HTTP client",
+)
+@click.option(
+    "--http-max-keepalive",
+    default=20,
+    help="Maximum number of idle keep-alive connections of the shared HTTP client",
+)
+@click.option(
+    "--http2",
+    is_flag=True,
+    default=False,
+    help="Negotiate HTTP/2 for fetches (requires the h2 package)",
+)
+@click.option(
+    "--http-cache/--no-http-cache",
+    default=True,
+    help="Cache fetched pages and revalidate them with conditional requests",
+)
+@click.option(
+    "--http-cache-dir",
+    default=None,
+    help="Directory for persisting cached pages across restarts",
+)
+@click.option(
+    "--fetch-max-bytes",
+    default=5 * 1024 * 1024,
+    help="Maximum number of bytes downloaded per fetch (0 disables the cap)",
+)
+@click.option(
+    "--fetch-format",
+    type=click.Choice(FETCH_FORMATS),
+    default="raw",
+    help="Default output format of the fetch tools (text and markdown extract "
+    "the content of HTML pages)",
+)
+@click.option(
+    "--fetch-concurrency",
+    default=16,
+    help="Maximum number of mcp_fetch_many requests running at the same time",
+)
+@click.option(
+    "--fetch-per-host",
+    default=4,
+    help="Maximum number of mcp_fetch_many requests per host at the same time",
+)
+@click.option(
+    "--fetch-rate",
+    default=0.0,
+    help="Requests started per second and host by mcp_fetch_many (0 disables)",
+)
+@click.option(
+    "--fetch-burst",
+    default=4,
+    help="Requests a host may receive at once before --fetch-rate applies",
+)
+@click.option(
+    "--fetch-many-max-urls",
+    default=50,
+    help="Maximum number of URLs accepted in one mcp_fetch_many call",
+)
+@click.option(
+    "--html-parser",
+    type=click.Choice(PARSER_BACKENDS),
+    default="html.parser",
+    help="HTML parser backend for extracting Railway CLI commands",
+)
+@click.option(
+    "--railway-docs-ttl",
+    default=24 * 60 * 60.0,
+    help="Seconds a cached Railway docs page is served before it is refetched "
+    "in the background (0 disables the cache)",
+)
+@click.option(
+    "--railway-docs-cache-dir",
+    default=None,
+    help="Directory for persisting cached Railway docs across restarts",
+)
+@click.option(
+    "--railway-docs-offline",
+    is_flag=True,
+    default=False,
+    help="Serve cached Railway docs without ever refetching them",
+)
+@click.option(
+    "--workers",
+    default=1,
+    help="Number of SSE worker processes sharing the port",
+)
+@click.option(
+    "--batch-concurrency",
+    default=16,
+    help="Maximum number of calls of a batch request running at the same time",
+)
+@click.option(
+    "--batch-max-calls",
+    default=100,
+    help="Maximum number of tool calls accepted in one batch request",
+)
+@click.option(
+    "--json-encoder",
+    type=click.Choice(JSON_ENCODERS),
+    default="auto",
+    help="JSON encoder for tool results posted to /sse (auto uses orjson if installed)",
+)
+@click.option(
+    "--debug",
+    is_flag=True,
+    default=False,
+    help="Return tracebacks in SSE error responses (not for production)",
+)
+def main(
+    port: int,
+    transport: str,
+    watch_templates: bool,
+    watch_interval: float,
+    warmup: bool | None,
+    template_bundle: bool,
+    render_executor: str,
+    render_concurrency: int,
+    render_cache_size: int,
+    render_cache_ttl: float,
+    http_max_connections: int,
+    http_max_keepalive: int,
+    http2: bool,
+    http_cache: bool,
+    http_cache_dir: str | None,
+    fetch_max_bytes: int,
+    fetch_format: str,
+    fetch_concurrency: int,
+    fetch_per_host: int,
+    fetch_rate: float,
+    fetch_burst: int,
+    fetch_many_max_urls: int,
+    html_parser: str,
+    railway_docs_ttl: float,
+    railway_docs_cache_dir: str | None,
+    railway_docs_offline: bool,
+    workers: int,
+    batch_concurrency: int,
+    batch_max_calls: int,
+    json_encoder: str,
+    debug: bool,
+) -> int:
+    if workers < 1:
+        raise click.BadParameter("must be at least 1", param_hint="--workers")
+
+    if warmup is None:
+        warmup = transport == "sse"
+
+    options = dict(click.get_current_context().params, warmup=warmup)
+    configure_server(options)
+
+    if transport == "sse":
+        import uvicorn
+
+        if workers == 1:
+            starlette_app = create_sse_app(
+                watch_templates=watch_templates,
+                watch_interval=watch_interval,
+                debug=debug,
+                warmup_templates=warmup,
+            )
+            uvicorn.run(starlette_app, host="0.0.0.0", port=port)
+            return 0
+
+        # Worker processes are spawned fresh, so they read their configuration
+        # and the directory of the session routing sockets from the environment
+        socket_dir = tempfile.mkdtemp(prefix="mcp-hitchcode-")
+        os.environ[_OPTIONS_ENV] = json.dumps(options)
+        os.environ[_SOCKET_DIR_ENV] = socket_dir
+        try:
+            uvicorn.run(
+                "mcp_hitchcode.server:_create_worker_app",
+                factory=True,
+                host="0.0.0.0",
+                port=port,
+                workers=workers,
+            )
+        finally:
+            shutil.rmtree(socket_dir, ignore_errors=True)
+        return 0
+
+    from mcp.server.stdio import stdio_server
+
+    if warmup:
+        seconds = run_warmup()
+        click.echo(
+            f"Warmed {_warmup_templates} templates in {seconds * 1000:.1f} ms",
+            err=True,
+        )
+    else:
+        # Scan the templates directory before serving, so that resolving versions
+        # on the event loop never walks the file system
+        _build_version_registry()
+
+    app = create_server()
+
+    watcher = None
+    if watch_templates:
+        from mcp_hitchcode.templates.template_watcher import TemplateWatcher
+
+        watcher = TemplateWatcher(interval=watch_interval)
+        watcher.start()
+
+    async def arun():
+        async with (
+            http_client_lifespan(),
+            docs_refresh_lifespan(),
+            stdio_server() as streams,
+        ):
+            await app.run(streams[0], streams[1], app.create_initialization_options())
+
+    try:
         anyio.run(arun)
+    finally:
+        if watcher is not None:
+            watcher.stop()
 
     return 0
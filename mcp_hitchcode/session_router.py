@@ -0,0 +1,224 @@
+"""
+SSE session routing for MCP Simple Tool.
+
+When the SSE server runs several worker processes behind one port, the kernel
+hands each connection to any of them. An SSE session however lives in the
+memory of the worker that accepted its GET /sse stream. The client posts its
+messages to the endpoint announced on that stream, so every worker announces
+an endpoint containing its own ID (/messages/<worker-id>/). A message that
+arrives at another worker is forwarded to the owner over a unix socket in a
+directory shared by all workers.
+"""
+
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+import anyio
+from anyio.abc import SocketStream
+from anyio.streams.buffered import BufferedByteReceiveStream
+from mcp.server.sse import SseServerTransport
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import BaseRoute, Mount
+from starlette.types import Receive, Scope, Send
+
+# Path prefix of the message endpoints
+MESSAGES_PATH = "/messages/"
+
+# Maximum size of a forwarded message or reply, including the framing
+_MAX_FORWARD_BYTES = 16 * 1024 * 1024
+
+
+def _route_path(scope: Scope) -> str:
+    """
+    Get the path of a request below the mount point of the app handling it.
+
+    Args:
+        scope: The ASGI scope of the request.
+
+    Returns:
+        str: The path without the root path set by the enclosing mounts.
+    """
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        return path[len(root_path) :]
+    return path
+
+
+async def _call_transport(
+    transport: SseServerTransport, endpoint: str, query_string: bytes, body: bytes
+) -> Tuple[int, str]:
+    """
+    Hand a posted message to a local SSE transport.
+
+    Args:
+        transport: The transport owning the session.
+        endpoint: The message endpoint of the transport.
+        query_string: The raw query string of the POST request.
+        body: The request body.
+
+    Returns:
+        Tuple[int, str]: The status code and body of the response.
+    """
+    scope: Scope = {
+        "type": "http",
+        "method": "POST",
+        "path": endpoint,
+        "query_string": query_string,
+        "headers": [(b"content-type", b"application/json")],
+    }
+    response: Dict[str, object] = {"status": 500, "body": b""}
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")  # type: ignore[operator]
+
+    await transport.handle_post_message(scope, receive, send)
+    return int(response["status"]), bytes(response["body"]).decode()  # type: ignore[arg-type]
+
+
+class SessionRouter:
+    """
+    Routes posted SSE messages to the worker process that owns the session.
+    """
+
+    def __init__(self, socket_dir: str, worker_id: Optional[str] = None) -> None:
+        """
+        Create the router of a worker process.
+
+        Args:
+            socket_dir: Directory shared by all workers for their unix sockets.
+            worker_id: Optional ID of the worker. Defaults to the process ID.
+        """
+        self.socket_dir = socket_dir
+        self.worker_id = worker_id or str(os.getpid())
+        self.endpoint = f"{MESSAGES_PATH}{self.worker_id}/"
+        self.transport = SseServerTransport(self.endpoint)
+
+    def _socket_path(self, worker_id: str) -> str:
+        """
+        Get the path of the unix socket of a worker.
+
+        Args:
+            worker_id: The ID of the worker.
+
+        Returns:
+            str: The socket path.
+        """
+        return os.path.join(self.socket_dir, f"{worker_id}.sock")
+
+    def routes(self) -> list[BaseRoute]:
+        """
+        Get the routes for posting messages.
+
+        Returns:
+            list[BaseRoute]: The route of the own sessions, followed by the
+            route forwarding messages of other workers' sessions.
+        """
+        return [
+            Mount(self.endpoint, app=self.transport.handle_post_message),
+            Mount(MESSAGES_PATH, app=self.forward_post_message),
+        ]
+
+    async def serve(self, *, task_status=anyio.TASK_STATUS_IGNORED) -> None:
+        """
+        Accept messages forwarded by other workers until cancelled.
+
+        Args:
+            task_status: Signals when the socket is listening, for
+                anyio.abc.TaskGroup.start().
+        """
+        path = self._socket_path(self.worker_id)
+        if os.path.exists(path):
+            os.unlink(path)
+
+        listener = await anyio.create_unix_listener(path)
+        task_status.started()
+        try:
+            await listener.serve(self._handle_forwarded)
+        finally:
+            await listener.aclose()
+            if os.path.exists(path):
+                os.unlink(path)
+
+    async def _handle_forwarded(self, stream: SocketStream) -> None:
+        """
+        Deliver a message forwarded by another worker and send back the response.
+
+        Args:
+            stream: The connection from the forwarding worker.
+        """
+        async with stream:
+            buffered = BufferedByteReceiveStream(stream)
+            request = json.loads(
+                await buffered.receive_until(b"\n", _MAX_FORWARD_BYTES)
+            )
+            status, body = await _call_transport(
+                self.transport,
+                self.endpoint,
+                request["query_string"].encode("latin-1"),
+                request["body"].encode(),
+            )
+            reply = json.dumps({"status": status, "body": body})
+            await stream.send(reply.encode() + b"\n")
+
+    async def forward(
+        self, worker_id: str, query_string: bytes, body: bytes
+    ) -> Tuple[int, str]:
+        """
+        Forward a posted message to the worker that owns the session.
+
+        Args:
+            worker_id: The ID of the owning worker.
+            query_string: The raw query string of the POST request.
+            body: The request body.
+
+        Returns:
+            Tuple[int, str]: The status code and body of the owner's response,
+            or 404 if the worker is gone.
+        """
+        if worker_id == self.worker_id:
+            return await _call_transport(
+                self.transport, self.endpoint, query_string, body
+            )
+
+        path = self._socket_path(worker_id)
+        if not worker_id.isalnum() or not os.path.exists(path):
+            return 404, "Could not find session"
+
+        request = json.dumps(
+            {
+                "query_string": query_string.decode("latin-1"),
+                "body": body.decode("utf-8", errors="replace"),
+            }
+        )
+        try:
+            async with await anyio.connect_unix(path) as stream:
+                await stream.send(request.encode() + b"\n")
+                buffered = BufferedByteReceiveStream(stream)
+                reply = json.loads(
+                    await buffered.receive_until(b"\n", _MAX_FORWARD_BYTES)
+                )
+        except (OSError, anyio.EndOfStream, anyio.IncompleteRead):
+            return 404, "Could not find session"
+        return reply["status"], reply["body"]
+
+    async def forward_post_message(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """
+        ASGI app forwarding a message posted to /messages/<worker-id>/.
+        """
+        request = Request(scope, receive)
+        worker_id = _route_path(scope).strip("/").split("/", 1)[0]
+        status, body = await self.forward(
+            worker_id, scope.get("query_string", b""), await request.body()
+        )
+        await Response(body, status_code=status)(scope, receive, send)
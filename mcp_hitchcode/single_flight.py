@@ -0,0 +1,193 @@
+"""
+Single-flight calls for MCP Simple Tool.
+
+When several tasks ask for the same result at the same time, e.g. SSE sessions
+fetching the same URL, only the first one runs the call. The others wait for
+it and share its result or exception. Nothing is cached: once the call has
+finished, the next caller runs it again.
+
+SingleFlight deduplicates calls of tasks on one event loop, ThreadSingleFlight
+calls of threads, e.g. renders offloaded to worker threads.
+"""
+
+import threading
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+import anyio
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class _Call:
+    """
+    A call in flight and, once it has finished, its outcome.
+    """
+
+    __slots__ = ("done", "result", "error", "cancelled")
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.cancelled = False
+
+
+class SingleFlight(Generic[K, T]):
+    """
+    Deduplicates concurrent calls with the same key.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create a group without calls in flight.
+        """
+        self._calls: Dict[K, _Call] = {}
+        self._leaders = 0
+        self._shared = 0
+
+    async def do(self, key: K, func: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """
+        Run func(*args), or wait for the call with the same key in flight.
+
+        If the task running the call is cancelled, its waiters are not: one of
+        them runs the call again.
+
+        Args:
+            key: The key identifying the call.
+            func: The coroutine function to call.
+            *args: The arguments of func.
+
+        Returns:
+            T: The result of the call.
+
+        Raises:
+            Exception: Whatever the call raised.
+        """
+        call = self._calls.get(key)
+        while call is not None:
+            await call.done.wait()
+            if not call.cancelled:
+                self._shared += 1
+                if call.error is not None:
+                    raise call.error
+                return call.result
+            call = self._calls.get(key)
+
+        call = self._calls[key] = _Call()
+        self._leaders += 1
+        try:
+            call.result = await func(*args)
+            return call.result
+        except anyio.get_cancelled_exc_class():
+            call.cancelled = True
+            raise
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            del self._calls[key]
+            call.done.set()
+
+    def info(self) -> Dict[str, int]:
+        """
+        Get statistics for the group.
+
+        Returns:
+            Dict[str, int]: The number of calls run ("misses"), the number of
+            calls that shared the result of another ("hits") and the number of
+            calls in flight ("size").
+        """
+        return {
+            "hits": self._shared,
+            "misses": self._leaders,
+            "size": len(self._calls),
+        }
+
+
+class _ThreadCall:
+    """
+    A call in flight in another thread and, once it has finished, its outcome.
+    """
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ThreadSingleFlight(Generic[K, T]):
+    """
+    Deduplicates concurrent calls with the same key across threads.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create a group without calls in flight.
+        """
+        self._calls: Dict[K, _ThreadCall] = {}
+        self._lock = threading.Lock()
+        self._leaders = 0
+        self._shared = 0
+
+    def do(self, key: K, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run func(*args), or wait for the call with the same key in flight.
+
+        func must not call do() with the same key, or it waits for itself.
+
+        Args:
+            key: The key identifying the call.
+            func: The function to call.
+            *args: The arguments of func.
+
+        Returns:
+            T: The result of the call.
+
+        Raises:
+            Exception: Whatever the call raised.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _ThreadCall()
+                self._leaders += 1
+                leader = True
+            else:
+                self._shared += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def info(self) -> Dict[str, int]:
+        """
+        Get statistics for the group.
+
+        Returns:
+            Dict[str, int]: The number of calls run ("misses"), the number of
+            calls that shared the result of another ("hits") and the number of
+            calls in flight ("size").
+        """
+        with self._lock:
+            return {
+                "hits": self._shared,
+                "misses": self._leaders,
+                "size": len(self._calls),
+            }
@@ -1,34 +1,111 @@
 """
 Templates package for MCP Simple Tool.
+
+The exported symbols are imported from their modules on first access, so that
+importing one module of the package (e.g. the Docker file loader) does not
+load Jinja2 and the template loader with it.
 """
 
-# Import these modules to make them available when importing the package
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Seen by type checkers only; at runtime __getattr__ imports on first access
+    from .docker_file_loader import (
+        clear_docker_file_cache,
+        docker_compose,
+        docker_file,
+        get_docker_file_cache_info,
+        load_docker_file,
+        load_docker_file_async,
+        prefetch_docker_files,
+    )
+    from .template_loader import (
+        add_invalidation_listener,
+        clear_compiled_template_cache,
+        configure_template_bundle,
+        get_compiled_template_cache_info,
+        get_latest_version,
+        get_template_metadata,
+        get_template_versions,
+        load_template,
+        load_template_async,
+        refresh_template_file,
+        remove_invalidation_listener,
+        render_prompt_template,
+        render_prompt_template_async,
+        render_template,
+        resolve_template_version,
+        resolve_template_version_async,
+        set_compiled_template_cache_maxsize,
+        warm_template_cache,
+    )
+    from .template_watcher import TemplateWatcher
+
 # Use __all__ to define what symbols are exported when using "from package import *"
 __all__ = [
     "load_template",
     "render_template",
     "render_prompt_template",
+    "render_prompt_template_async",
+    "load_template_async",
     "get_template_versions",
+    "resolve_template_version",
+    "resolve_template_version_async",
     "get_latest_version",
     "get_template_metadata",
+    "get_compiled_template_cache_info",
+    "set_compiled_template_cache_maxsize",
+    "clear_compiled_template_cache",
     "docker_file",
     "docker_compose",
     "load_docker_file",
+    "load_docker_file_async",
+    "prefetch_docker_files",
     "clear_docker_file_cache",
+    "get_docker_file_cache_info",
+    "refresh_template_file",
+    "add_invalidation_listener",
+    "remove_invalidation_listener",
+    "warm_template_cache",
+    "configure_template_bundle",
+    "TemplateWatcher",
 ]
 
-# Import symbols that should be available when importing the package
-from .docker_file_loader import (  # noqa: F401
-    clear_docker_file_cache,
-    docker_compose,
-    docker_file,
-    load_docker_file,
-)
-from .template_loader import (  # noqa: F401
-    get_latest_version,
-    get_template_metadata,
-    get_template_versions,
-    load_template,
-    render_prompt_template,
-    render_template,
-)
+# Module of each exported symbol, relative to this package
+_EXPORTS = {
+    "clear_docker_file_cache": ".docker_file_loader",
+    "get_docker_file_cache_info": ".docker_file_loader",
+    "docker_compose": ".docker_file_loader",
+    "docker_file": ".docker_file_loader",
+    "load_docker_file": ".docker_file_loader",
+    "load_docker_file_async": ".docker_file_loader",
+    "prefetch_docker_files": ".docker_file_loader",
+    "TemplateWatcher": ".template_watcher",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import an exported symbol from its module on first access.
+
+    Args:
+        name: The name of the symbol.
+
+    Returns:
+        Any: The symbol.
+
+    Raises:
+        AttributeError: If the name is not exported by the package.
+    """
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_EXPORTS.get(name, ".template_loader"), __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -4,12 +4,18 @@ Docker file loader for MCP Simple Tool.
 This module provides functions to load Docker files from the templates directory.
 """
 
-import functools
 import os
-from typing import Dict
+from typing import Dict, Iterable, Optional
 
-# Cache for Docker file content to avoid repeated file I/O
-_docker_file_cache: Dict[str, str] = {}
+from anyio import to_thread
+
+from mcp_hitchcode.bounded_cache import BoundedCache, register_cache
+
+# Cache for Docker file content to avoid repeated file I/O (paths are template
+# arguments, so the cache is bounded by count and size)
+_docker_file_cache: BoundedCache[str, str] = register_cache(
+    "docker_file", BoundedCache(max_entries=32, max_bytes=8 * 1024 * 1024)
+)
 
 
 def _get_docker_dir() -> str:
@@ -42,7 +48,6 @@ def _resolve_docker_file_path(file_path: str) -> str:
     return os.path.join(docker_dir, file_path)
 
 
-@functools.lru_cache(maxsize=32)
 def load_docker_file(file_path: str) -> str:
     """
     Load a Docker file from the templates directory.
@@ -57,8 +62,9 @@ def load_docker_file(file_path: str) -> str:
         FileNotFoundError: If the Docker file does not exist.
     """
     # Check if the Docker file is already cached
-    if file_path in _docker_file_cache:
-        return _docker_file_cache[file_path]
+    cached = _docker_file_cache.get(file_path)
+    if cached is not None:
+        return cached
 
     # Resolve the Docker file path
     full_path = _resolve_docker_file_path(file_path)
@@ -72,11 +78,71 @@ def load_docker_file(file_path: str) -> str:
         docker_file_content = f.read()
 
     # Cache the Docker file content
-    _docker_file_cache[file_path] = docker_file_content
+    _docker_file_cache.put(file_path, docker_file_content)
 
     return docker_file_content
 
 
+async def load_docker_file_async(file_path: str) -> str:
+    """
+    Load a Docker file without blocking the event loop.
+
+    Cached files are returned directly, others are read on a worker thread.
+
+    Args:
+        file_path: The path to the Docker file, relative to the Docker files directory.
+
+    Returns:
+        str: The Docker file content.
+
+    Raises:
+        FileNotFoundError: If the Docker file does not exist.
+    """
+    cached = _docker_file_cache.get(file_path)
+    if cached is not None:
+        return cached
+
+    return await to_thread.run_sync(load_docker_file, file_path)
+
+
+def is_docker_file_cached(file_path: str) -> bool:
+    """
+    Check whether a Docker file is cached.
+
+    Args:
+        file_path: The path to the Docker file, relative to the Docker files directory.
+
+    Returns:
+        bool: Whether loading the Docker file needs no file read.
+    """
+    return file_path in _docker_file_cache
+
+
+def prefetch_docker_files(file_paths: Iterable[str]) -> int:
+    """
+    Load Docker files into the cache ahead of rendering the templates using them.
+
+    Missing files are skipped, so that the render reports them as before.
+
+    Args:
+        file_paths: The paths to the Docker files, relative to the Docker files
+            directory.
+
+    Returns:
+        int: The number of files that were read from disk.
+    """
+    loaded = 0
+    for file_path in file_paths:
+        if is_docker_file_cached(file_path):
+            continue
+        try:
+            load_docker_file(file_path)
+        except OSError:
+            continue
+        loaded += 1
+    return loaded
+
+
 def docker_file(file_path: str) -> str:
     """
     Load a Dockerfile from the templates directory.
@@ -113,5 +179,15 @@ def clear_docker_file_cache() -> None:
     """
     Clear the Docker file cache.
     """
-    global _docker_file_cache
-    _docker_file_cache = {}
+    _docker_file_cache.clear()
+
+
+def get_docker_file_cache_info() -> Dict[str, Optional[int]]:
+    """
+    Get statistics for the Docker file cache.
+
+    Returns:
+        Dict[str, Optional[int]]: The hit, miss and eviction counts, the number
+        of cached files, the bytes used and the bounds of the cache.
+    """
+    return _docker_file_cache.info()
@@ -0,0 +1,244 @@
+"""
+Precompiled template bundle for MCP Simple Tool.
+
+The bundle is a single file next to the templates that holds the version
+registry, the content and parsed metadata of every prompt template, the
+Jinja2 code compiled from it and the Docker files it includes. Loading it
+replaces the directory scan, the YAML parsing and the Jinja2 compilation on a
+cold start. Each template is stored with the size, mtime and sha256 of its
+file, and only files that still match are served from the bundle; a file whose
+stat changed is hashed. The mtimes of the template directories are stored too:
+if one changed, the directory is scanned, and if version files were added or
+removed since the bundle was built, the bundle is ignored.
+
+Build it after installing or changing the templates:
+
+    python -m mcp_hitchcode.templates.template_bundle
+
+The compiled code is stored with marshal, so a bundle is only used by the
+Python and Jinja2 versions that built it. Other bundles are ignored and the
+templates are loaded from disk as usual.
+"""
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import pickle
+from typing import Any, Dict, Optional
+
+from . import template_loader
+
+# Name of the bundle file in the templates directory
+BUNDLE_FILENAME = "prompts.bundle"
+
+# Version of the bundle layout, increased when the layout changes
+_BUNDLE_FORMAT = 4
+
+
+def get_bundle_path(templates_dir: Optional[str] = None) -> str:
+    """
+    Get the path of the bundle file.
+
+    Args:
+        templates_dir: The templates directory, defaults to the package templates.
+
+    Returns:
+        str: The absolute path of the bundle file.
+    """
+    if templates_dir is None:
+        templates_dir = template_loader._get_templates_dir()
+    return os.path.join(templates_dir, BUNDLE_FILENAME)
+
+
+def file_digest(path: str) -> str:
+    """
+    Hash the content of a template file.
+
+    Args:
+        path: The absolute path of the file.
+
+    Returns:
+        str: The sha256 hex digest of the file.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _compatibility() -> Dict[str, Any]:
+    """
+    Describe what a bundle must have been built with to be usable.
+
+    Returns:
+        Dict[str, Any]: The bundle format, Python bytecode magic number and
+        Jinja2 version.
+    """
+    import jinja2
+
+    return {
+        "format": _BUNDLE_FORMAT,
+        "magic": importlib.util.MAGIC_NUMBER,
+        "jinja2": jinja2.__version__,
+    }
+
+
+def build_bundle() -> Dict[str, Any]:
+    """
+    Build the bundle of the package templates.
+
+    Returns:
+        Dict[str, Any]: The compatibility fields, the version registry, the
+        mtime of the prompts directory and of each template directory and, by
+        template path, the content, metadata, size, mtime and sha256 of the
+        file, the marshalled code and the Docker files the template includes.
+
+    Raises:
+        jinja2.exceptions.TemplateSyntaxError: If a template does not compile.
+    """
+    registry = template_loader._scan_template_versions(
+        template_loader._get_prompts_dir()
+    )
+    env = template_loader.get_template_env()
+    templates_dir = template_loader._get_templates_dir()
+
+    directories = {
+        "prompts": os.stat(os.path.join(templates_dir, "prompts")).st_mtime_ns
+    }
+    files: Dict[str, Dict[str, Any]] = {}
+    for template_name, versions in registry.items():
+        template_dir = f"prompts/{template_name}"
+        directories[template_dir] = os.stat(
+            os.path.join(templates_dir, template_dir)
+        ).st_mtime_ns
+
+        for version_str, filename in versions.items():
+            if version_str == "latest":
+                continue
+
+            template_path = f"prompts/{template_name}/{filename}"
+            full_path = os.path.join(templates_dir, template_path)
+            with open(full_path, "r") as f:
+                content = f.read()
+            metadata, template_content = template_loader._parse_template_metadata(
+                content
+            )
+            source = env.parse(template_content)
+            stat = os.stat(full_path)
+            files[template_path] = {
+                "content": content,
+                "metadata": metadata,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": file_digest(full_path),
+                "code": marshal.dumps(env.compile(source)),
+                "docker_files": template_loader._find_docker_file_refs(source),
+            }
+
+    return {
+        **_compatibility(),
+        "registry": registry,
+        "directories": directories,
+        "files": files,
+    }
+
+
+def write_bundle(path: Optional[str] = None) -> str:
+    """
+    Build the bundle and write it to a file.
+
+    The bundle is written to a temporary file first and then moved into place,
+    so a running server never reads a partial bundle.
+
+    Args:
+        path: The bundle file, defaults to prompts.bundle in the templates directory.
+
+    Returns:
+        str: The path of the written bundle.
+    """
+    if path is None:
+        path = get_bundle_path()
+
+    bundle = build_bundle()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def read_bundle(path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Read a bundle written by write_bundle.
+
+    Args:
+        path: The bundle file, defaults to prompts.bundle in the templates directory.
+
+    Returns:
+        Optional[Dict[str, Any]]: The bundle with the code unmarshalled, or None
+        if the file does not exist, cannot be read or was built by another
+        Python or Jinja2 version.
+    """
+    if path is None:
+        path = get_bundle_path()
+
+    try:
+        with open(path, "rb") as f:
+            bundle = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # A truncated or foreign file is treated like a missing bundle
+        return None
+
+    if not isinstance(bundle, dict):
+        return None
+    for key, value in _compatibility().items():
+        if bundle.get(key) != value:
+            return None
+
+    try:
+        for entry in bundle["files"].values():
+            entry["code"] = marshal.loads(entry["code"])
+    except (KeyError, TypeError, ValueError, EOFError):
+        return None
+    return bundle
+
+
+def main() -> None:
+    """
+    Run the command line interface that builds the bundle.
+
+    click is imported here, so that the template loader reading the bundle
+    does not import it.
+    """
+    import click
+
+    @click.command()
+    @click.option(
+        "--output",
+        default=None,
+        help=(
+            "Path of the bundle file "
+            "(default: prompts.bundle in the templates directory)"
+        ),
+    )
+    def build(output: Optional[str]) -> int:
+        """Build the precompiled template bundle."""
+        path = write_bundle(output)
+        bundle_size = os.path.getsize(path)
+        click.echo(f"Wrote {path} ({bundle_size} bytes)")
+        return 0
+
+    build()
+
+
+if __name__ == "__main__":
+    main()
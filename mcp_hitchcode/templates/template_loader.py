@@ -4,27 +4,89 @@ Template loader for MCP Simple Tool.
 This module provides functions to load and render templates from the package.
 """
 
+import bisect
 import functools
 import os
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from types import CodeType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-import yaml
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from anyio import to_thread
 from packaging import version
 
+from mcp_hitchcode.bounded_cache import BoundedCache, register_cache
+from mcp_hitchcode.single_flight import ThreadSingleFlight
+
 # Import the Docker file loader functions
 from . import docker_file_loader
 
-# Cache for template content to avoid repeated file I/O
-_template_cache: Dict[str, str] = {}
+if TYPE_CHECKING:
+    # Jinja2 itself is imported when the environment is first created
+    from jinja2 import Environment, Template, nodes
+
+# Cache for template content to avoid repeated file I/O (paths may be client input)
+_template_cache: BoundedCache[str, str] = register_cache(
+    "template_content", BoundedCache(max_entries=256, max_bytes=16 * 1024 * 1024)
+)
 
 # Cache for template metadata
-_metadata_cache: Dict[str, Dict[str, Any]] = {}
+_metadata_cache: BoundedCache[str, Dict[str, Any]] = register_cache(
+    "template_metadata", BoundedCache(max_entries=256)
+)
 
-# Cache for template version registry
+# Cache for template version registry (a template's versions are replaced as
+# a whole, never modified in place)
 _version_registry: Dict[str, Dict[str, str]] = {}
 
+# Serializes building and updating the version registry
+_registry_lock = threading.Lock()
+
+# Per-template parsed versions, sorted from oldest to newest
+_sorted_versions: Dict[str, List[version.Version]] = {}
+
+# Per-template version strings, parallel to _sorted_versions
+_sorted_version_strs: Dict[str, List[str]] = {}
+
+# Memoized (template_name, requested version) -> resolved version lookups
+# (requested versions are client input)
+_resolved_versions: BoundedCache[Tuple[str, str], str] = register_cache(
+    "template_versions", BoundedCache(max_entries=1024)
+)
+
+# Cache for compiled prompt templates, keyed by (template_name, version, mtime)
+_compiled_template_cache: BoundedCache[Tuple[str, str, float], "Template"] = (
+    register_cache("template", BoundedCache(max_entries=128))
+)
+
+# Compilations in flight, by compiled template cache key
+_compilations: ThreadSingleFlight[Tuple[str, str, float], "Template"] = (
+    ThreadSingleFlight()
+)
+
+# The Jinja2 environment, created on first use
+_template_env: Optional["Environment"] = None
+
+# Guards the creation of the Jinja2 environment
+_template_env_lock = threading.Lock()
+
+# Whether the registry is loaded from the precompiled template bundle if present
+_use_template_bundle: bool = True
+
+# Jinja code compiled at build time, by template path: (mtime of the file when
+# it was checked against the bundle, code object)
+_bundled_code: Dict[str, Tuple[float, CodeType]] = {}
+
+# Docker files included by each compiled template, by template path: the
+# constant paths and the names of the arguments passed as paths
+_docker_file_refs: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+# Template globals that include a Docker file
+_DOCKER_FILE_GLOBALS = ("docker_file", "docker_compose")
+
+# Callbacks notified with the template name (or None for all) on invalidation
+_invalidation_listeners: List[Callable[[Optional[str]], object]] = []
+
 
 def _get_templates_dir() -> str:
     """
@@ -38,27 +100,47 @@ def _get_templates_dir() -> str:
     return os.path.dirname(os.path.abspath(__file__))
 
 
-@functools.lru_cache(maxsize=32)
-def get_template_env() -> Environment:
+def _get_prompts_dir() -> str:
+    """
+    Get the absolute path to the prompt templates directory.
+
+    Returns:
+        str: The absolute path to the prompt templates directory.
+    """
+    return os.path.join(_get_templates_dir(), "prompts")
+
+
+def get_template_env() -> "Environment":
     """
     Get the Jinja2 environment for rendering templates.
 
+    The environment is created on first use and shared by all renders.
+
     Returns:
         Environment: The Jinja2 environment.
     """
-    templates_dir = _get_templates_dir()
-    env = Environment(
-        loader=FileSystemLoader(templates_dir),
-        autoescape=select_autoescape(["html", "xml"]),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
+    global _template_env
+
+    if _template_env is not None:
+        return _template_env
 
-    # Register Docker file loader functions
-    env.globals["docker_file"] = docker_file_loader.docker_file
-    env.globals["docker_compose"] = docker_file_loader.docker_compose
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-    return env
+    with _template_env_lock:
+        if _template_env is None:
+            env = Environment(
+                loader=FileSystemLoader(_get_templates_dir()),
+                autoescape=select_autoescape(["html", "xml"]),
+                trim_blocks=True,
+                lstrip_blocks=True,
+            )
+
+            # Register Docker file loader functions
+            env.globals["docker_file"] = docker_file_loader.docker_file
+            env.globals["docker_compose"] = docker_file_loader.docker_compose
+
+            _template_env = env
+    return _template_env
 
 
 def _parse_template_metadata(content: str) -> Tuple[Dict[str, Any], str]:
@@ -73,6 +155,9 @@ def _parse_template_metadata(content: str) -> Tuple[Dict[str, Any], str]:
     """
     # Check if the template has YAML front matter
     if content.startswith("---"):
+        # Imported here, as metadata loaded from the template bundle is already parsed
+        import yaml
+
         # Find the end of the front matter
         end_index = content.find("---", 3)
         if end_index != -1:
@@ -92,23 +177,46 @@ def _parse_template_metadata(content: str) -> Tuple[Dict[str, Any], str]:
     return {}, content
 
 
-def _build_version_registry() -> None:
+def _parse_version_filename(filename: str) -> Optional[str]:
     """
-    Build the version registry for all templates.
-    This scans the templates directory and builds a registry of all available versions.
+    Extract the version from a prompt template filename.
+
+    Args:
+        filename: The filename, e.g. "1.0.0.md" or "change_v1.0.0.md".
+
+    Returns:
+        Optional[str]: The version, or None if the filename is not a versioned template.
     """
-    global _version_registry
+    # Check if the filename matches the old version pattern (e.g., 1.0.0.md)
+    if re.match(r"^\d+\.\d+\.\d+\.md$", filename):
+        return filename[:-3]  # Remove the .md extension
 
-    if _version_registry:
-        # Registry already built
-        return
+    # Check if the filename matches the new version pattern (e.g., change_v1.0.0.md)
+    if re.match(r"^[a-z_]+_v\d+\.\d+\.\d+\.md$", filename):
+        # Extract the version from the filename (e.g., "1.0.0" from "change_v1.0.0.md")
+        match = re.search(r"_v(\d+\.\d+\.\d+)\.md$", filename)
+        if match:
+            return match.group(1)
+
+    return None
 
-    templates_dir = _get_templates_dir()
-    prompts_dir = os.path.join(templates_dir, "prompts")
+
+def _scan_template_versions(prompts_dir: str) -> Dict[str, Dict[str, str]]:
+    """
+    Scan a prompt templates directory for template versions.
+
+    Args:
+        prompts_dir: The absolute path to the prompt templates directory.
+
+    Returns:
+        Dict[str, Dict[str, str]]: For each template, the filename of each
+        version and the latest version under "latest".
+    """
+    registry: Dict[str, Dict[str, str]] = {}
 
     # Check if the prompts directory exists
     if not os.path.isdir(prompts_dir):
-        return
+        return registry
 
     # Scan the prompts directory for template directories
     for template_name in os.listdir(prompts_dir):
@@ -119,34 +227,215 @@ def _build_version_registry() -> None:
             continue
 
         # Initialize the version registry for this template
-        _version_registry[template_name] = {}
+        registry[template_name] = {}
 
         # Scan the template directory for version files
         version_files = []
         for filename in os.listdir(template_dir):
-            # Check if the filename matches the old version pattern (e.g., 1.0.0.md)
-            if re.match(r"^\d+\.\d+\.\d+\.md$", filename):
-                version_str = filename[:-3]  # Remove the .md extension
+            version_str = _parse_version_filename(filename)
+            if version_str is not None:
                 version_files.append((version_str, filename))
-            # Check if the filename matches the new version pattern (e.g., change_v1.0.0.md)
-            elif re.match(r"^[a-z_]+_v\d+\.\d+\.\d+\.md$", filename):
-                # Extract the version from the filename (e.g., "1.0.0" from "change_v1.0.0.md")
-                match = re.search(r"_v(\d+\.\d+\.\d+)\.md$", filename)
-                if match:
-                    version_str = match.group(1)
-                    version_files.append((version_str, filename))
 
         # Sort the version files by version number (newest first)
         version_files.sort(key=lambda x: version.parse(x[0]), reverse=True)
 
         # Add the versions to the registry
         for version_str, filename in version_files:
-            _version_registry[template_name][version_str] = filename
+            registry[template_name][version_str] = filename
 
         # Set the latest version
         if version_files:
             latest_version = version_files[0][0]
-            _version_registry[template_name]["latest"] = latest_version
+            registry[template_name]["latest"] = latest_version
+
+    return registry
+
+
+def _build_version_registry() -> None:
+    """
+    Build the version registry for all templates.
+
+    The registry is read from the precompiled template bundle if there is one,
+    otherwise the templates directory is scanned for all available versions.
+    Concurrent callers wait for a single build. The registry is published in
+    one update after the version index, so readers that find a template in it
+    also find its versions indexed.
+    """
+    if _version_registry:
+        # Registry already built
+        return
+
+    with _registry_lock:
+        if _version_registry:
+            return
+
+        registry = None
+        if _use_template_bundle:
+            registry = _load_template_bundle()
+        if registry is None:
+            registry = _scan_template_versions(_get_prompts_dir())
+
+        # Index the versions for fallback lookups
+        for template_name, versions in registry.items():
+            _index_template_versions(template_name, versions)
+
+        _version_registry.update(registry)
+
+
+def _load_template_bundle() -> Optional[Dict[str, Dict[str, str]]]:
+    """
+    Fill the content, metadata and code caches from the bundle.
+
+    Only the templates whose files still have the size and mtime stored in
+    the bundle, or else its hash, are taken from it; the others are loaded
+    from disk on first use. The templates directory is only scanned if the
+    mtime of one of its directories changed since the bundle was built.
+
+    Returns:
+        Optional[Dict[str, Dict[str, str]]]: The version registry of the
+        bundle, or None if there is no usable bundle or the version files in
+        the templates directory differ from the bundled ones.
+    """
+    from .template_bundle import file_digest, get_bundle_path, read_bundle
+
+    templates_dir = _get_templates_dir()
+    bundle = read_bundle(get_bundle_path(templates_dir))
+    if bundle is None:
+        return None
+
+    # Adding or removing a version file changes the mtime of its directory
+    registry = bundle["registry"]
+    if not _directories_unchanged(templates_dir, bundle["directories"]):
+        if _scan_template_versions(_get_prompts_dir()) != registry:
+            return None
+
+    for template_path, entry in bundle["files"].items():
+        full_path = os.path.join(templates_dir, template_path)
+        try:
+            stat = os.stat(full_path)
+            if (stat.st_size, stat.st_mtime_ns) != (
+                entry["size"],
+                entry["mtime_ns"],
+            ) and file_digest(full_path) != entry["sha256"]:
+                # The file changed since the bundle was built
+                continue
+        except OSError:
+            continue
+
+        _template_cache.put(template_path, entry["content"])
+        _metadata_cache.put(template_path, entry["metadata"])
+        _bundled_code[template_path] = (stat.st_mtime, entry["code"])
+        _docker_file_refs[template_path] = entry["docker_files"]
+
+    return registry
+
+
+def _directories_unchanged(templates_dir: str, mtimes: Dict[str, int]) -> bool:
+    """
+    Check whether the template directories still have the recorded mtimes.
+
+    Args:
+        templates_dir: The templates directory.
+        mtimes: The mtime in nanoseconds of each directory, by path relative
+            to the templates directory.
+
+    Returns:
+        bool: Whether every directory exists with its recorded mtime.
+    """
+    for path, mtime_ns in mtimes.items():
+        try:
+            if os.stat(os.path.join(templates_dir, path)).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def configure_template_bundle(enabled: bool = True) -> None:
+    """
+    Choose whether the registry is loaded from the precompiled template bundle.
+
+    Takes effect the next time the registry is built.
+
+    Args:
+        enabled: Whether to use templates/prompts.bundle when it exists.
+    """
+    global _use_template_bundle
+
+    _use_template_bundle = enabled
+
+
+def _index_template_versions(
+    template_name: str, registry: Optional[Dict[str, str]]
+) -> None:
+    """
+    Build the sorted version index for a template.
+
+    Args:
+        template_name: The name of the template.
+        registry: The versions of the template, or None if it was removed.
+    """
+    if registry is None:
+        _sorted_versions.pop(template_name, None)
+        _sorted_version_strs.pop(template_name, None)
+    else:
+        versions = sorted((version.parse(v), v) for v in registry if v != "latest")
+        _sorted_versions[template_name] = [parsed for parsed, _ in versions]
+        _sorted_version_strs[template_name] = [v for _, v in versions]
+
+    # Drop memoized lookups that were resolved against the old index
+    _resolved_versions.invalidate(lambda key: key[0] == template_name)
+
+
+def refresh_template_file(template_name: str, filename: str) -> None:
+    """
+    Update the caches after a single prompt template file changed on disk.
+
+    Only the registry entry of the affected template and the cache entries of
+    the affected file are touched; the rest of the registry is left as is.
+
+    Args:
+        template_name: The name of the template (its directory under prompts/).
+        filename: The name of the file that was created, modified or deleted.
+    """
+    _build_version_registry()
+
+    template_dir = os.path.join(_get_prompts_dir(), template_name)
+    template_path = f"prompts/{template_name}/{filename}"
+    version_str = _parse_version_filename(filename)
+
+    # Drop the cached content of the changed file
+    _template_cache.pop(template_path)
+    _metadata_cache.pop(template_path)
+    _bundled_code.pop(template_path, None)
+
+    if not os.path.isdir(template_dir):
+        # The whole template directory is gone
+        with _registry_lock:
+            _version_registry.pop(template_name, None)
+            _index_template_versions(template_name, None)
+        clear_compiled_template_cache(template_name)
+        return
+
+    if version_str is None:
+        return
+
+    with _registry_lock:
+        registry = dict(_version_registry.get(template_name, {}))
+        if os.path.isfile(os.path.join(template_dir, filename)):
+            registry[version_str] = filename
+        elif registry.get(version_str) == filename:
+            del registry[version_str]
+
+        # Recompute the latest version
+        registry.pop("latest", None)
+        if registry:
+            registry["latest"] = max(registry, key=version.parse)
+
+        # Replace the versions as a whole, after indexing them
+        _index_template_versions(template_name, registry)
+        _version_registry[template_name] = registry
+    clear_compiled_template_cache(template_name, version_str)
 
 
 def get_template_versions(template_name: str) -> List[str]:
@@ -161,16 +450,12 @@ def get_template_versions(template_name: str) -> List[str]:
     """
     _build_version_registry()
 
-    if template_name not in _version_registry:
+    # A single lookup, as the watcher may remove the template concurrently.
+    # The index is sorted oldest first
+    versions = _sorted_version_strs.get(template_name)
+    if versions is None:
         return []
-
-    # Get all versions except "latest"
-    versions = [v for v in _version_registry[template_name].keys() if v != "latest"]
-
-    # Sort the versions by version number (newest first)
-    versions.sort(key=lambda x: version.parse(x), reverse=True)
-
-    return versions
+    return versions[::-1]
 
 
 def get_latest_version(template_name: str) -> Optional[str]:
@@ -185,10 +470,10 @@ def get_latest_version(template_name: str) -> Optional[str]:
     """
     _build_version_registry()
 
-    if template_name not in _version_registry:
+    registry = _version_registry.get(template_name)
+    if registry is None:
         return None
-
-    return _version_registry[template_name].get("latest")
+    return registry.get("latest")
 
 
 def load_template(template_path: str) -> str:
@@ -205,8 +490,9 @@ def load_template(template_path: str) -> str:
         FileNotFoundError: If the template file does not exist.
     """
     # Check if the template is already cached
-    if template_path in _template_cache:
-        return _template_cache[template_path]
+    cached = _template_cache.get(template_path)
+    if cached is not None:
+        return cached
 
     # Get the absolute path to the template
     templates_dir = _get_templates_dir()
@@ -221,11 +507,33 @@ def load_template(template_path: str) -> str:
         template_content = f.read()
 
     # Cache the template content
-    _template_cache[template_path] = template_content
+    _template_cache.put(template_path, template_content)
 
     return template_content
 
 
+async def load_template_async(template_path: str) -> str:
+    """
+    Load a template without blocking the event loop.
+
+    Cached templates are returned directly, others are read on a worker thread.
+
+    Args:
+        template_path: The path to the template, relative to the templates directory.
+
+    Returns:
+        str: The template content.
+
+    Raises:
+        FileNotFoundError: If the template file does not exist.
+    """
+    cached = _template_cache.get(template_path)
+    if cached is not None:
+        return cached
+
+    return await to_thread.run_sync(load_template, template_path)
+
+
 def get_template_metadata(template_path: str) -> Dict[str, Any]:
     """
     Get the metadata for a template.
@@ -240,8 +548,9 @@ def get_template_metadata(template_path: str) -> Dict[str, Any]:
         FileNotFoundError: If the template file does not exist.
     """
     # Check if the metadata is already cached
-    if template_path in _metadata_cache:
-        return _metadata_cache[template_path]
+    cached = _metadata_cache.get(template_path)
+    if cached is not None:
+        return cached
 
     # Load the template content
     content = load_template(template_path)
@@ -250,7 +559,7 @@ def get_template_metadata(template_path: str) -> Dict[str, Any]:
     metadata, _ = _parse_template_metadata(content)
 
     # Cache the metadata
-    _metadata_cache[template_path] = metadata
+    _metadata_cache.put(template_path, metadata)
 
     return metadata
 
@@ -275,6 +584,87 @@ def render_template(template_path: str, **kwargs: Any) -> str:
     return template.render(**kwargs)
 
 
+def resolve_template_version(template_name: str, version_str: str = "latest") -> str:
+    """
+    Resolve a requested version of a prompt template to an available version.
+
+    Exact matches are returned as is. Otherwise the highest available version
+    that is less than or equal to the requested version is used, falling back
+    to the oldest version.
+
+    Args:
+        template_name: The name of the prompt template.
+        version_str: The requested version. Defaults to "latest".
+
+    Returns:
+        str: The resolved version.
+
+    Raises:
+        FileNotFoundError: If the template does not exist.
+        ValueError: If the template has no versions or the version is invalid.
+    """
+    _build_version_registry()
+
+    # Check if the template exists
+    registry = _version_registry.get(template_name)
+    if registry is None:
+        raise FileNotFoundError(f"Template not found: {template_name}")
+
+    if version_str == "latest":
+        latest = registry.get("latest")
+        if not latest:
+            raise ValueError(f"No versions found for template: {template_name}")
+        return latest
+
+    if version_str in registry:
+        return version_str
+
+    key = (template_name, version_str)
+    resolved = _resolved_versions.get(key)
+    if resolved is not None:
+        return resolved
+
+    parsed_versions = _sorted_versions.get(template_name)
+    version_strs = _sorted_version_strs.get(template_name)
+    if not parsed_versions or not version_strs:
+        raise ValueError(f"No versions found for template: {template_name}")
+
+    # Find the highest version that is less than or equal to the requested version
+    index = bisect.bisect_right(parsed_versions, version.parse(version_str)) - 1
+
+    # If no suitable version is found, use the oldest version
+    resolved = version_strs[max(index, 0)]
+
+    _resolved_versions.put(key, resolved)
+
+    return resolved
+
+
+async def resolve_template_version_async(
+    template_name: str, version_str: str = "latest"
+) -> str:
+    """
+    Resolve a version of a prompt template without blocking the event loop.
+
+    The first call builds the version registry on a worker thread, later calls
+    resolve directly.
+
+    Args:
+        template_name: The name of the prompt template.
+        version_str: The requested version. Defaults to "latest".
+
+    Returns:
+        str: The resolved version.
+
+    Raises:
+        FileNotFoundError: If the template does not exist.
+        ValueError: If the template has no versions or the version is invalid.
+    """
+    if not _version_registry:
+        await to_thread.run_sync(_build_version_registry)
+    return resolve_template_version(template_name, version_str)
+
+
 def render_prompt_template(
     template_name: str, version_str: str = "latest", **kwargs: Any
 ) -> str:
@@ -294,32 +684,8 @@ def render_prompt_template(
         jinja2.exceptions.TemplateError: If there is an error rendering the template.
         ValueError: If the specified version does not exist.
     """
-    _build_version_registry()
-
-    # Check if the template exists
-    if template_name not in _version_registry:
-        raise FileNotFoundError(f"Template not found: {template_name}")
-
     # Resolve the version
-    if version_str == "latest":
-        version_str = _version_registry[template_name].get("latest")
-        if not version_str:
-            raise ValueError(f"No versions found for template: {template_name}")
-    elif version_str not in _version_registry[template_name]:
-        # Try to find the closest version
-        available_versions = get_template_versions(template_name)
-        if not available_versions:
-            raise ValueError(f"No versions found for template: {template_name}")
-
-        # Find the highest version that is less than or equal to the requested version
-        requested_ver = version.parse(version_str)
-        for v in available_versions:
-            if version.parse(v) <= requested_ver:
-                version_str = v
-                break
-        else:
-            # If no suitable version is found, use the oldest version
-            version_str = available_versions[-1]
+    version_str = resolve_template_version(template_name, version_str)
 
     # Get the filename from the registry
     filename = _version_registry[template_name][version_str]
@@ -327,15 +693,375 @@ def render_prompt_template(
     # Build the template path
     template_path = f"prompts/{template_name}/{filename}"
 
-    # Load the template content
-    content = load_template(template_path)
+    # Get the compiled template (compiling it on first use)
+    template = _get_compiled_template(template_name, version_str, template_path)
+
+    # Render the template
+    return template.render(**kwargs)
+
+
+async def render_prompt_template_async(
+    template_name: str, version_str: str = "latest", **kwargs: Any
+) -> str:
+    """
+    Render a prompt template without blocking the event loop on file I/O.
+
+    A template that is not compiled yet is read and compiled on a worker
+    thread, together with the Docker files it includes. Rendering itself runs
+    on the event loop.
+
+    Args:
+        template_name: The name of the prompt template.
+        version_str: The version of the template to use. Defaults to "latest".
+        **kwargs: The variables to pass to the template.
+
+    Returns:
+        str: The rendered prompt template.
+
+    Raises:
+        FileNotFoundError: If the template file does not exist.
+        jinja2.exceptions.TemplateError: If there is an error rendering the template.
+        ValueError: If the specified version does not exist.
+    """
+    if not _is_prompt_template_loaded(template_name, version_str, kwargs):
+        await to_thread.run_sync(
+            functools.partial(_load_prompt_template, template_name, version_str, kwargs)
+        )
+    return render_prompt_template(template_name, version_str, **kwargs)
 
-    # Parse the metadata and template content
-    metadata, template_content = _parse_template_metadata(content)
 
-    # Create a new template with just the content (without the front matter)
+def _is_prompt_template_loaded(
+    template_name: str, version_str: str, kwargs: Dict[str, Any]
+) -> bool:
+    """
+    Check whether a render needs no file reads: the template is compiled and
+    the Docker files it includes are cached.
+
+    Args:
+        template_name: The name of the prompt template.
+        version_str: The requested version of the template.
+        kwargs: The variables to pass to the template.
+
+    Returns:
+        bool: Whether the template and its Docker files are loaded.
+    """
+    if template_name not in _version_registry:
+        # Unknown templates are reported by the worker thread
+        return False
+
+    version_str = resolve_template_version(template_name, version_str)
+    if not any(
+        key[0] == template_name and key[1] == version_str
+        for key in _compiled_template_cache.keys()
+    ):
+        return False
+
+    template_path = (
+        f"prompts/{template_name}/{_version_registry[template_name][version_str]}"
+    )
+    return all(
+        docker_file_loader.is_docker_file_cached(file_path)
+        for file_path in _get_docker_file_paths(template_path, kwargs)
+    )
+
+
+def _load_prompt_template(
+    template_name: str, version_str: str, kwargs: Dict[str, Any]
+) -> None:
+    """
+    Compile a prompt template and load the Docker files a render will include.
+
+    Args:
+        template_name: The name of the prompt template.
+        version_str: The requested version of the template.
+        kwargs: The variables to pass to the template.
+
+    Raises:
+        FileNotFoundError: If the template file does not exist.
+        ValueError: If the specified version does not exist.
+    """
+    version_str = resolve_template_version(template_name, version_str)
+    template_path = (
+        f"prompts/{template_name}/{_version_registry[template_name][version_str]}"
+    )
+    _get_compiled_template(template_name, version_str, template_path)
+    docker_file_loader.prefetch_docker_files(
+        _get_docker_file_paths(template_path, kwargs)
+    )
+
+
+def _find_docker_file_refs(
+    source: "nodes.Template",
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Find the Docker files a parsed template includes.
+
+    Args:
+        source: The parsed template.
+
+    Returns:
+        Tuple[Tuple[str, ...], Tuple[str, ...]]: The paths passed as constants
+        and the names of the variables passed as paths.
+    """
+    from jinja2 import nodes
+
+    paths: Dict[str, None] = {}
+    names: Dict[str, None] = {}
+    for call in source.find_all(nodes.Call):
+        if not (
+            isinstance(call.node, nodes.Name)
+            and call.node.name in _DOCKER_FILE_GLOBALS
+            and call.args
+        ):
+            continue
+        arg = call.args[0]
+        if isinstance(arg, nodes.Const) and isinstance(arg.value, str):
+            paths[arg.value] = None
+        elif isinstance(arg, nodes.Name):
+            names[arg.name] = None
+    return tuple(paths), tuple(names)
+
+
+def _get_docker_file_paths(
+    template_path: str, kwargs: Optional[Dict[str, Any]] = None
+) -> List[str]:
+    """
+    Get the Docker files a render of a compiled template includes.
+
+    Args:
+        template_path: The path to the template, relative to the templates directory.
+        kwargs: Optional variables of the render, for paths passed as arguments.
+
+    Returns:
+        List[str]: The paths of the Docker files.
+    """
+    paths, names = _docker_file_refs.get(template_path, ((), ()))
+    if not kwargs:
+        return list(paths)
+    return [
+        *paths,
+        *(kwargs[name] for name in names if isinstance(kwargs.get(name), str)),
+    ]
+
+
+def warm_template_cache() -> int:
+    """
+    Scan the templates directory and compile the latest version of every template.
+
+    The metadata of each latest version is parsed as well. Servers call this
+    before accepting requests, so that the first call of a prompt tool does not
+    pay for the directory scan, the file read and the compilation.
+
+    Returns:
+        int: The number of templates that were compiled.
+    """
+    _build_version_registry()
+
+    compiled = 0
+    for template_name, registry in list(_version_registry.items()):
+        version_str = registry.get("latest")
+        if not version_str:
+            continue
+        template_path = f"prompts/{template_name}/{registry[version_str]}"
+        try:
+            _get_compiled_template(template_name, version_str, template_path)
+            get_template_metadata(template_path)
+        except FileNotFoundError:
+            continue
+        compiled += 1
+    return compiled
+
+
+def _get_compiled_template(
+    template_name: str, version_str: str, template_path: str
+) -> "Template":
+    """
+    Get the compiled Jinja2 template for a prompt template version.
+
+    Compiled templates are cached by (template_name, version, file mtime), so a
+    template file that changes on disk is recompiled on its next use. Threads
+    asking for the same uncompiled template wait for a single compilation.
+
+    Args:
+        template_name: The name of the prompt template.
+        version_str: The resolved version of the template.
+        template_path: The path to the template, relative to the templates directory.
+
+    Returns:
+        Template: The compiled template.
+
+    Raises:
+        FileNotFoundError: If the template file does not exist.
+    """
+    full_path = os.path.join(_get_templates_dir(), template_path)
+    try:
+        stat = os.stat(full_path)
+    except OSError:
+        raise FileNotFoundError(f"Template file not found: {template_path}")
+    mtime = stat.st_mtime
+
+    key = (template_name, version_str, mtime)
+
+    template = _compiled_template_cache.get(key)
+    if template is not None:
+        return template
+
+    return _compilations.do(key, _compile_template, key, template_path)
+
+
+def _compile_template(key: Tuple[str, str, float], template_path: str) -> "Template":
+    """
+    Compile a prompt template version and add it to the compiled template cache.
+
+    Args:
+        key: The compiled template cache key: (template_name, version, mtime).
+        template_path: The path to the template, relative to the templates directory.
+
+    Returns:
+        Template: The compiled template.
+
+    Raises:
+        FileNotFoundError: If the template file does not exist.
+    """
+    # A compilation that finished since the cache lookup of the caller
+    if key in _compiled_template_cache:
+        template = _compiled_template_cache.get(key)
+        if template is not None:
+            return template
+
+    template_name, version_str, mtime = key
+
+    # Drop entries compiled from an older revision of the same file, and the
+    # prompts rendered from them
+    stale = _compiled_template_cache.invalidate(
+        lambda k: k[0] == template_name and k[1] == version_str
+    )
+    if stale:
+        _template_cache.pop(template_path)
+        _metadata_cache.pop(template_path)
+        _bundled_code.pop(template_path, None)
+        _notify_invalidation(template_name)
+
     env = get_template_env()
-    template = env.from_string(template_content)
+    bundled = _bundled_code.get(template_path)
+    if bundled is not None and bundled[0] == mtime:
+        # Use the code compiled when the bundle was built
+        template = env.template_class.from_code(env, bundled[1], env.make_globals(None))
+    else:
+        # The file changed since it was checked against the bundle
+        if bundled is not None:
+            _template_cache.pop(template_path)
+            _metadata_cache.pop(template_path)
+            _bundled_code.pop(template_path, None)
 
-    # Render the template
-    return template.render(**kwargs)
+        # Load the template content
+        content = load_template(template_path)
+
+        # Parse the metadata and template content
+        _, template_content = _parse_template_metadata(content)
+
+        # Compile a template with just the content (without the front matter)
+        source = env.parse(template_content)
+        _docker_file_refs[template_path] = _find_docker_file_refs(source)
+        template = env.from_string(source)
+
+    # Read the Docker files included with constant paths while compiling, so
+    # that rendering does not block on them
+    docker_file_loader.prefetch_docker_files(_get_docker_file_paths(template_path))
+
+    _compiled_template_cache.put(key, template)
+    return template
+
+
+def get_compiled_template_cache_info() -> Dict[str, Optional[int]]:
+    """
+    Get statistics for the compiled template cache.
+
+    Returns:
+        Dict[str, Optional[int]]: The hit, miss and eviction counts, the current
+        size and the maximum size of the cache (also as "maxsize").
+    """
+    info = _compiled_template_cache.info()
+    info["maxsize"] = info["max_entries"]
+    return info
+
+
+def set_compiled_template_cache_maxsize(maxsize: int) -> None:
+    """
+    Set the maximum number of compiled templates kept in memory.
+
+    Args:
+        maxsize: The maximum number of compiled templates. Must be at least 1.
+
+    Raises:
+        ValueError: If maxsize is smaller than 1.
+    """
+    _compiled_template_cache.resize(max_entries=maxsize)
+
+
+def clear_compiled_template_cache(
+    template_name: Optional[str] = None, version_str: Optional[str] = None
+) -> int:
+    """
+    Invalidate compiled templates.
+
+    Without arguments the whole cache is cleared and its counters are reset.
+    Otherwise only the entries for the given template (and version) are dropped.
+
+    Args:
+        template_name: Optional name of the template to invalidate.
+        version_str: Optional resolved version of the template to invalidate.
+
+    Returns:
+        int: The number of compiled templates that were removed.
+    """
+    if template_name is None:
+        removed = _compiled_template_cache.clear()
+        _compiled_template_cache.reset_stats()
+    else:
+        removed = _compiled_template_cache.invalidate(
+            lambda k: k[0] == template_name
+            and (version_str is None or k[1] == version_str)
+        )
+
+    _notify_invalidation(template_name)
+
+    return removed
+
+
+def _notify_invalidation(template_name: Optional[str]) -> None:
+    """
+    Notify the invalidation listeners that compiled templates were dropped.
+
+    Args:
+        template_name: The name of the invalidated template, or None when all
+            templates were invalidated.
+    """
+    for listener in list(_invalidation_listeners):
+        listener(template_name)
+
+
+def add_invalidation_listener(listener: Callable[[Optional[str]], object]) -> None:
+    """
+    Register a callback that is notified when compiled templates are invalidated.
+
+    Caches derived from rendered templates use this to drop their entries when
+    a template changes on disk.
+
+    Args:
+        listener: Called with the name of the invalidated template, or None
+            when all templates were invalidated. Its return value is ignored.
+    """
+    if listener not in _invalidation_listeners:
+        _invalidation_listeners.append(listener)
+
+
+def remove_invalidation_listener(listener: Callable[[Optional[str]], object]) -> None:
+    """
+    Unregister a callback added with add_invalidation_listener.
+
+    Args:
+        listener: The callback to remove.
+    """
+    if listener in _invalidation_listeners:
+        _invalidation_listeners.remove(listener)
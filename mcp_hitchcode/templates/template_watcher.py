@@ -0,0 +1,193 @@
+"""
+Template watcher for MCP Simple Tool.
+
+This module watches the prompt templates directory and keeps the template
+loader caches up to date while the server is running.
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Logger for templates that fail to refresh
+_logger = logging.getLogger(__name__)
+
+# Snapshot of the prompts directory: path relative to prompts/ -> (mtime_ns, size)
+_Snapshot = Dict[Tuple[str, str], Tuple[int, int]]
+
+
+class TemplateWatcher:
+    """
+    Watch the prompt templates directory and refresh changed templates.
+
+    Every change to a file under templates/prompts/ is handed to
+    template_loader.refresh_template_file, which only updates the registry
+    entry and cache keys of that file. The watcher uses the watchfiles package
+    (inotify on Linux) when it is installed and polls file stats otherwise.
+    """
+
+    def __init__(self, interval: float = 1.0, backend: str = "auto") -> None:
+        """
+        Create a template watcher.
+
+        Args:
+            interval: Seconds between two polls when polling file stats.
+            backend: "watchfiles", "poll" or "auto" to prefer watchfiles when
+                it is installed.
+
+        Raises:
+            ValueError: If the backend is unknown.
+            ImportError: If the watchfiles backend is requested but not installed.
+        """
+        if backend not in ("auto", "watchfiles", "poll"):
+            raise ValueError(f"Unknown template watcher backend: {backend}")
+
+        if backend != "poll":
+            try:
+                import watchfiles  # noqa: F401
+
+                backend = "watchfiles"
+            except ImportError:
+                if backend == "watchfiles":
+                    raise
+                backend = "poll"
+
+        # Imported here, so that importing the watcher does not load the loader
+        from . import template_loader
+
+        self.interval = interval
+        self.backend = backend
+        self._prompts_dir = template_loader._get_prompts_dir()
+        self._snapshot: _Snapshot = {}
+        if backend == "poll":
+            self._snapshot = self._take_snapshot()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Start watching in a background thread.
+        """
+        if self._thread is not None:
+            return
+
+        from . import template_loader
+
+        # Make sure changes are applied to a populated registry
+        template_loader._build_version_registry()
+
+        target = self._watch_files if self.backend == "watchfiles" else self._poll
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=target, name="template-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop watching and wait for the background thread to finish.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> List[Tuple[str, str]]:
+        """
+        Compare the prompts directory with the last snapshot and apply changes.
+
+        Returns:
+            List[Tuple[str, str]]: The (template_name, filename) pairs that changed.
+        """
+        snapshot = self._take_snapshot()
+        changed = [
+            key
+            for key in snapshot.keys() | self._snapshot.keys()
+            if snapshot.get(key) != self._snapshot.get(key)
+        ]
+        self._snapshot = snapshot
+
+        for template_name, filename in sorted(changed):
+            self._refresh(template_name, filename)
+
+        return changed
+
+    def _refresh(self, template_name: str, filename: str) -> None:
+        """
+        Refresh a changed file, logging errors instead of raising them.
+
+        A file that cannot be loaded, e.g. because it is only half written, must
+        not stop the watcher thread; it is refreshed again on its next change.
+
+        Args:
+            template_name: The name of the template.
+            filename: The name of the changed file.
+        """
+        from . import template_loader
+
+        try:
+            template_loader.refresh_template_file(template_name, filename)
+        except Exception:
+            _logger.exception(
+                "Failed to refresh prompt template %s/%s", template_name, filename
+            )
+
+    def _take_snapshot(self) -> _Snapshot:
+        """
+        Stat every file in the template directories under prompts/.
+
+        Returns:
+            _Snapshot: The current state of the prompts directory.
+        """
+        snapshot: _Snapshot = {}
+        try:
+            template_dirs = list(os.scandir(self._prompts_dir))
+        except OSError:
+            return snapshot
+
+        for template_dir in template_dirs:
+            if not template_dir.is_dir():
+                continue
+            try:
+                entries = list(os.scandir(template_dir.path))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                snapshot[(template_dir.name, entry.name)] = (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                )
+
+        return snapshot
+
+    def _poll(self) -> None:
+        """
+        Poll the prompts directory until the watcher is stopped.
+        """
+        while not self._stop_event.wait(self.interval):
+            self.check()
+
+    def _watch_files(self) -> None:
+        """
+        Receive file system events from watchfiles until the watcher is stopped.
+        """
+        import watchfiles
+
+        for changes in watchfiles.watch(
+            self._prompts_dir, stop_event=self._stop_event, recursive=True
+        ):
+            changed = set()
+            for _, path in changes:
+                parts = os.path.relpath(path, self._prompts_dir).split(os.sep)
+                if len(parts) == 2:
+                    changed.add((parts[0], parts[1]))
+
+            for template_name, filename in sorted(changed):
+                self._refresh(template_name, filename)
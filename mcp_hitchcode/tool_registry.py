@@ -0,0 +1,246 @@
+"""
+Tool registry for MCP Simple Tool.
+
+This module keeps the tools served by the MCP server in a table from tool name
+to handler and input schema. The types.Tool list returned by tools/list is
+built once, and calls are dispatched with a single dictionary lookup.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import mcp.types as types
+
+from mcp_hitchcode.metrics import (
+    TOOL_CALLS,
+    TOOL_ERRORS,
+    TOOL_LATENCY,
+    TOOL_RESPONSE_BYTES,
+    UNKNOWN_TOOL_CALLS,
+)
+
+# The content returned by a tool. A Sequence, so that handlers returning a list
+# of one content type (e.g. List[TextContent]) are accepted
+ToolResult = Sequence[types.TextContent | types.ImageContent | types.EmbeddedResource]
+ToolHandler = Callable[..., Awaitable[ToolResult]]
+
+
+def _error(text: str) -> ToolResult:
+    """
+    Build the error result of a tool call.
+
+    Args:
+        text: The error message.
+
+    Returns:
+        ToolResult: A single TextContent with the message.
+    """
+    return [types.TextContent(type="text", text=f"Error: {text}")]
+
+
+class ToolSpec:
+    """
+    A tool served by the MCP server.
+
+    The handler is called with the arguments named in the schema properties as
+    keyword arguments. Arguments that are not passed fall back to the defaults
+    of the handler, and unknown arguments are ignored.
+    """
+
+    __slots__ = (
+        "name",
+        "handler",
+        "required",
+        "parameters",
+        "tool",
+        "calls",
+        "errors",
+        "latency",
+        "response_bytes",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        handler: ToolHandler,
+        description: str,
+        properties: Dict[str, Dict[str, Any]],
+        required: Sequence[str] = (),
+    ) -> None:
+        """
+        Create a tool.
+
+        Args:
+            name: The name of the tool.
+            handler: The coroutine function implementing the tool.
+            description: The description shown to clients.
+            properties: The JSON schema of each argument, by argument name.
+            required: The names of the required arguments.
+
+        Raises:
+            ValueError: If a required argument is not one of the properties.
+        """
+        unknown = [arg for arg in required if arg not in properties]
+        if unknown:
+            raise ValueError(f"Required arguments of {name} not in schema: {unknown}")
+
+        schema: Dict[str, Any] = {"type": "object"}
+        if required:
+            schema["required"] = list(required)
+        schema["properties"] = properties
+
+        self.name = name
+        self.handler = handler
+        self.required = tuple(required)
+        self.parameters = tuple(properties)
+        self.tool = types.Tool(name=name, description=description, inputSchema=schema)
+
+        # Metrics of the tool, bound to its name once
+        self.calls = TOOL_CALLS.child(name)
+        self.errors = TOOL_ERRORS.child(name)
+        self.latency = TOOL_LATENCY.child(name)
+        self.response_bytes = TOOL_RESPONSE_BYTES.child(name)
+
+    async def __call__(self, arguments: Optional[Dict[str, Any]]) -> ToolResult:
+        """
+        Validate the arguments and call the handler.
+
+        Args:
+            arguments: The arguments of the tool call.
+
+        Returns:
+            ToolResult: The result of the handler, or an error if a required
+            argument is missing.
+        """
+        arguments = arguments or {}
+        for arg in self.required:
+            if arg not in arguments:
+                return _error(f"Missing required argument '{arg}'")
+
+        kwargs = {arg: arguments[arg] for arg in self.parameters if arg in arguments}
+        return await self.handler(**kwargs)
+
+
+class ToolRegistry:
+    """
+    Table of the tools served by the MCP server.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create an empty registry.
+        """
+        self._tools: Dict[str, ToolSpec] = {}
+        self._tool_list: Optional[List[types.Tool]] = None
+
+    def register(
+        self,
+        name: str,
+        handler: ToolHandler,
+        description: str,
+        properties: Dict[str, Dict[str, Any]],
+        required: Sequence[str] = (),
+    ) -> ToolSpec:
+        """
+        Add a tool to the registry.
+
+        Args:
+            name: The name of the tool.
+            handler: The coroutine function implementing the tool.
+            description: The description shown to clients.
+            properties: The JSON schema of each argument, by argument name.
+            required: The names of the required arguments.
+
+        Returns:
+            ToolSpec: The registered tool.
+
+        Raises:
+            ValueError: If a tool with the same name is already registered.
+        """
+        if name in self._tools:
+            raise ValueError(f"Tool already registered: {name}")
+
+        spec = ToolSpec(name, handler, description, properties, required)
+        self._tools[name] = spec
+        self._tool_list = None
+        return spec
+
+    def get(self, name: str) -> Optional[ToolSpec]:
+        """
+        Get a registered tool.
+
+        Args:
+            name: The name of the tool.
+
+        Returns:
+            Optional[ToolSpec]: The tool, or None if it is not registered.
+        """
+        return self._tools.get(name)
+
+    def names(self) -> List[str]:
+        """
+        Get the names of the registered tools in registration order.
+
+        Returns:
+            List[str]: The tool names.
+        """
+        return list(self._tools)
+
+    def list_tools(self) -> List[types.Tool]:
+        """
+        Get the tools for a tools/list response.
+
+        The list is built on first use and reused until a tool is registered.
+
+        Returns:
+            List[types.Tool]: The tool definitions in registration order.
+        """
+        if self._tool_list is None:
+            self._tool_list = [spec.tool for spec in self._tools.values()]
+        return self._tool_list
+
+    async def call(self, name: str, arguments: Optional[Dict[str, Any]]) -> ToolResult:
+        """
+        Call a tool by name, recording its metrics.
+
+        Args:
+            name: The name of the tool.
+            arguments: The arguments of the tool call.
+
+        Returns:
+            ToolResult: The result of the tool, or an error if the tool is unknown
+            or a required argument is missing.
+        """
+        spec = self._tools.get(name)
+        if spec is None:
+            UNKNOWN_TOOL_CALLS.inc()
+            return _error(f"Unknown tool: {name}")
+
+        start = time.perf_counter()
+        try:
+            result = await spec(arguments)
+        except Exception:
+            spec.errors.inc()
+            raise
+        finally:
+            spec.calls.inc()
+            spec.latency.observe(time.perf_counter() - start)
+
+        size = 0
+        for content in result:
+            text = getattr(content, "text", None)
+            if text:
+                size += len(text) if text.isascii() else len(text.encode("utf-8"))
+        spec.response_bytes.inc(size)
+
+        # Tools report failures as a text part starting with "Error:"
+        if result and (getattr(result[0], "text", None) or "").startswith("Error:"):
+            spec.errors.inc()
+
+        return result
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._tools
+
+    def __len__(self) -> int:
+        return len(self._tools)
@@ -0,0 +1,44 @@
+"""
+Shared fixtures for the tests.
+"""
+
+import httpx
+import pytest
+
+from mcp_hitchcode import railway_docs, server
+from mcp_hitchcode.docs_cache import configure_docs_cache
+from mcp_hitchcode.fetch_limits import configure_fetch_limits
+from mcp_hitchcode.http_cache import configure_response_cache
+from mcp_hitchcode.http_client import configure_http_client
+
+
+@pytest.fixture
+def serve_http():
+    """
+    Route the fetch tools to a mock handler and reset every fetch setting after.
+
+    The fixture is a function taking the handler, a callable from
+    httpx.Request to httpx.Response (sync or async), and whether to keep the
+    response cache enabled (disabled by default, so every fetch reaches the
+    handler). After the test the HTTP client, response cache, docs cache,
+    fetch limits and the fetch settings of the server are configured as on
+    startup.
+    """
+    fetch_max_bytes = server._fetch_max_bytes
+    fetch_format = server._fetch_format
+    parser_backend = railway_docs._parser_backend
+
+    def serve(handler, response_cache: bool = False) -> None:
+        configure_http_client(transport=httpx.MockTransport(handler))
+        configure_response_cache(enabled=response_cache)
+
+    yield serve
+
+    configure_http_client()
+    configure_response_cache()
+    configure_docs_cache()
+    configure_fetch_limits()
+    server.configure_fetch_many()
+    server.configure_fetch_max_bytes(fetch_max_bytes)
+    server.configure_fetch_format(fetch_format)
+    railway_docs.configure_parser_backend(parser_backend)
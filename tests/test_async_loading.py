@@ -0,0 +1,88 @@
+"""
+Test loading templates and Docker files off the event loop.
+"""
+
+import threading
+
+import pytest
+
+from mcp_hitchcode.templates import docker_file_loader, template_loader
+
+
+@pytest.fixture
+def cold_caches():
+    """Drop the compiled templates and the cached Docker files."""
+    template_loader.clear_compiled_template_cache()
+    docker_file_loader.clear_docker_file_cache()
+    yield
+    docker_file_loader.clear_docker_file_cache()
+
+
+@pytest.fixture
+def file_reads(monkeypatch):
+    """Record the thread that reads each Docker file from disk."""
+    reads = []
+    load = docker_file_loader.load_docker_file
+
+    def recording_load(file_path):
+        if not docker_file_loader.is_docker_file_cached(file_path):
+            reads.append((file_path, threading.current_thread()))
+        return load(file_path)
+
+    monkeypatch.setattr(docker_file_loader, "load_docker_file", recording_load)
+    return reads
+
+
+def test_compile_prefetches_constant_docker_files(
+    cold_caches, file_reads, tmp_path, monkeypatch
+):
+    """Test that compiling a template reads the Docker files it includes."""
+    template_path = "prompts/include/include_v1.0.0.md"
+    (tmp_path / "prompts" / "include").mkdir(parents=True)
+    (tmp_path / template_path).write_text(
+        "{{ docker_file('python/Dockerfile') }}{{ docker_compose(path) }}"
+    )
+    monkeypatch.setattr(template_loader, "_get_templates_dir", lambda: str(tmp_path))
+
+    template = template_loader._get_compiled_template("include", "1.0.0", template_path)
+    template_loader._template_cache.pop(template_path)
+
+    assert template_loader._docker_file_refs[template_path] == (
+        ("python/Dockerfile",),
+        ("path",),
+    )
+    assert [path for path, _ in file_reads] == ["python/Dockerfile"]
+    assert "FROM python" in template.render(path="multi-container/docker-compose.yml")
+
+
+@pytest.mark.asyncio
+async def test_async_render_reads_files_on_worker_thread(cold_caches, file_reads):
+    """Test that a cold async render reads template and Docker files off the loop."""
+    kwargs = {
+        "docker_file_path": "python/Dockerfile",
+        "docker_compose_path": "multi-container/docker-compose.yml",
+    }
+
+    rendered = await template_loader.render_prompt_template_async(
+        "docker", "1.0.0", **kwargs
+    )
+
+    assert {path for path, _ in file_reads} == set(kwargs.values())
+    assert all(thread is not threading.main_thread() for _, thread in file_reads)
+    assert rendered == template_loader.render_prompt_template(
+        "docker", "1.0.0", **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_loaders(cold_caches):
+    """Test that the async loaders return the same content as the sync ones."""
+    content = await docker_file_loader.load_docker_file_async("python/Dockerfile")
+    assert content == docker_file_loader.load_docker_file("python/Dockerfile")
+
+    template_path = "prompts/docker/docker_v1.2.0.md"
+    content = await template_loader.load_template_async(template_path)
+    assert content == template_loader.load_template(template_path)
+
+    with pytest.raises(FileNotFoundError):
+        await docker_file_loader.load_docker_file_async("missing/Dockerfile")
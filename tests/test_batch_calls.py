@@ -0,0 +1,129 @@
+"""
+Test batch tool calls on the SSE POST endpoint.
+"""
+
+import anyio
+import httpx
+import mcp.types as types
+import pytest
+
+from mcp_hitchcode import server
+from mcp_hitchcode.tool_registry import ToolRegistry
+
+
+@pytest.fixture
+def running():
+    """Replace the server tools with tools that record their concurrency."""
+    state = {"running": 0, "peak": 0}
+
+    async def sleep(text: str, delay: float = 0.0):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await anyio.sleep(delay)
+        state["running"] -= 1
+        return [types.TextContent(type="text", text=text)]
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    tools = ToolRegistry()
+    properties = {"text": {"type": "string"}, "delay": {"type": "number"}}
+    tools.register("sleep", sleep, "Sleep", properties, required=["text"])
+    tools.register("fail", fail, "Fail", {})
+
+    original = server.TOOLS
+    server.TOOLS = tools
+    yield state
+    server.TOOLS = original
+    server.configure_batch()
+
+
+async def _post(body):
+    """Post a JSON body to /sse of the SSE app."""
+    transport = httpx.ASGITransport(app=server.create_sse_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        return await client.post("/sse", json=body)
+
+
+@pytest.mark.asyncio
+async def test_results_in_order(running):
+    """Test that results come back in call order, even if calls finish out of order."""
+    calls = [
+        {"tool": "sleep", "arguments": {"text": str(i), "delay": (5 - i) * 0.01}}
+        for i in range(5)
+    ]
+    response = await _post({"calls": calls})
+
+    assert response.status_code == 200
+    texts = [item["result"][0]["text"] for item in response.json()["results"]]
+    assert texts == ["0", "1", "2", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_per_item_errors(running):
+    """Test that failing calls are reported without affecting the others."""
+    calls = [
+        {"tool": "sleep", "arguments": {"text": "ok"}},
+        {"tool": "fail"},
+        {"tool": "sleep", "arguments": {}},
+        {"tool": "missing"},
+        {"arguments": {}},
+        {"tool": "sleep", "arguments": "text"},
+    ]
+    results = (await _post({"calls": calls})).json()["results"]
+
+    assert results[0] == {"result": [{"type": "text", "text": "ok"}]}
+    assert results[1] == {"error": "RuntimeError: boom"}
+    assert results[2]["result"][0]["text"] == (
+        "Error: Missing required argument 'text'"
+    )
+    assert results[3]["result"][0]["text"] == "Error: Unknown tool: missing"
+    assert "error" in results[4]
+    assert "error" in results[5]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded(running):
+    """Test that at most --batch-concurrency calls run at the same time."""
+    server.configure_batch(concurrency=3)
+    calls = [
+        {"tool": "sleep", "arguments": {"text": "x", "delay": 0.01}} for _ in range(10)
+    ]
+    response = await _post({"calls": calls})
+
+    assert len(response.json()["results"]) == 10
+    assert running["peak"] == 3
+
+
+@pytest.mark.asyncio
+async def test_invalid_batches(running):
+    """Test that oversized and malformed batches are rejected."""
+    server.configure_batch(max_calls=2)
+    calls = [{"tool": "sleep", "arguments": {"text": "x"}}] * 3
+
+    assert (await _post({"calls": calls})).status_code == 413
+    assert (await _post({"calls": "sleep"})).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_single_call(running):
+    """Test that single calls keep their response format."""
+    response = await _post({"tool": "sleep", "arguments": {"text": "one"}})
+    assert response.json() == {"result": [{"type": "text", "text": "one"}]}
+
+
+@pytest.mark.asyncio
+async def test_invalid_single_calls(running):
+    """Test that bodies that are not a call are rejected with 400."""
+    for body in ([{"tool": "sleep"}], "sleep", 1, {"arguments": {}}, {"tool": 1}):
+        response = await _post(body)
+        assert response.status_code == 400
+        assert "error" in response.json()
+
+    response = await _post({"tool": "sleep", "arguments": ["x"]})
+    assert response.json() == {"error": "'arguments' must be an object"}
+
+    transport = httpx.ASGITransport(app=server.create_sse_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        response = await client.post("/sse", content=b"{not json")
+    assert response.status_code == 400
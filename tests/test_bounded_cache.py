@@ -0,0 +1,111 @@
+"""
+Test the bounded cache and the cache registry.
+"""
+
+import time
+
+import pytest
+
+from mcp_hitchcode import bounded_cache
+from mcp_hitchcode.bounded_cache import (
+    BoundedCache,
+    clear_caches,
+    get_cache_info,
+    register_cache,
+    unregister_cache,
+)
+from mcp_hitchcode.templates import docker_file_loader
+
+
+def test_entry_bound_evicts_least_recently_used():
+    """Test that the least recently used entry is evicted over max_entries."""
+    cache = BoundedCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.keys() == ["a", "c"]
+    assert cache.info()["evictions"] == 1
+
+
+def test_byte_bound_evicts_and_skips_oversized_values():
+    """Test that values are evicted to the byte budget and oversized ones skipped."""
+    cache = BoundedCache(max_bytes=10, sizeof=len)
+    cache.put("a", "x" * 4)
+    cache.put("b", "x" * 4)
+    cache.put("c", "x" * 4)
+
+    assert "a" not in cache
+    assert cache.info()["bytes"] == 8
+    assert cache.put("d", "x" * 11) is False
+    assert "d" not in cache
+
+
+def test_entries_expire():
+    """Test that entries expire after the TTL."""
+    cache = BoundedCache(ttl=0.01)
+    cache.put("a", 1)
+    time.sleep(0.02)
+
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert cache.info()["expirations"] == 1
+
+
+def test_invalidate_by_predicate():
+    """Test that only the matching keys are invalidated."""
+    cache = BoundedCache(sizeof=len)
+    cache.put(("t", "1"), "xx")
+    cache.put(("t", "2"), "xx")
+    cache.put(("u", "1"), "xx")
+
+    assert cache.invalidate(lambda key: key[0] == "t") == 2
+    assert cache.keys() == [("u", "1")]
+    assert cache.info()["bytes"] == 2
+
+
+def test_resize_evicts_over_new_bound():
+    """Test that shrinking a cache evicts entries and invalid bounds are rejected."""
+    cache = BoundedCache(max_entries=4)
+    for key in "abcd":
+        cache.put(key, key)
+    cache.resize(max_entries=2)
+
+    assert cache.keys() == ["c", "d"]
+    with pytest.raises(ValueError):
+        cache.resize(max_entries=0)
+    with pytest.raises(ValueError):
+        BoundedCache(ttl=0)
+
+
+def test_registry_reports_and_clears_caches(monkeypatch):
+    """Test that registered caches are reported and cleared by name."""
+    monkeypatch.setattr(bounded_cache, "_caches", {})
+    first = register_cache("first", BoundedCache())
+    second = register_cache("second", BoundedCache())
+    first.put("a", 1)
+    second.put("b", 2)
+
+    assert get_cache_info()["first"]["size"] == 1
+    assert clear_caches("first") == 1
+    assert len(first) == 0 and len(second) == 1
+    assert clear_caches() == 1
+
+    unregister_cache("second")
+    assert list(get_cache_info()) == ["first"]
+
+
+def test_clear_docker_file_cache_reloads_from_disk(tmp_path, monkeypatch):
+    """Test that clearing the Docker file cache makes the next load read the file."""
+    (tmp_path / "Dockerfile").write_text("FROM a")
+    monkeypatch.setattr(docker_file_loader, "_get_docker_dir", lambda: str(tmp_path))
+    docker_file_loader.clear_docker_file_cache()
+
+    assert docker_file_loader.load_docker_file("Dockerfile") == "FROM a"
+    (tmp_path / "Dockerfile").write_text("FROM b")
+    assert docker_file_loader.load_docker_file("Dockerfile") == "FROM a"
+
+    docker_file_loader.clear_docker_file_cache()
+    assert docker_file_loader.load_docker_file("Dockerfile") == "FROM b"
+    docker_file_loader.clear_docker_file_cache()
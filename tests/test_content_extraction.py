@@ -0,0 +1,83 @@
+"""
+Test the content extraction of fetched pages.
+"""
+
+import pytest
+
+from mcp_hitchcode.content_extraction import ContentExtractor, extract_content
+
+PAGE = """<!doctype html>
+<html><head><title>Docs</title><style>body { color: red }</style></head>
+<body>
+<nav><a href="/">Home</a> <a href="/docs">Docs</a></nav>
+<script>document.write("<p>hidden</p>")</script>
+<h1>Railway &amp; the CLI</h1>
+<p>Install   the <b>CLI</b>
+with <code>npm</code>.</p>
+<ul>
+  <li><p>railway login</p></li>
+  <li>railway up
+    <ul><li>--detach</li></ul>
+  </li>
+</ul>
+<ol><li>first</li><li>second</li></ol>
+<pre><code class="language-bash">npm i -g @railway/cli
+railway init</code></pre>
+</body></html>"""
+
+MARKDOWN = """# Railway & the CLI
+
+Install the CLI with `npm`.
+
+- railway login
+- railway up
+  - --detach
+
+1. first
+2. second
+
+```bash
+npm i -g @railway/cli
+railway init
+```"""
+
+
+def test_markdown():
+    """Test that headings, lists and code survive and markup is dropped."""
+    assert extract_content(PAGE) == MARKDOWN
+
+
+def test_text():
+    """Test that the text format drops the markdown syntax."""
+    text = extract_content(PAGE, "text")
+
+    assert text.startswith("Railway & the CLI\n\nInstall the CLI with npm.")
+    assert "```" not in text
+    assert "npm i -g @railway/cli\nrailway init" in text
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_chunked_feed_matches_single_feed(chunk_size):
+    """Test that the output does not depend on how the markup is split."""
+    extractor = ContentExtractor()
+    drained = []
+    for i in range(0, len(PAGE), chunk_size):
+        extractor.feed(PAGE[i : i + chunk_size])
+        drained.append(extractor.drain())
+
+    assert extractor.result() == MARKDOWN
+    assert "".join(drained) + extractor.drain() == MARKDOWN
+    assert any(drained[: len(drained) // 2])
+
+
+def test_unclosed_markup_is_flushed():
+    """Test that a page cut off mid-element still returns its content."""
+    assert extract_content("<h2>Usage</h2><pre>railway up\nrail") == (
+        "## Usage\n\n```\nrailway up\nrail\n```"
+    )
+
+
+def test_unknown_format():
+    """Test that an unknown output format is rejected."""
+    with pytest.raises(ValueError):
+        ContentExtractor("pdf")
@@ -0,0 +1,242 @@
+"""
+Test the Railway docs cache.
+"""
+
+import os
+import threading
+import time
+
+import anyio
+import httpx
+import pytest
+
+from mcp_hitchcode import docs_cache
+from mcp_hitchcode.docs_cache import (
+    DocsCache,
+    configure_docs_cache,
+    docs_refresh_lifespan,
+    extract_docs_page,
+    get_docs_page,
+    wait_for_refreshes,
+)
+from mcp_hitchcode.http_cache import get_response_cache
+from mcp_hitchcode.server import fetch_railway_docs, fetch_railway_docs_optimized
+
+URL = "https://docs.railway.app/guides/cli"
+
+PAGE = """<html><body>
+<h2>Login</h2><pre><code>railway login</code></pre>
+</body></html>"""
+
+
+@pytest.fixture
+def docs_site(serve_http):
+    """Serve the docs page via serve_http; set 'down' to fail the requests."""
+    state = {"requests": 0, "page": PAGE, "down": False}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state["requests"] += 1
+        if state["down"]:
+            raise httpx.ConnectError("network is down", request=request)
+        return httpx.Response(200, text=state["page"])
+
+    serve_http(handler)
+    return state
+
+
+def _age(url: str, seconds: float) -> None:
+    """Make the cached copy of a page look older than it is."""
+    docs_cache.get_docs_cache().get(url).fetched_at -= seconds
+
+
+async def _fetch(url: str, text: str):
+    """Return a page as the Railway docs fetcher would."""
+    return text, False
+
+
+@pytest.mark.asyncio
+async def test_fresh_copy_is_served_without_fetching(docs_site):
+    """Test that a page is fetched once while it is fresh."""
+    first = await fetch_railway_docs(URL)
+    second = await fetch_railway_docs(URL)
+
+    assert first[0].text == second[0].text == PAGE
+    assert docs_site["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pages_bypass_the_response_cache(docs_site, serve_http):
+    """Test that docs pages are kept by the docs cache only."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=PAGE, headers={"Cache-Control": "max-age=600"})
+
+    serve_http(handler, response_cache=True)
+
+    await fetch_railway_docs(URL)
+
+    assert get_response_cache().info()["size"] == 0
+    assert docs_cache.get_docs_cache().info()["size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_copy_is_served_and_refreshed(docs_site):
+    """Test that a stale page is returned at once and refetched in the background."""
+    configure_docs_cache(ttl=60)
+    async with docs_refresh_lifespan():
+        await fetch_railway_docs(URL)
+        _age(URL, 120)
+        docs_site["page"] = PAGE.replace("login", "logout")
+
+        result = await fetch_railway_docs(URL)
+        assert result[0].text == PAGE
+
+        await wait_for_refreshes()
+        result = await fetch_railway_docs(URL)
+    assert "railway logout" in result[0].text
+    assert docs_site["requests"] == 2
+    assert docs_cache.get_docs_cache().info()["refreshes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_copy_is_refreshed_inline_without_lifespan(docs_site):
+    """Test that a stale page is refetched before returning outside the lifespan."""
+    configure_docs_cache(ttl=60)
+    await fetch_railway_docs(URL)
+    _age(URL, 120)
+    docs_site["page"] = PAGE.replace("login", "logout")
+
+    result = await fetch_railway_docs(URL)
+
+    assert "railway logout" in result[0].text
+    assert not docs_cache._refreshes
+
+
+@pytest.mark.asyncio
+async def test_lifespan_cancels_refreshes_in_flight(docs_site):
+    """Test that background refetches do not outlive the lifespan."""
+    started = []
+
+    async def hang(url):
+        started.append(url)
+        await anyio.sleep_forever()
+
+    async with docs_refresh_lifespan():
+        await get_docs_page(URL, lambda url: _fetch(url, PAGE))
+        _age(URL, 2 * 24 * 60 * 60)
+        await get_docs_page(URL, hang)
+        await anyio.sleep(0)
+
+    assert started == [URL]
+    assert not docs_cache._refreshes
+    assert docs_cache._task_group is None
+
+
+@pytest.mark.asyncio
+async def test_unchanged_content_is_not_parsed_again(docs_site):
+    """Test that commands are extracted once per content hash."""
+    calls = []
+
+    def extractor(text):
+        calls.append(text)
+        return "railway login"
+
+    page = await get_docs_page(URL, lambda url: _fetch(url, PAGE))
+    assert await extract_docs_page(page, "commands", extractor) == "railway login"
+
+    _age(URL, 2 * 24 * 60 * 60)
+    await get_docs_page(URL, lambda url: _fetch(url, PAGE))
+    await wait_for_refreshes()
+    page = await get_docs_page(URL, lambda url: _fetch(url, PAGE))
+    assert await extract_docs_page(page, "commands", extractor) == "railway login"
+    assert len(calls) == 1
+
+    _age(URL, 2 * 24 * 60 * 60)
+    await get_docs_page(URL, lambda url: _fetch(url, PAGE + " "))
+    await wait_for_refreshes()
+    page = await get_docs_page(URL, lambda url: _fetch(url, PAGE))
+    await extract_docs_page(page, "commands", extractor)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_last_good_copy(docs_site):
+    """Test that the last good copy is served while the network is down."""
+    await fetch_railway_docs_optimized(URL)
+    _age(URL, 2 * 24 * 60 * 60)
+    docs_site["down"] = True
+
+    async with docs_refresh_lifespan():
+        result = await fetch_railway_docs_optimized(URL)
+        await wait_for_refreshes()
+    assert "railway login" in result[0].text
+    result = await fetch_railway_docs_optimized(URL)
+
+    assert "railway login" in result[0].text
+    assert docs_cache.get_docs_cache().info()["refresh_errors"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_offline_mode_never_refetches(docs_site, tmp_path):
+    """Test that offline mode serves a copy persisted by an earlier process."""
+    configure_docs_cache(directory=str(tmp_path))
+    await fetch_railway_docs(URL)
+    assert docs_site["requests"] == 1
+
+    configure_docs_cache(directory=str(tmp_path), offline=True)
+    _age(URL, 365 * 24 * 60 * 60)
+    docs_site["down"] = True
+
+    result = await fetch_railway_docs(URL)
+    await wait_for_refreshes()
+    assert result[0].text == PAGE
+    assert docs_site["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_is_used_off_the_event_loop(docs_site, tmp_path, monkeypatch):
+    """Test that reads and writes of the disk tier run on worker threads."""
+    threads = []
+    for name in ("_load", "_save"):
+        method = getattr(DocsCache, name)
+
+        def record(self, *args, method=method):
+            threads.append(threading.get_ident())
+            return method(self, *args)
+
+        monkeypatch.setattr(DocsCache, name, record)
+
+    configure_docs_cache(directory=str(tmp_path))
+    await fetch_railway_docs_optimized(URL)
+    configure_docs_cache(directory=str(tmp_path))
+    result = await fetch_railway_docs_optimized(URL)
+
+    assert "railway login" in result[0].text
+    assert docs_site["requests"] == 1
+    assert len(threads) >= 3
+    assert threading.get_ident() not in threads
+
+
+def test_disk_tier_persists_pages_and_extractions(tmp_path):
+    """Test that pages and extractions survive a restart, without old versions."""
+    cache = DocsCache(directory=str(tmp_path))
+    entry = cache.put(URL, PAGE)
+    cache.extract(entry, "commands", lambda text: "railway login")
+
+    restarted = DocsCache(directory=str(tmp_path))
+    copy = restarted.get(URL)
+    assert copy.text == PAGE
+    assert copy.content_hash == entry.content_hash
+    assert abs(copy.fetched_at - time.time()) < 5
+    assert restarted.extract(copy, "commands", lambda text: None) == "railway login"
+
+    restarted.put(URL, PAGE + " ")
+    pages = [name for name in os.listdir(tmp_path) if name.endswith(".page")]
+    assert len(pages) == 1
+    assert DocsCache(directory=str(tmp_path)).get(URL).extracted == {}
+
+
+def test_invalid_ttl():
+    """Test that a cache without a positive TTL is rejected."""
+    with pytest.raises(ValueError):
+        DocsCache(ttl=0)
@@ -0,0 +1,141 @@
+"""
+Test fetching several websites with mcp_fetch_many.
+"""
+
+import time
+
+import anyio
+import httpx
+import pytest
+
+from mcp_hitchcode import fetch_limits
+from mcp_hitchcode.fetch_limits import TokenBucket, configure_fetch_limits
+from mcp_hitchcode.server import configure_fetch_many, fetch_many
+
+
+@pytest.fixture
+def sites(serve_http):
+    """Serve slow pages via serve_http, counting requests in flight per host."""
+    in_flight = {}
+    peak = {}
+    started = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/broken":
+            raise httpx.ConnectError("connection refused", request=request)
+        host = request.url.host
+        started.append((host, time.monotonic()))
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        try:
+            await anyio.sleep(1.0 if request.url.path == "/slow" else 0.1)
+        finally:
+            in_flight[host] -= 1
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, text=f"page {request.url}")
+
+    serve_http(handler)
+    return peak, started
+
+
+@pytest.mark.asyncio
+async def test_results_are_in_order_with_status(sites):
+    """Test that every URL gets its own result and status, in order."""
+    urls = [f"https://a{i}.example.com/page" for i in range(8)]
+    urls[3] = "https://a3.example.com/missing"
+
+    start = time.monotonic()
+    result = await fetch_many(urls)
+    elapsed = time.monotonic() - start
+
+    assert [part.text.split("\n")[0] for part in result] == [
+        f"URL: {url}" for url in urls
+    ]
+    assert result[0].text.endswith("page https://a0.example.com/page")
+    assert "Status: 200" in result[0].text
+    assert "Status: 404" in result[3].text
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency_is_capped(sites):
+    """Test that at most per_host requests run against one host."""
+    peak, _ = sites
+    configure_fetch_limits(concurrency=16, per_host=2)
+
+    await fetch_many([f"https://same.example.com/{i}" for i in range(6)])
+
+    assert peak["same.example.com"] == 2
+    assert not fetch_limits._hosts
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spaces_requests(sites):
+    """Test that the token bucket spaces requests to a host after the burst."""
+    _, started = sites
+    configure_fetch_limits(rate=20, burst=1)
+
+    await fetch_many([f"https://rate.example.com/{i}" for i in range(4)])
+
+    times = sorted(start for _, start in started)
+    assert times[-1] - times[0] >= 0.14
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_host_does_not_hold_global_slots(sites):
+    """Test that a host waiting for a rate limit token leaves others running."""
+    _, started = sites
+    configure_fetch_limits(concurrency=2, rate=1, burst=1)
+
+    await fetch_many(
+        [
+            "https://slow.example.com/1",
+            "https://slow.example.com/2",
+            "https://other.example.com/1",
+        ],
+        timeout=0.3,
+    )
+
+    first = min(start for _, start in started)
+    other = [start for host, start in started if host == "other.example.com"]
+    assert other[0] - first < 0.05
+
+
+@pytest.mark.asyncio
+async def test_timeout_and_errors_are_per_url(sites):
+    """Test that a slow or failing URL does not fail the others."""
+    result = await fetch_many(
+        [
+            "https://b.example.com/slow",
+            "https://b.example.com/ok",
+            "https://c.example.com/broken",
+        ],
+        timeout=0.3,
+    )
+
+    assert "Status: timeout" in result[0].text
+    assert "timed out" in result[0].text
+    assert "Status: 200" in result[1].text
+    assert "Status: error" in result[2].text
+    assert "connection refused" in result[2].text
+
+
+@pytest.mark.asyncio
+async def test_url_list_is_validated(sites):
+    """Test that invalid or too long URL lists are rejected."""
+    configure_fetch_many(max_urls=2)
+
+    result = await fetch_many(["https://a.example.com"] * 3)
+    assert result[0].text == "Error: Too many URLs: 3 > 2"
+
+    result = await fetch_many("https://a.example.com")
+    assert result[0].text == "Error: 'urls' must be a list"
+
+
+def test_invalid_limits():
+    """Test that invalid limits are rejected."""
+    with pytest.raises(ValueError):
+        configure_fetch_limits(per_host=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, burst=1)
@@ -0,0 +1,129 @@
+"""
+Test the size-capped, streaming download of fetch_website.
+"""
+
+import httpx
+import pytest
+
+from mcp_hitchcode import server
+from mcp_hitchcode.server import fetch_website
+
+
+@pytest.fixture
+def page(serve_http):
+    """Serve a 10 kB page through the shared client."""
+    body = "".join(f"{i:04d}\n" for i in range(2000))
+    sent = []
+
+    async def stream():
+        for i in range(0, len(body), 1000):
+            sent.append(i)
+            yield body[i : i + 1000].encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=stream())
+
+    serve_http(handler)
+    return body, sent
+
+
+@pytest.mark.asyncio
+async def test_body_within_budget_is_complete(page):
+    """Test that a page within the budget is returned whole."""
+    body, _ = page
+
+    result = await fetch_website("https://example.com", max_bytes=len(body))
+
+    assert len(result) == 1
+    assert result[0].text == body
+
+
+@pytest.mark.asyncio
+async def test_download_aborts_at_budget(page):
+    """Test that the download stops early and the content is marked."""
+    body, sent = page
+
+    result = await fetch_website("https://example.com", max_bytes=2500)
+
+    assert result[0].text.startswith(body[:2500])
+    assert result[0].text.endswith("[Content truncated after 2500 bytes]")
+    assert len(sent) < len(body) // 1000
+
+
+@pytest.mark.asyncio
+async def test_content_is_chunked(page):
+    """Test that the content can be returned as several parts."""
+    body, _ = page
+
+    result = await fetch_website("https://example.com", chunk_size=4000)
+
+    assert [len(part.text) for part in result] == [4000, 4000, 2000]
+    assert "".join(part.text for part in result) == body
+
+
+@pytest.mark.asyncio
+async def test_invalid_chunk_size_is_rejected(page):
+    """Test that a chunk size below 1 returns an error instead of no content."""
+    result = await fetch_website("https://example.com", chunk_size=-5)
+
+    assert len(result) == 1
+    assert result[0].text == "Error: 'chunk_size' must be at least 1, got -5"
+
+
+@pytest.fixture
+def html_page(serve_http, monkeypatch):
+    """Serve an HTML page in chunks, recording what the extractor is fed."""
+    body = "<html><body><h1>Title</h1>" + "<p>text</p>" * 500 + "</body></html>"
+    fed = []
+
+    class RecordingExtractor(server.ContentExtractor):
+        def feed(self, data):
+            fed.append(data)
+            super().feed(data)
+
+    async def stream():
+        for i in range(0, len(body), 1000):
+            yield body[i : i + 1000].encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/plain":
+            return httpx.Response(200, text="<not html>")
+        return httpx.Response(
+            200, headers={"content-type": "text/html"}, content=stream()
+        )
+
+    monkeypatch.setattr(server, "ContentExtractor", RecordingExtractor)
+    serve_http(handler)
+    return body, fed
+
+
+@pytest.mark.asyncio
+async def test_markdown_is_extracted_while_downloading(html_page):
+    """Test that the extractor is fed each chunk of the download."""
+    body, fed = html_page
+
+    result = await fetch_website("https://example.com", format="markdown")
+
+    assert result[0].text.startswith("# Title\n\ntext\n\ntext")
+    assert "<p>" not in result[0].text
+    assert len(fed) > 1
+    assert "".join(fed) == body
+
+
+@pytest.mark.asyncio
+async def test_extracted_content_is_marked_truncated(html_page):
+    """Test that extraction stops at the byte budget."""
+    result = await fetch_website("https://example.com", max_bytes=100, format="text")
+
+    assert result[0].text.startswith("Title\n\ntext")
+    assert result[0].text.endswith("[Content truncated after 100 bytes]")
+
+
+@pytest.mark.asyncio
+async def test_non_html_pages_are_returned_as_served(html_page):
+    """Test that only HTML pages are extracted."""
+    result = await fetch_website("https://example.com/plain", format="markdown")
+    assert result[0].text == "<not html>"
+
+    result = await fetch_website("https://example.com", format="pdf")
+    assert result[0].text.startswith("Error: Unknown format 'pdf'")
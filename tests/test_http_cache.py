@@ -0,0 +1,186 @@
+"""
+Test the HTTP response cache of the fetch tools.
+"""
+
+import os
+import threading
+
+import httpx
+import pytest
+
+from mcp_hitchcode import http_cache
+from mcp_hitchcode.http_cache import ResponseCache, cached_get
+
+
+class FakeServer:
+    """A mock HTTP server that answers conditional requests."""
+
+    def __init__(self, headers):
+        self.headers = headers
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = self.headers.get("ETag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=self.headers)
+        return httpx.Response(200, headers=self.headers, text="docs page")
+
+
+@pytest.fixture
+def response_cache():
+    """Use a fresh in-memory response cache for one test."""
+    http_cache.configure_response_cache()
+    yield http_cache.get_response_cache()
+    http_cache.configure_response_cache()
+
+
+async def _fetch_twice(server):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        first = await cached_get(client, "https://docs.example.com/cli")
+        second = await cached_get(client, "https://docs.example.com/cli")
+    return first, second
+
+
+@pytest.mark.asyncio
+async def test_fresh_response_served_from_cache(response_cache):
+    """Test that a response within max-age is not fetched again."""
+    server = FakeServer({"Cache-Control": "max-age=600"})
+
+    first, second = await _fetch_twice(server)
+
+    assert first.text == second.text == "docs page"
+    assert len(server.requests) == 1
+    assert response_cache.info()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_body_is_passed_to_on_text(response_cache):
+    """Test that on_text receives the body of fetched and cached pages."""
+    server = FakeServer({"Cache-Control": "max-age=600"})
+    texts = []
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        for max_bytes in (None, 100, 4):
+            await cached_get(
+                client,
+                "https://docs.example.com/cli",
+                max_bytes=max_bytes,
+                on_text=texts.append,
+            )
+
+    assert texts == ["docs page", "docs page", "docs"]
+    assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_response_is_revalidated(response_cache):
+    """Test that a stale response is revalidated with If-None-Match."""
+    server = FakeServer({"Cache-Control": "no-cache", "ETag": '"v1"'})
+
+    first, second = await _fetch_twice(server)
+
+    assert second.status_code == 200
+    assert second.text == "docs page"
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+    assert response_cache.info()["revalidated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_no_store_response_is_not_cached(response_cache):
+    """Test that a no-store response is fetched every time."""
+    server = FakeServer({"Cache-Control": "no-store", "ETag": '"v1"'})
+
+    await _fetch_twice(server)
+
+    assert len(server.requests) == 2
+    assert "If-None-Match" not in server.requests[1].headers
+    assert response_cache.info()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_fetches():
+    """Test that disabling the cache sends every request."""
+    http_cache.configure_response_cache(enabled=False)
+    try:
+        server = FakeServer({"Cache-Control": "max-age=600"})
+        await _fetch_twice(server)
+        assert len(server.requests) == 2
+    finally:
+        http_cache.configure_response_cache()
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    """Test that pages stored on disk are found by a new cache."""
+    response = httpx.Response(
+        200,
+        headers={"ETag": '"v1"'},
+        text="docs page",
+        request=httpx.Request("GET", "https://docs.example.com/cli"),
+    )
+    entry = http_cache.CachedResponse.from_response(
+        "https://docs.example.com/cli", response, 60
+    )
+    ResponseCache(directory=str(tmp_path)).put(entry)
+
+    restored = ResponseCache(directory=str(tmp_path)).get(
+        "https://docs.example.com/cli"
+    )
+
+    assert restored is not None
+    assert restored.to_response().text == "docs page"
+    assert restored.validators() == {"If-None-Match": '"v1"'}
+
+
+@pytest.mark.asyncio
+async def test_revalidation_rewrites_only_metadata(tmp_path):
+    """Test that a 304 updates the stored expiry without rewriting the body."""
+    http_cache.configure_response_cache(directory=str(tmp_path))
+    try:
+        server = FakeServer({"Cache-Control": "no-cache", "ETag": '"v1"'})
+        async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+            await cached_get(client, "https://docs.example.com/cli")
+            path = http_cache.get_response_cache()._disk_path(
+                "https://docs.example.com/cli"
+            )
+            body = os.stat(path + ".body")
+            metadata = os.stat(path + ".json")
+
+            second = await cached_get(client, "https://docs.example.com/cli")
+
+        assert second.text == "docs page"
+        assert http_cache.get_response_cache().info()["revalidated"] == 1
+        assert os.stat(path + ".body").st_ino == body.st_ino
+        assert os.stat(path + ".body").st_mtime_ns == body.st_mtime_ns
+        assert os.stat(path + ".json").st_ino != metadata.st_ino
+    finally:
+        http_cache.configure_response_cache()
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_is_used_off_the_event_loop(tmp_path, monkeypatch):
+    """Test that reads and writes of the disk tier run on worker threads."""
+    threads = []
+    for name in ("_load", "_write"):
+        method = getattr(ResponseCache, name)
+
+        def record(self, *args, method=method, **kwargs):
+            threads.append(threading.get_ident())
+            return method(self, *args, **kwargs)
+
+        monkeypatch.setattr(ResponseCache, name, record)
+
+    server = FakeServer({"Cache-Control": "max-age=600"})
+    http_cache.configure_response_cache(directory=str(tmp_path))
+    try:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+            await cached_get(client, "https://docs.example.com/cli")
+            http_cache.configure_response_cache(directory=str(tmp_path))
+            second = await cached_get(client, "https://docs.example.com/cli")
+    finally:
+        http_cache.configure_response_cache()
+
+    assert second.text == "docs page"
+    assert len(server.requests) == 1
+    assert len(threads) == 3
+    assert threading.get_ident() not in threads
@@ -0,0 +1,65 @@
+"""
+Test the shared HTTP client of the fetch tools.
+"""
+
+import httpx
+import pytest
+
+from mcp_hitchcode import http_client as http_client_module
+from mcp_hitchcode.http_client import (
+    configure_http_client,
+    http_client,
+    http_client_lifespan,
+)
+from mcp_hitchcode.server import fetch_website
+
+
+@pytest.fixture
+def requests_seen(serve_http):
+    """Route the shared client to serve_http, recording the requests."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, text=f"page {request.url.path}")
+
+    serve_http(handler)
+    return seen
+
+
+@pytest.mark.asyncio
+async def test_lifespan_shares_one_client(requests_seen):
+    """Test that all fetches inside the lifespan use the same client."""
+    async with http_client_lifespan() as shared:
+        async with http_client() as first, http_client() as second:
+            assert first is shared
+            assert second is shared
+
+        result = await fetch_website("https://example.com/docs")
+        assert not shared.is_closed
+
+    assert shared.is_closed
+    assert http_client_module._client is None
+    assert result[0].text == "page /docs"
+    assert requests_seen[0].headers["User-Agent"].startswith("MCP Test Server")
+
+
+@pytest.mark.asyncio
+async def test_client_outside_lifespan_is_closed(requests_seen):
+    """Test that a temporary client is used and closed outside the lifespan."""
+    async with http_client() as client:
+        response = await client.get("https://example.com/page")
+
+    assert response.text == "page /page"
+    assert client.is_closed
+
+
+def test_configure_pool_limits():
+    """Test that the configured limits are used for new clients."""
+    configure_http_client(max_connections=5, max_keepalive_connections=2)
+    try:
+        limits = http_client_module._limits
+        assert limits.max_connections == 5
+        assert limits.max_keepalive_connections == 2
+    finally:
+        configure_http_client()
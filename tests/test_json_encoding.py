@@ -0,0 +1,65 @@
+"""
+Test the JSON encoding of tool results.
+"""
+
+import json
+
+import mcp.types as types
+import pytest
+from starlette.responses import JSONResponse
+
+from mcp_hitchcode import json_encoding
+from mcp_hitchcode.json_encoding import configure_json_encoder, encode_content
+from mcp_hitchcode.server import serialize_content
+
+CONTENT = [
+    types.TextContent(type="text", text="plain"),
+    types.TextContent(type="text", text='quotes " and \\ backslashes\n\ttabs'),
+    types.TextContent(type="text", text="unicode ❤️ ü   \x00 𝄞"),
+    types.TextContent(type="text", text=""),
+]
+
+ENCODERS = ["json"]
+if json_encoding.orjson is not None:
+    ENCODERS.append("orjson")
+
+
+@pytest.fixture(params=ENCODERS)
+def encoder(request):
+    """Run a test with each installed encoder."""
+    configure_json_encoder(request.param)
+    yield request.param
+    configure_json_encoder()
+
+
+def test_same_json_as_serialize_content(encoder):
+    """Test that the encoded content decodes to the serialized content."""
+    encoded = encode_content(CONTENT)
+    assert json.loads(encoded) == serialize_content(CONTENT)
+    assert encode_content([]) == b"[]"
+
+
+def test_stdlib_encoding_matches_json_response():
+    """Test that the stdlib encoder produces the bytes JSONResponse produced."""
+    configure_json_encoder("json")
+    try:
+        body = b'{"result":' + encode_content(CONTENT) + b"}"
+        expected = JSONResponse({"result": serialize_content(CONTENT)}).body
+        assert body == expected
+    finally:
+        configure_json_encoder()
+
+
+def test_configure_json_encoder():
+    """Test selecting the encoder."""
+    try:
+        configure_json_encoder("json")
+        assert json_encoding.get_json_encoder() == "json"
+        configure_json_encoder("auto")
+        expected = "json" if json_encoding.orjson is None else "orjson"
+        assert json_encoding.get_json_encoder() == expected
+    finally:
+        configure_json_encoder()
+
+    with pytest.raises(ValueError):
+        configure_json_encoder("yaml")
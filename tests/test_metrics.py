@@ -0,0 +1,89 @@
+"""
+Test the metrics registry and the /metrics endpoint.
+"""
+
+import httpx
+import pytest
+
+from mcp_hitchcode.metrics import (
+    TOOL_CALLS,
+    TOOL_ERRORS,
+    TOOL_LATENCY,
+    TOOL_RESPONSE_BYTES,
+    MetricsRegistry,
+)
+from mcp_hitchcode.server import TOOLS, create_sse_app
+
+
+def test_counter_rendering():
+    """Test the exposition format of counters."""
+    registry = MetricsRegistry()
+    counter = registry.counter("calls_total", "Calls", labels=("tool",))
+    counter.inc("a")
+    counter.inc("a", amount=2)
+    counter.inc('b"\n')
+
+    assert registry.render() == (
+        "# HELP calls_total Calls\n"
+        "# TYPE calls_total counter\n"
+        'calls_total{tool="a"} 3\n'
+        'calls_total{tool="b\\"\\n"} 1\n'
+    )
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test that histogram buckets count all values up to their bound."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    lines = registry.render().splitlines()
+    assert 'latency_bucket{le="0.1"} 2' in lines
+    assert 'latency_bucket{le="1"} 3' in lines
+    assert 'latency_bucket{le="+Inf"} 4' in lines
+    assert "latency_sum 3.65" in lines
+    assert "latency_count 4" in lines
+
+
+def test_duplicate_metric():
+    """Test that metric names are unique."""
+    registry = MetricsRegistry()
+    registry.counter("x", "X")
+    with pytest.raises(ValueError):
+        registry.histogram("x", "X")
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_recorded():
+    """Test that tool calls record their count, latency, size and errors."""
+    calls = TOOL_CALLS.value("mood")
+    errors = TOOL_ERRORS.value("mood")
+    size = TOOL_RESPONSE_BYTES.value("mood")
+    observed = TOOL_LATENCY.count("mood")
+
+    result = await TOOLS.call("mood", {"question": "How are you?"})
+    await TOOLS.call("mood", {})
+
+    assert TOOL_CALLS.value("mood") == calls + 2
+    assert TOOL_ERRORS.value("mood") == errors + 1
+    assert TOOL_LATENCY.count("mood") == observed + 2
+    assert TOOL_RESPONSE_BYTES.value("mood") >= size + len(
+        result[0].text.encode("utf-8")
+    )
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint():
+    """Test that /metrics serves tool and cache metrics."""
+    await TOOLS.call("mood", {"question": "How are you?"})
+
+    transport = httpx.ASGITransport(app=create_sse_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'mcp_tool_calls_total{tool="mood"}' in response.text
+    assert 'mcp_cache_hits_total{cache="template"}' in response.text
+    assert 'mcp_cache_misses_total{cache="docker_file"}' in response.text
@@ -0,0 +1,93 @@
+"""
+Test the Railway CLI docs extraction backends.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from mcp_hitchcode.railway_docs import (
+    RailwayCommandExtractor,
+    configure_parser_backend,
+    extract_railway_commands,
+    get_parser_backend,
+)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "railway_cli.html"
+
+BACKENDS = ["html.parser", "stream"]
+if importlib.util.find_spec("lxml") is not None:
+    BACKENDS.append("lxml")
+
+PAGES = [
+    # Command list following a heading, with nested lists and entities
+    "<h2>CLI Commands</h2><p>Intro</p><ul><li>railway up</li>"
+    "<li>railway <b>logs</b><ul><li>--tail &amp; follow</li></ul></li></ul>",
+    # The list must be a sibling of the heading
+    "<div><h3>Usage</h3></div><ul><li>not a command</li></ul>",
+    # A heading in between stops the search
+    "<h2>Commands</h2><h3>Other</h3><ol><li>railway init</li></ol>",
+    # Empty lists do not produce a section
+    "<h2>Commands</h2><ul><li> </li></ul>",
+    # Fallback to code blocks
+    "<pre>railway link</pre><code>npm install</code><p>text</p>",
+    # Code blocks that mention nothing relevant still produce the header
+    "<pre>ls -la</pre>",
+    # Hidden text is ignored
+    "<h2>Commands<script>var cli = 1;</script></h2><ul><li>railway run"
+    "<style>.x{}</style></li></ul>",
+    # Nothing to extract
+    "<p>Nothing here</p>",
+]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_match_on_fixture(backend):
+    """Test that every backend extracts the same commands from a docs page."""
+    page = FIXTURE.read_text()
+    expected = extract_railway_commands(page, backend="html.parser")
+
+    assert expected is not None
+    assert "- railway up" in expected
+    assert extract_railway_commands(page, backend=backend) == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("page", PAGES)
+def test_backends_match_on_edge_cases(backend, page):
+    """Test that every backend handles the edge cases like html.parser."""
+    expected = extract_railway_commands(page, backend="html.parser")
+    assert extract_railway_commands(page, backend=backend) == expected
+
+
+def test_extracted_sections():
+    """Test the output format of the extracted sections."""
+    result = extract_railway_commands(PAGES[0], backend="stream")
+    assert result == (
+        "\nCLI Commands:\n- railway up\n- railwaylogs--tail & follow\n- --tail & follow"
+    )
+    assert extract_railway_commands(PAGES[7], backend="stream") is None
+
+
+def test_stream_extractor_accepts_chunks():
+    """Test that the streaming extractor can be fed in arbitrary chunks."""
+    page = FIXTURE.read_text()
+    extractor = RailwayCommandExtractor()
+    for i in range(0, len(page), 97):
+        extractor.feed(page[i : i + 97])
+    extractor.close()
+
+    assert extractor.result() == extract_railway_commands(page, "html.parser")
+
+
+def test_configure_parser_backend():
+    """Test selecting the default backend."""
+    try:
+        configure_parser_backend("stream")
+        assert get_parser_backend() == "stream"
+    finally:
+        configure_parser_backend("html.parser")
+
+    with pytest.raises(ValueError):
+        configure_parser_backend("regex")
@@ -0,0 +1,148 @@
+"""
+Test the rendered prompt cache.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from mcp_hitchcode import server
+from mcp_hitchcode.render_cache import RenderCache, hash_template_arguments
+from mcp_hitchcode.templates import clear_compiled_template_cache, template_loader
+
+
+@pytest.fixture
+def render_cache():
+    """Enable the rendered prompt cache for one test."""
+    server.configure_render_cache(1024 * 1024)
+    yield server._render_cache
+    server.configure_render_cache(0)
+
+
+def test_argument_hash_is_order_independent():
+    """Test that the argument hash does not depend on keyword order."""
+    assert hash_template_arguments({"a": "1", "b": "2"}) == hash_template_arguments(
+        {"b": "2", "a": "1"}
+    )
+    assert hash_template_arguments({"a": "1"}) != hash_template_arguments({"a": "2"})
+
+
+def test_cache_evicts_to_byte_budget():
+    """Test that the least recently used prompts are evicted over budget."""
+    text = "x" * 100
+    cache = RenderCache(max_bytes=3 * len(text))
+
+    cache.put(("t", "1.0.0", "a"), text)
+    cache.put(("t", "1.0.0", "b"), text)
+    cache.get(("t", "1.0.0", "a"))
+    cache.put(("t", "1.0.0", "c"), text)
+
+    assert cache.get(("t", "1.0.0", "a")) == text
+    assert cache.get(("t", "1.0.0", "b")) is None
+    info = cache.info()
+    assert info["evictions"] == 1
+    assert info["bytes"] <= info["max_bytes"]
+
+
+def test_cache_entries_expire():
+    """Test that cached prompts expire after the TTL."""
+    cache = RenderCache(max_bytes=1024, ttl=0.01)
+    cache.put(("t", "1.0.0", "a"), "text")
+    time.sleep(0.02)
+
+    assert cache.get(("t", "1.0.0", "a")) is None
+    assert cache.info()["expirations"] == 1
+
+
+def test_cache_rejects_invalid_limits():
+    """Test that invalid cache limits are rejected."""
+    with pytest.raises(ValueError):
+        RenderCache(max_bytes=0)
+    with pytest.raises(ValueError):
+        RenderCache(max_bytes=1024, ttl=0)
+
+
+@pytest.mark.asyncio
+async def test_server_serves_repeated_prompts_from_cache(render_cache):
+    """Test that identical prompt renders are served from the cache."""
+    first = await server._render_prompt("proceed", "latest", task="Cached task")
+    second = await server._render_prompt("proceed", "latest", task="Cached task")
+    other = await server._render_prompt("proceed", "latest", task="Other task")
+
+    assert first == second
+    assert "Other task" in other
+    info = render_cache.info()
+    assert info["hits"] == 1
+    assert info["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fallback_versions_share_cache_entries(render_cache):
+    """Test that requests resolving to the same version share an entry."""
+    await server._render_prompt("test", "1.0.1", code_to_test="x")
+    await server._render_prompt("test", "1.0.5", code_to_test="x")
+
+    assert render_cache.info()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_template_invalidation_clears_rendered_prompts(render_cache):
+    """Test that invalidating a template drops its rendered prompts."""
+    await server._render_prompt("proceed", "latest", task="Task")
+    clear_compiled_template_cache("proceed")
+
+    assert render_cache.info()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cold_registry_is_built_off_the_event_loop(render_cache, monkeypatch):
+    """Test that the cache lookup does not scan the templates on the event loop."""
+    registries = ("_version_registry", "_sorted_versions", "_sorted_version_strs")
+    for name in registries:
+        monkeypatch.setattr(template_loader, name, {})
+    build = template_loader._build_version_registry
+    threads = []
+
+    def record_build():
+        if not template_loader._version_registry:
+            threads.append(threading.get_ident())
+        build()
+
+    monkeypatch.setattr(template_loader, "_build_version_registry", record_build)
+
+    await server._render_prompt("proceed", "latest", task="Task")
+
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_changed_template_file_clears_rendered_prompts(
+    render_cache, tmp_path, monkeypatch
+):
+    """Test that recompiling a changed template file drops its rendered prompts."""
+    greet = tmp_path / "prompts" / "greet"
+    greet.mkdir(parents=True)
+    path = greet / "greet_v1.0.0.md"
+    path.write_text("Hello {{ name }}")
+
+    monkeypatch.setattr(template_loader, "_get_templates_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(template_loader, "_use_template_bundle", False)
+    for name in ("_version_registry", "_sorted_versions", "_sorted_version_strs"):
+        monkeypatch.setattr(template_loader, name, {})
+    try:
+        assert await server._render_prompt("greet", "latest", name="Ada") == "Hello Ada"
+
+        path.write_text("Bye {{ name }}")
+        mtime = path.stat().st_mtime + 10
+        os.utime(path, (mtime, mtime))
+        assert await server._render_prompt("greet", "latest", name="Bob") == "Bye Bob"
+
+        assert await server._render_prompt("greet", "latest", name="Ada") == "Bye Ada"
+    finally:
+        clear_compiled_template_cache("greet")
+        template_loader._template_cache.pop("prompts/greet/greet_v1.0.0.md")
+        template_loader._metadata_cache.pop("prompts/greet/greet_v1.0.0.md")
+        template_loader._resolved_versions.invalidate(lambda key: key[0] == "greet")
@@ -0,0 +1,62 @@
+"""
+Test rendering prompt templates off the event loop.
+"""
+
+import time
+
+import anyio
+import pytest
+
+from mcp_hitchcode import server
+
+
+@pytest.fixture
+def render_executor():
+    """Restore the default render executor after a test."""
+    yield server.configure_render_executor
+    server.configure_render_executor("thread", 8)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["inline", "thread", "process"])
+async def test_executors_render_identical_prompts(render_executor, executor):
+    """Test that every executor renders the same prompt."""
+    render_executor(executor, 2)
+
+    result = await server.apply_prompt_proceed("Executor task", version="1.1.1")
+
+    assert "Executor task" in result[0].text
+    assert result[0].text == server.render_prompt_template(
+        "proceed", "1.1.1", task="Executor task", specific_instructions=""
+    )
+
+
+@pytest.mark.asyncio
+async def test_slow_render_does_not_block_event_loop(render_executor, monkeypatch):
+    """Test that a slow render leaves the event loop free for other work."""
+    render_executor("thread", 2)
+
+    def slow_render(*args, **kwargs):
+        time.sleep(0.3)
+        return "slow"
+
+    monkeypatch.setattr(server, "render_prompt_template", slow_render)
+    ticks = []
+
+    async def tick():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await anyio.sleep(0.01)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(server.apply_prompt_proceed, "Slow task")
+        tg.start_soon(tick)
+
+    assert len(ticks) == 5
+    assert ticks[-1] - ticks[0] < 0.25
+
+
+def test_unknown_executor():
+    """Test that an unknown executor is rejected."""
+    with pytest.raises(ValueError):
+        server.configure_render_executor("cluster")
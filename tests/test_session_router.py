@@ -0,0 +1,84 @@
+"""
+Test the routing of SSE messages between worker processes.
+"""
+
+from uuid import uuid4
+
+import anyio
+import httpx
+import pytest
+from starlette.applications import Starlette
+
+from mcp_hitchcode.session_router import SessionRouter
+
+MESSAGE = b'{"jsonrpc": "2.0", "method": "notifications/initialized"}'
+
+
+@pytest.fixture
+def routers(tmp_path):
+    """Two workers sharing a socket directory."""
+    return SessionRouter(str(tmp_path), "1"), SessionRouter(str(tmp_path), "2")
+
+
+def _open_session(router):
+    """Register a session with the transport of a worker, like connect_sse does."""
+    session_id = uuid4()
+    writer, reader = anyio.create_memory_object_stream(10)
+    router.transport._read_stream_writers[session_id] = writer
+    return session_id, reader
+
+
+async def _post(router, path, body=MESSAGE):
+    """Post a message to the app of a worker."""
+    app = Starlette(routes=router.routes())
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://w") as client:
+        return await client.post(path, content=body)
+
+
+def test_endpoint_contains_worker_id(routers):
+    """Test that each worker announces its own message endpoint."""
+    assert routers[0].endpoint == "/messages/1/"
+    assert routers[1].endpoint == "/messages/2/"
+
+
+@pytest.mark.asyncio
+async def test_message_for_own_session(routers):
+    """Test that a worker delivers messages of its own sessions directly."""
+    owner, _ = routers
+    session_id, reader = _open_session(owner)
+
+    response = await _post(owner, f"/messages/1/?session_id={session_id.hex}")
+
+    assert response.status_code == 202
+    assert reader.receive_nowait().root.method == "notifications/initialized"
+
+
+@pytest.mark.asyncio
+async def test_message_forwarded_to_owner(routers):
+    """Test that a message for another worker's session reaches the owner."""
+    owner, other = routers
+    session_id, reader = _open_session(owner)
+
+    async with anyio.create_task_group() as tg:
+        await tg.start(owner.serve)
+        response = await _post(other, f"/messages/1/?session_id={session_id.hex}")
+        unknown = await _post(other, "/messages/1/?session_id=" + "0" * 32)
+        tg.cancel_scope.cancel()
+
+    assert response.status_code == 202
+    assert response.text == "Accepted"
+    assert reader.receive_nowait().root.method == "notifications/initialized"
+    assert unknown.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_message_for_missing_worker(routers):
+    """Test that messages for workers that are gone are rejected."""
+    _, other = routers
+
+    response = await _post(other, "/messages/3/?session_id=" + "0" * 32)
+    assert response.status_code == 404
+
+    response = await _post(other, "/messages/..%2F3/?session_id=" + "0" * 32)
+    assert response.status_code == 404
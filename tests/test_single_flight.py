@@ -0,0 +1,156 @@
+"""
+Test the deduplication of concurrent identical calls and fetches.
+"""
+
+import anyio
+import httpx
+import pytest
+
+from mcp_hitchcode.docs_cache import configure_docs_cache
+from mcp_hitchcode.server import (
+    fetch_many,
+    fetch_railway_docs_optimized,
+    fetch_website,
+)
+from mcp_hitchcode.single_flight import SingleFlight
+
+PAGE = """<html><body>
+<h2>Login</h2><pre><code>railway login</code></pre>
+</body></html>"""
+
+
+async def _gather(count, func, *args):
+    """Run count concurrent calls of func and return their results."""
+    results = [None] * count
+
+    async def run(index):
+        results[index] = await func(*args)
+
+    async with anyio.create_task_group() as tg:
+        for index in range(count):
+            tg.start_soon(run, index)
+    return results
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_run():
+    """Test that concurrent calls with the same key run once."""
+    flights = SingleFlight()
+    runs = []
+
+    async def work(value):
+        runs.append(value)
+        await anyio.sleep(0.05)
+        return value * 2
+
+    results = await _gather(5, flights.do, "key", work, 21)
+
+    assert results == [42] * 5
+    assert runs == [21]
+    assert flights.info() == {"hits": 4, "misses": 1, "size": 0}
+
+    assert await flights.do("key", work, 1) == 2
+    assert runs == [21, 1]
+
+
+@pytest.mark.asyncio
+async def test_error_is_shared():
+    """Test that the waiters receive the exception of the call."""
+    flights = SingleFlight()
+    errors = []
+
+    async def fail():
+        await anyio.sleep(0.05)
+        raise ValueError("broken")
+
+    async def call():
+        try:
+            await flights.do("key", fail)
+        except ValueError as e:
+            errors.append(str(e))
+
+    await _gather(3, call)
+
+    assert errors == ["broken"] * 3
+    assert flights.info()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_hands_over():
+    """Test that a waiter runs the call again if the first caller is cancelled."""
+    flights = SingleFlight()
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await anyio.sleep(0.1)
+        return "done"
+
+    results = []
+
+    async def wait():
+        results.append(await flights.do("key", work))
+
+    async with anyio.create_task_group() as tg:
+        with anyio.move_on_after(0.02):
+            tg.start_soon(wait)
+            await flights.do("key", work)
+    assert results == ["done"]
+    assert len(runs) == 2
+
+
+@pytest.fixture
+def site(serve_http):
+    """Serve slow pages via serve_http, counting the requests."""
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        await anyio.sleep(0.1)
+        return httpx.Response(200, text=PAGE, headers={"content-type": "text/html"})
+
+    serve_http(handler)
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_identical_fetches_download_once(site):
+    """Test that a burst of identical mcp_fetch calls costs one request."""
+    url = "https://example.com/page"
+    results = await _gather(8, fetch_website, url)
+
+    assert all(result[0].text == PAGE for result in results)
+    assert site == [url]
+
+    await _gather(2, fetch_website, url, None, None, "text")
+    assert len(site) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_shares_duplicate_urls(site):
+    """Test that duplicate URLs in mcp_fetch_many are fetched once."""
+    result = await fetch_many(["https://example.com/a"] * 3 + ["https://example.com/b"])
+
+    assert all("Status: 200" in part.text for part in result)
+    assert sorted(site) == ["https://example.com/a", "https://example.com/b"]
+
+
+@pytest.mark.asyncio
+async def test_railway_docs_fetch_and_parse_once(site, monkeypatch):
+    """Test that concurrent Railway docs calls share the fetch and the parse."""
+    from mcp_hitchcode import server
+
+    parses = []
+
+    def extract(text):
+        parses.append(text)
+        return "railway login"
+
+    monkeypatch.setattr(server, "extract_railway_commands", extract)
+    configure_docs_cache(ttl=0)
+
+    results = await _gather(6, fetch_railway_docs_optimized)
+
+    assert all(result[0].text == "railway login" for result in results)
+    assert len(site) == 1
+    assert len(parses) == 1
@@ -0,0 +1,89 @@
+"""
+Test the import time of the server modules.
+"""
+
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+import pytest
+
+# Modules that are only imported on first use of the features that need them
+LAZY_MODULES = ("jinja2", "yaml", "bs4", "lxml", "mcp_hitchcode.session_router")
+
+# Budget in microseconds for the self time of the mcp_hitchcode modules
+OWN_IMPORT_BUDGET_US = 250_000
+
+
+def _import_times(statement: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Run a statement in a new interpreter under python -X importtime.
+
+    Args:
+        statement: The Python statement to run.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: The self and cumulative import time in
+        microseconds, by module name.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def test_server_import_is_lazy():
+    """Test that importing the server does not import the lazy modules."""
+    times = _import_times("import mcp_hitchcode.server")
+
+    assert "mcp_hitchcode.server" in times
+    assert [module for module in LAZY_MODULES if module in times] == []
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "mcp_hitchcode.templates.docker_file_loader",
+        "mcp_hitchcode.templates.template_watcher",
+        "mcp_hitchcode.templates",
+    ],
+)
+def test_templates_package_import_is_lazy(module):
+    """Test that the templates package only imports the modules that are used."""
+    times = _import_times(f"import {module}")
+
+    assert "mcp_hitchcode.templates.template_loader" not in times
+    assert "jinja2" not in times
+
+
+def test_template_loader_imports_jinja2_on_first_render():
+    """Test that Jinja2 is imported when a template is first rendered."""
+    times = _import_times(
+        "import sys; import mcp_hitchcode.templates.template_loader as t; "
+        "assert 'jinja2' not in sys.modules; "
+        "t.render_prompt_template('change', objective='x'); "
+        "assert 'jinja2' in sys.modules"
+    )
+
+    assert "jinja2" in times
+
+
+def test_server_import_time():
+    """Test that the server modules themselves stay within the import budget."""
+    times = _import_times("import mcp_hitchcode.server")
+
+    own_us = sum(
+        self_us
+        for name, (self_us, _) in times.items()
+        if name.split(".")[0] == "mcp_hitchcode"
+    )
+    assert own_us < OWN_IMPORT_BUDGET_US
@@ -0,0 +1,173 @@
+"""
+Test the precompiled template bundle.
+"""
+
+import os
+import pickle
+
+import pytest
+
+from mcp_hitchcode.templates import template_bundle, template_loader
+
+# Registries of the template loader that a bundle fills
+_REGISTRIES = (
+    "_version_registry",
+    "_sorted_versions",
+    "_sorted_version_strs",
+    "_bundled_code",
+)
+
+# Bounded caches of the template loader that a bundle fills
+_CACHES = ("_template_cache", "_metadata_cache", "_resolved_versions")
+
+
+@pytest.fixture
+def templates_dir(tmp_path, monkeypatch):
+    """Point the template loader at a temporary templates directory."""
+    greet = tmp_path / "prompts" / "greet"
+    greet.mkdir(parents=True)
+    (greet / "greet_v1.0.0.md").write_text(
+        "---\ndescription: Greeting\n---\nHello {{ name }}"
+    )
+    (greet / "greet_v1.1.0.md").write_text("Hi {{ name }}")
+
+    monkeypatch.setattr(template_loader, "_get_templates_dir", lambda: str(tmp_path))
+    saved = {name: dict(getattr(template_loader, name)) for name in _REGISTRIES}
+    _reset()
+
+    yield tmp_path
+
+    _reset()
+    for name, content in saved.items():
+        getattr(template_loader, name).update(content)
+    template_loader.configure_template_bundle(True)
+
+
+def _reset():
+    """Drop everything the template loader has loaded, as on a cold start."""
+    for name in (*_REGISTRIES, *_CACHES):
+        getattr(template_loader, name).clear()
+    template_loader.clear_compiled_template_cache()
+
+
+def test_bundle_round_trip(templates_dir):
+    """Test that a written bundle is read back with compiled code."""
+    path = template_bundle.write_bundle()
+    assert path == str(templates_dir / template_bundle.BUNDLE_FILENAME)
+
+    bundle = template_bundle.read_bundle(path)
+    assert bundle["registry"] == {
+        "greet": {
+            "1.1.0": "greet_v1.1.0.md",
+            "1.0.0": "greet_v1.0.0.md",
+            "latest": "1.1.0",
+        }
+    }
+    entry = bundle["files"]["prompts/greet/greet_v1.0.0.md"]
+    assert entry["metadata"] == {"description": "Greeting"}
+    assert entry["sha256"] == template_bundle.file_digest(
+        str(templates_dir / "prompts" / "greet" / "greet_v1.0.0.md")
+    )
+    assert entry["code"].co_filename == "<template>"
+
+
+def test_registry_is_loaded_from_bundle(templates_dir, monkeypatch):
+    """Test that a cold start uses the bundle instead of scanning and compiling."""
+    template_bundle.write_bundle()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("templates should come from the bundle")
+
+    monkeypatch.setattr(template_loader, "_scan_template_versions", fail)
+    monkeypatch.setattr(template_loader, "_parse_template_metadata", fail)
+    monkeypatch.setattr(template_loader, "load_template", fail)
+    monkeypatch.setattr(template_bundle, "file_digest", fail)
+
+    assert template_loader.get_latest_version("greet") == "1.1.0"
+    assert template_loader.render_prompt_template("greet", "1.0.0", name="A") == (
+        "Hello A"
+    )
+    assert template_loader.get_template_metadata("prompts/greet/greet_v1.0.0.md") == {
+        "description": "Greeting"
+    }
+
+
+def test_changed_file_is_compiled_from_disk(templates_dir):
+    """Test that a template edited after the bundle was built is not served stale."""
+    template_bundle.write_bundle()
+    (templates_dir / "prompts" / "greet" / "greet_v1.1.0.md").write_text(
+        "Good day {{ name }}"
+    )
+    _reset()
+
+    assert template_loader.render_prompt_template("greet", name="A") == "Good day A"
+
+
+def test_same_size_change_is_compiled_from_disk(templates_dir):
+    """Test that an edit that keeps the file size is detected by its hash."""
+    template_bundle.write_bundle()
+    (templates_dir / "prompts" / "greet" / "greet_v1.1.0.md").write_text(
+        "Yo {{ name }}"
+    )
+    _reset()
+
+    assert template_loader.render_prompt_template("greet", name="A") == "Yo A"
+    assert "prompts/greet/greet_v1.1.0.md" not in template_loader._bundled_code
+    assert "prompts/greet/greet_v1.0.0.md" in template_loader._bundled_code
+
+
+def test_touched_file_is_verified_by_hash(templates_dir):
+    """Test that a file with a new mtime but the same content uses the bundle."""
+    template_bundle.write_bundle()
+    path = templates_dir / "prompts" / "greet" / "greet_v1.1.0.md"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    _reset()
+
+    assert template_loader.render_prompt_template("greet", name="A") == "Hi A"
+    assert "prompts/greet/greet_v1.1.0.md" in template_loader._bundled_code
+
+
+def test_version_added_after_build_is_found(templates_dir):
+    """Test that a bundle missing a version file on disk is not used."""
+    template_bundle.write_bundle()
+    (templates_dir / "prompts" / "greet" / "greet_v1.2.0.md").write_text(
+        "Hey {{ name }}"
+    )
+    _reset()
+
+    assert template_loader.get_latest_version("greet") == "1.2.0"
+    assert template_loader.render_prompt_template("greet", name="A") == "Hey A"
+    assert not template_loader._bundled_code
+
+
+def test_missing_or_incompatible_bundle_falls_back(templates_dir):
+    """Test that the directory is scanned without a usable bundle."""
+    assert template_bundle.read_bundle() is None
+    assert template_loader.get_latest_version("greet") == "1.1.0"
+
+    path = template_bundle.write_bundle()
+    with open(path, "rb") as f:
+        bundle = pickle.load(f)
+    bundle["magic"] = b"\x00\x00\r\n"
+    with open(path, "wb") as f:
+        pickle.dump(bundle, f)
+    assert template_bundle.read_bundle(path) is None
+
+    with open(path, "wb") as f:
+        f.write(b"not a bundle")
+    assert template_bundle.read_bundle(path) is None
+
+    _reset()
+    assert template_loader.render_prompt_template("greet", name="A") == "Hi A"
+    assert not template_loader._bundled_code
+
+
+def test_bundle_can_be_disabled(templates_dir):
+    """Test that configure_template_bundle(False) ignores an existing bundle."""
+    template_bundle.write_bundle()
+    template_loader.configure_template_bundle(False)
+
+    assert template_loader.get_latest_version("greet") == "1.1.0"
+    assert not template_loader._bundled_code
+    assert os.path.exists(template_bundle.get_bundle_path())
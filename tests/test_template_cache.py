@@ -0,0 +1,72 @@
+"""
+Test the compiled template cache of the template loader.
+"""
+
+import pytest
+
+from mcp_hitchcode.templates import (
+    clear_compiled_template_cache,
+    get_compiled_template_cache_info,
+    render_prompt_template,
+    set_compiled_template_cache_maxsize,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_compiled_template_cache():
+    """Start every test with an empty compiled template cache."""
+    clear_compiled_template_cache()
+    yield
+    set_compiled_template_cache_maxsize(128)
+    clear_compiled_template_cache()
+
+
+def test_repeated_render_hits_cache():
+    """Test that rendering the same template twice compiles it only once."""
+    first = render_prompt_template("proceed", task="Cache task")
+    second = render_prompt_template("proceed", task="Cache task")
+
+    assert first == second
+    info = get_compiled_template_cache_info()
+    assert info["misses"] == 1
+    assert info["hits"] == 1
+    assert info["size"] == 1
+
+
+def test_cached_template_renders_new_arguments():
+    """Test that a cached template is rendered with the current arguments."""
+    render_prompt_template("proceed", task="First task")
+    rendered = render_prompt_template("proceed", task="Second task")
+
+    assert "Second task" in rendered
+    assert "First task" not in rendered
+
+
+def test_cache_is_bounded():
+    """Test that the least recently used template is evicted."""
+    set_compiled_template_cache_maxsize(1)
+
+    render_prompt_template("proceed", task="Task")
+    render_prompt_template("change", change_request="Change")
+
+    info = get_compiled_template_cache_info()
+    assert info["size"] == 1
+    assert info["evictions"] == 1
+
+
+def test_invalidate_single_template():
+    """Test that invalidation only drops the requested template."""
+    render_prompt_template("proceed", task="Task")
+    render_prompt_template("change", change_request="Change")
+
+    assert clear_compiled_template_cache("proceed") == 1
+    assert get_compiled_template_cache_info()["size"] == 1
+
+    render_prompt_template("proceed", task="Task")
+    assert get_compiled_template_cache_info()["misses"] == 3
+
+
+def test_invalid_cache_size():
+    """Test that a cache size below one is rejected."""
+    with pytest.raises(ValueError):
+        set_compiled_template_cache_maxsize(0)
@@ -0,0 +1,136 @@
+"""
+Test loading and compiling templates from several threads at once.
+"""
+
+import threading
+import time
+
+import pytest
+
+from mcp_hitchcode.single_flight import ThreadSingleFlight
+from mcp_hitchcode.templates import template_loader
+
+# Registries of the template loader that a build fills
+_REGISTRIES = ("_version_registry", "_sorted_versions", "_sorted_version_strs")
+
+# Bounded caches of the template loader that a build or compile fills
+_CACHES = ("_template_cache", "_metadata_cache", "_resolved_versions")
+
+
+@pytest.fixture
+def templates_dir(tmp_path, monkeypatch):
+    """Point the template loader at a temporary templates directory."""
+    greet = tmp_path / "prompts" / "greet"
+    greet.mkdir(parents=True)
+    (greet / "greet_v1.0.0.md").write_text(
+        "---\ndescription: Hi\n---\nHello {{ name }}"
+    )
+    (greet / "greet_v1.1.0.md").write_text("Hi {{ name }}")
+
+    monkeypatch.setattr(template_loader, "_get_templates_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(template_loader, "_use_template_bundle", False)
+    saved = {name: dict(getattr(template_loader, name)) for name in _REGISTRIES}
+    for name in (*_REGISTRIES, *_CACHES):
+        getattr(template_loader, name).clear()
+    template_loader.clear_compiled_template_cache()
+
+    yield tmp_path
+
+    for name in _CACHES:
+        getattr(template_loader, name).clear()
+    for name, content in saved.items():
+        registry = getattr(template_loader, name)
+        registry.clear()
+        registry.update(content)
+    template_loader.clear_compiled_template_cache()
+
+
+def _run_threads(count, func):
+    """Start count threads at once running func and return their results."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def run(index):
+        barrier.wait()
+        try:
+            results[index] = func()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def _slow(monkeypatch, name, calls):
+    """Make a template loader function slow and count its calls."""
+    original = getattr(template_loader, name)
+
+    def slow(*args, **kwargs):
+        calls.append(name)
+        time.sleep(0.05)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(template_loader, name, slow)
+
+
+def test_registry_is_built_once(templates_dir, monkeypatch):
+    """Test that concurrent lookups on a cold registry scan once and see it whole."""
+    calls = []
+    _slow(monkeypatch, "_scan_template_versions", calls)
+
+    results = _run_threads(
+        8, lambda: template_loader.resolve_template_version("greet", "1.0.5")
+    )
+
+    assert results == ["1.0.0"] * 8
+    assert calls == ["_scan_template_versions"]
+
+
+def test_cold_template_is_compiled_once(templates_dir, monkeypatch):
+    """Test that concurrent first renders of a template share one compilation."""
+    template_loader._build_version_registry()
+    calls = []
+    _slow(monkeypatch, "_parse_template_metadata", calls)
+
+    results = _run_threads(
+        8,
+        lambda: template_loader.render_prompt_template("greet", "1.0.0", name="Ada"),
+    )
+
+    assert results == ["Hello Ada"] * 8
+    assert calls == ["_parse_template_metadata"]
+    assert template_loader.get_compiled_template_cache_info()["size"] == 1
+
+
+def test_thread_single_flight_shares_errors():
+    """Test that threads waiting for a failing call receive its exception."""
+    flights = ThreadSingleFlight()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        time.sleep(0.05)
+        raise ValueError("broken")
+
+    results = _run_threads(4, lambda: flights.do("key", fail))
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(calls) == 1
+    assert flights.info() == {"hits": 3, "misses": 1, "size": 0}
+
+
+def test_lookups_tolerate_a_removal_in_progress(templates_dir):
+    """Test that lookups do not fail while the watcher removes a template."""
+    template_loader._build_version_registry()
+    # The state between the two steps of a removal: the index is gone, the
+    # registry entry not yet
+    template_loader._sorted_versions.pop("greet")
+    template_loader._sorted_version_strs.pop("greet")
+
+    assert template_loader.get_template_versions("greet") == []
+    with pytest.raises(ValueError):
+        template_loader.resolve_template_version("greet", "1.0.5")
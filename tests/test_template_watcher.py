@@ -0,0 +1,127 @@
+"""
+Test hot reloading of prompt templates.
+"""
+
+import os
+
+import pytest
+
+from mcp_hitchcode.templates import template_loader
+from mcp_hitchcode.templates.template_watcher import TemplateWatcher
+
+
+@pytest.fixture
+def prompts_dir(tmp_path, monkeypatch):
+    """Point the template loader at a temporary templates directory."""
+    prompts = tmp_path / "prompts"
+    (prompts / "greet").mkdir(parents=True)
+    (prompts / "greet" / "greet_v1.0.0.md").write_text("Hello {{ name }}")
+
+    monkeypatch.setattr(template_loader, "_get_templates_dir", lambda: str(tmp_path))
+    saved = {
+        name: dict(getattr(template_loader, name))
+        for name in ("_version_registry", "_sorted_versions", "_sorted_version_strs")
+    }
+    caches = ("_template_cache", "_metadata_cache", "_resolved_versions")
+    for name in (*saved, *caches):
+        getattr(template_loader, name).clear()
+    template_loader.clear_compiled_template_cache()
+
+    yield prompts
+
+    for name, content in saved.items():
+        registry = getattr(template_loader, name)
+        registry.clear()
+        registry.update(content)
+    for name in caches:
+        getattr(template_loader, name).clear()
+    template_loader.clear_compiled_template_cache()
+
+
+def _touch(path, content):
+    """Write a file and make sure its mtime differs from the previous one."""
+    mtime = os.path.getmtime(path) if path.exists() else 0
+    path.write_text(content)
+    os.utime(path, (mtime + 10, mtime + 10))
+
+
+def test_new_version_is_picked_up(prompts_dir):
+    """Test that a new template version becomes the latest version."""
+    watcher = TemplateWatcher(backend="poll")
+    assert template_loader.render_prompt_template("greet", name="A") == "Hello A"
+
+    (prompts_dir / "greet" / "greet_v1.1.0.md").write_text("Hi {{ name }}")
+    assert watcher.check() == [("greet", "greet_v1.1.0.md")]
+
+    assert template_loader.get_latest_version("greet") == "1.1.0"
+    assert template_loader.render_prompt_template("greet", name="A") == "Hi A"
+    assert template_loader.render_prompt_template("greet", "1.0.9", name="A") == (
+        "Hello A"
+    )
+
+
+def test_modified_template_is_reloaded(prompts_dir):
+    """Test that editing a template file invalidates its cached content."""
+    watcher = TemplateWatcher(backend="poll")
+    assert template_loader.render_prompt_template("greet", name="A") == "Hello A"
+
+    _touch(prompts_dir / "greet" / "greet_v1.0.0.md", "Howdy {{ name }}")
+    watcher.check()
+
+    assert template_loader.render_prompt_template("greet", name="A") == "Howdy A"
+
+
+def test_deleted_version_is_removed(prompts_dir):
+    """Test that deleting the latest version falls back to the previous one."""
+    (prompts_dir / "greet" / "greet_v2.0.0.md").write_text("Hey {{ name }}")
+    watcher = TemplateWatcher(backend="poll")
+    assert template_loader.get_latest_version("greet") == "2.0.0"
+
+    (prompts_dir / "greet" / "greet_v2.0.0.md").unlink()
+    watcher.check()
+
+    assert template_loader.get_template_versions("greet") == ["1.0.0"]
+    assert template_loader.render_prompt_template("greet", name="A") == "Hello A"
+
+
+def test_new_template_directory(prompts_dir):
+    """Test that a new template directory is added to the registry."""
+    watcher = TemplateWatcher(backend="poll")
+    template_loader.get_latest_version("greet")
+
+    (prompts_dir / "bye").mkdir()
+    (prompts_dir / "bye" / "bye_v1.0.0.md").write_text("Bye {{ name }}")
+    watcher.check()
+
+    assert template_loader.render_prompt_template("bye", name="A") == "Bye A"
+
+
+def test_unchanged_directory_reports_nothing(prompts_dir):
+    """Test that a check without changes does not touch the caches."""
+    watcher = TemplateWatcher(backend="poll")
+    assert watcher.check() == []
+
+
+def test_unknown_backend():
+    """Test that an unknown backend is rejected."""
+    with pytest.raises(ValueError):
+        TemplateWatcher(backend="carrier-pigeon")
+
+
+def test_failed_refresh_keeps_watching(prompts_dir, monkeypatch, caplog):
+    """Test that a file that fails to refresh does not stop the other refreshes."""
+    watcher = TemplateWatcher(backend="poll")
+    refresh = template_loader.refresh_template_file
+
+    def fail_on_broken(template_name, filename):
+        if filename == "greet_v1.0.0.md":
+            raise ValueError("half written")
+        refresh(template_name, filename)
+
+    monkeypatch.setattr(template_loader, "refresh_template_file", fail_on_broken)
+    _touch(prompts_dir / "greet" / "greet_v1.0.0.md", "Howdy {{ name }}")
+    (prompts_dir / "greet" / "greet_v1.1.0.md").write_text("Hi {{ name }}")
+
+    assert len(watcher.check()) == 2
+    assert "greet/greet_v1.0.0.md" in caplog.text
+    assert template_loader.get_latest_version("greet") == "1.1.0"
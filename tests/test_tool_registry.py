@@ -0,0 +1,89 @@
+"""
+Test the table-driven tool registry and dispatch.
+"""
+
+import mcp.types as types
+import pytest
+
+from mcp_hitchcode.server import TOOLS
+from mcp_hitchcode.tool_registry import ToolRegistry
+
+
+async def _echo(text: str, suffix: str = "!"):
+    """Return the arguments as text."""
+    return [types.TextContent(type="text", text=text + suffix)]
+
+
+@pytest.fixture
+def registry():
+    """A registry with a single echo tool."""
+    tools = ToolRegistry()
+    tools.register(
+        "echo",
+        _echo,
+        "Echo the text",
+        {"text": {"type": "string"}, "suffix": {"type": "string"}},
+        required=["text"],
+    )
+    return tools
+
+
+@pytest.mark.asyncio
+async def test_dispatch(registry):
+    """Test that calls are dispatched with defaults and unknown arguments."""
+    result = await registry.call("echo", {"text": "hi", "ignored": 1})
+    assert result[0].text == "hi!"
+
+    result = await registry.call("echo", {"text": "hi", "suffix": "?"})
+    assert result[0].text == "hi?"
+
+
+@pytest.mark.asyncio
+async def test_dispatch_errors(registry):
+    """Test the errors for missing arguments and unknown tools."""
+    result = await registry.call("echo", {})
+    assert result[0].text == "Error: Missing required argument 'text'"
+
+    result = await registry.call("nope", {"text": "hi"})
+    assert result[0].text == "Error: Unknown tool: nope"
+
+
+def test_tool_list_is_prebuilt(registry):
+    """Test that the tool list is reused until a tool is registered."""
+    tools = registry.list_tools()
+    assert registry.list_tools() is tools
+    assert tools[0].inputSchema == {
+        "type": "object",
+        "required": ["text"],
+        "properties": {"text": {"type": "string"}, "suffix": {"type": "string"}},
+    }
+
+    registry.register("other", _echo, "Other", {"text": {"type": "string"}})
+    assert [tool.name for tool in registry.list_tools()] == ["echo", "other"]
+    assert "required" not in registry.list_tools()[1].inputSchema
+
+
+def test_invalid_registrations(registry):
+    """Test that duplicate tools and unknown required arguments are rejected."""
+    with pytest.raises(ValueError):
+        registry.register("echo", _echo, "Echo", {"text": {"type": "string"}})
+    with pytest.raises(ValueError):
+        registry.register("bad", _echo, "Bad", {}, required=["text"])
+
+
+def test_server_tools():
+    """Test that the server registers every tool with its required arguments."""
+    assert len(TOOLS) == 13
+    assert TOOLS.get("mcp_fetch_many").required == ("urls",)
+    assert TOOLS.get("apply_prompt_docker").required == ("containerization_objective",)
+    assert TOOLS.get("fetch_railway_docs").required == ()
+
+
+@pytest.mark.asyncio
+async def test_server_dispatch():
+    """Test a server tool call through the registry."""
+    result = await TOOLS.call("mood", {"question": "How are you?"})
+    assert "❤️" in result[0].text
+
+    result = await TOOLS.call("apply_prompt_fix", {})
+    assert result[0].text == "Error: Missing required argument 'issue'"
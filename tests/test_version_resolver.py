@@ -0,0 +1,54 @@
+"""
+Test the version resolution of prompt templates.
+"""
+
+import pytest
+
+from mcp_hitchcode.templates import (
+    get_latest_version,
+    get_template_versions,
+    resolve_template_version,
+)
+
+
+def test_versions_sorted_newest_first():
+    """Test that template versions are listed from newest to oldest."""
+    assert get_template_versions("test") == ["1.1.1", "1.1.0", "1.0.1", "1.0.0"]
+
+
+def test_resolve_latest():
+    """Test that "latest" resolves to the newest version."""
+    assert resolve_template_version("test") == get_latest_version("test")
+
+
+def test_resolve_exact_version():
+    """Test that an available version resolves to itself."""
+    assert resolve_template_version("test", "1.1.0") == "1.1.0"
+
+
+@pytest.mark.parametrize(
+    "requested, expected",
+    [
+        ("1.0.5", "1.0.1"),
+        ("1.1", "1.1.0"),
+        ("2.0.0", "1.1.1"),
+        ("0.9.0", "1.0.0"),
+    ],
+)
+def test_resolve_fallback_version(requested, expected):
+    """Test that a missing version resolves to the highest version below it."""
+    assert resolve_template_version("test", requested) == expected
+    # The second lookup is served from the memo and must agree
+    assert resolve_template_version("test", requested) == expected
+
+
+def test_resolve_unknown_template():
+    """Test that resolving an unknown template raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        resolve_template_version("does_not_exist", "1.0.0")
+
+
+def test_resolve_invalid_version():
+    """Test that an unparseable version is rejected."""
+    with pytest.raises(ValueError):
+        resolve_template_version("test", "not-a-version")
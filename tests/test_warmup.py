@@ -0,0 +1,62 @@
+"""
+Test the template warmup and the readiness endpoint.
+"""
+
+import httpx
+import pytest
+
+from mcp_hitchcode import server
+from mcp_hitchcode.metrics import REGISTRY
+from mcp_hitchcode.templates.template_loader import (
+    _metadata_cache,
+    _version_registry,
+    clear_compiled_template_cache,
+    get_compiled_template_cache_info,
+)
+
+
+def test_run_warmup():
+    """Test that the warmup compiles and parses every latest template."""
+    clear_compiled_template_cache()
+    _metadata_cache.clear()
+
+    seconds = server.run_warmup()
+
+    assert seconds > 0
+    assert server._warmup_seconds == seconds
+    assert server._warmup_templates == len(_version_registry)
+    assert get_compiled_template_cache_info()["size"] == len(_version_registry)
+    assert len(_metadata_cache) >= len(_version_registry)
+    assert "mcp_warmup_seconds " in REGISTRY.render()
+
+
+@pytest.mark.asyncio
+async def test_ready_after_startup(capsys):
+    """Test that /ready answers 200 only while the app is started."""
+    app = server.create_sse_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        assert (await client.get("/ready")).status_code == 503
+
+        async with app.router.lifespan_context(app):
+            response = await client.get("/ready")
+            assert response.status_code == 200
+            assert response.json()["status"] == "ready"
+            assert response.json()["templates"] == len(_version_registry)
+            assert response.json()["warmup_seconds"] > 0
+
+        assert (await client.get("/ready")).status_code == 503
+
+    assert "Warmed" in capsys.readouterr().err
+
+
+@pytest.mark.asyncio
+async def test_startup_without_warmup(capsys):
+    """Test that the app is ready without warming up when warmup is disabled."""
+    app = server.create_sse_app(warmup_templates=False)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        async with app.router.lifespan_context(app):
+            assert (await client.get("/ready")).status_code == 200
+
+    assert "Warmed" not in capsys.readouterr().err